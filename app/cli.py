@@ -0,0 +1,524 @@
+"""
+부가세 도우미 명령줄 도구
+
+GUI(PySide6) 없이 서비스와 Repository를 그대로 사용하여 가져오기, 내보내기,
+유지보수 작업을 실행합니다. 예약 작업이나 서버에서 사용할 수 있습니다.
+
+사용 예:
+    python -m app.cli import data/statements --card-company SHC
+    python -m app.cli import new_layout.xlsx --card-company SHC --confirm-mapping --map approval_number=승인번호
+    python -m app.cli diff data/statements/2025-01.xlsx --card-company SHC
+    python -m app.cli export transactions.csv --from 2025-01-01 --to 2025-06-30
+    python -m app.cli dedupe --dry-run
+    python -m app.cli pair
+    python -m app.cli duplicates --from 2025-01-01 --to 2025-06-30
+    python -m app.cli summary --from 2025-01-01 --to 2025-06-30
+    python -m app.cli summary --period "2025 1기 예정"
+    python -m app.cli report --year 2025 --by month
+    python -m app.cli report --period "2025 1기 확정" --by vendor
+    python -m app.cli exclude --period "2025 1기 확정"
+    python -m app.cli exclude --dirty
+    python -m app.cli filing card_receipt.txt --period "2025 1기 확정"
+    python -m app.cli reindex
+    python -m app.cli backup
+    python -m app.cli bench
+
+각 명령은 필요한 서비스만 실행 시점에 불러오므로 시작 시간이 짧습니다.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+def _resolve_card_company_id(database_path: Optional[str], value: Optional[str]) -> Optional[int]:
+    """
+    카드사 코드 또는 ID를 카드사 ID로 변환
+    
+    Args:
+        database_path: 데이터베이스 파일 경로
+        value: 카드사 코드 또는 ID
+    
+    Returns:
+        카드사 ID 또는 None (값이 없는 경우)
+    
+    Raises:
+        ValueError: 카드사를 찾을 수 없는 경우
+    """
+    if not value:
+        return None
+    
+    from app.services.card_company_service import CardCompanyService
+    
+    for company in CardCompanyService(database_path).get_all_card_companies():
+        if company['card_company_code'] == value or str(company['id']) == value:
+            return company['id']
+    raise ValueError(f"카드사를 찾을 수 없습니다: {value}")
+
+
+# 보고서 출력에서 집계 기준이 아닌 컬럼
+_REPORT_AMOUNT_COLUMNS = (
+    'transaction_count', 'cancel_count', 'gross_amount_won', 'supply_amount_won', 'vat_amount_won',
+    'excluded_count', 'excluded_supply_amount_won', 'excluded_vat_amount_won'
+)
+
+
+def _parse_vat_period(value: Optional[str]):
+    """
+    부가세 신고기간 문자열 변환
+    
+    Args:
+        value: 신고기간 (예: '2025-1', '2025 1기 예정', '2025-2기 확정')
+    
+    Returns:
+        VatPeriod 또는 None (값이 없는 경우)
+    
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    if not value:
+        return None
+    
+    from app.utils.vat_period import VatPeriod
+    
+    return VatPeriod.parse(value)
+
+
+def _parse_column_overrides(values: Optional[List[str]]) -> Optional[Dict[str, str]]:
+    """
+    --map 인자(내부컬럼명=엑셀컬럼명)를 컬럼 매핑으로 변환
+    
+    Args:
+        values: '내부컬럼명=엑셀컬럼명' 문자열 리스트
+    
+    Returns:
+        컬럼 매핑 {내부컬럼명: 엑셀컬럼명} 또는 None (값이 없는 경우)
+    
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    if not values:
+        return None
+    
+    overrides = {}
+    for value in values:
+        field, separator, column = value.partition('=')
+        if not separator or not field.strip() or not column.strip():
+            raise ValueError(f"--map은 '내부컬럼명=엑셀컬럼명' 형식이어야 합니다: {value}")
+        overrides[field.strip()] = column.strip()
+    return overrides
+
+
+def cmd_import(args: argparse.Namespace) -> int:
+    """엑셀 파일/폴더 일괄 가져오기"""
+    from app.services.batch_import_service import BatchImportService, BATCH_FILE_FAILED
+    
+    card_company_id = _resolve_card_company_id(args.database, args.card_company)
+    service = BatchImportService(args.database, max_workers=args.workers)
+    results = service.import_files(
+        args.paths,
+        card_company_id=card_company_id,
+        force=args.force,
+        confirm_mapping=args.confirm_mapping,
+        column_overrides=_parse_column_overrides(args.map)
+    )
+    
+    failed = 0
+    for result in results:
+        batch = result['batch']
+        if batch:
+            detail = (
+                f"{batch['inserted_rows']:,}건 등록, 중복 {result['duplicate_rows']:,}건 제외, "
+                f"신규 거래처 {batch['registered_vendors']:,}건, 취소 연결 {batch['paired_cancellations']:,}건"
+            )
+        else:
+            detail = result['message']
+        print(f"[{result['status']}] {result['file']}: {detail}")
+        failed += result['status'] == BATCH_FILE_FAILED
+    if failed and not args.confirm_mapping:
+        print("처음 보는 양식은 diff로 컬럼 매핑을 확인한 뒤 --confirm-mapping(필요하면 --map)으로 다시 실행하세요.")
+    return 1 if failed else 0
+
+
+def cmd_diff(args: argparse.Namespace) -> int:
+    """엑셀 파일을 등록하지 않고 기존 카드사용내역과 비교"""
+    from app.services.import_service import ImportService
+    from app.utils.amount import to_won
+    from app.utils.excel_reader import describe_column_mapping
+    
+    card_company_id = _resolve_card_company_id(args.database, args.card_company)
+    column_overrides = _parse_column_overrides(args.map)
+    service = ImportService(args.database)
+    
+    # 처음 보는 양식은 추측한 매핑을 보여주기만 하고 저장하지 않음 (import --confirm-mapping에서 저장)
+    column_mapping, confirmed = service.find_column_mapping(
+        args.path, card_company_id, column_overrides=column_overrides
+    )
+    mapping_state = "저장된 매핑" if confirmed else "새 양식, 확인 전 (저장하지 않음)"
+    print(f"컬럼 매핑 [{mapping_state}]: {describe_column_mapping(column_mapping)}")
+    
+    transactions, _ = service.preview_transactions(
+        args.path, card_company_id, nrows=None, column_overrides=column_overrides
+    )
+    diff = service.diff_transactions(transactions, card_company_id)
+    
+    for status, count in diff['counts'].items():
+        print(f"{status:>10}: {count:,}건")
+    for index, existing_amount in sorted(diff['conflicts'].items())[:args.limit]:
+        transaction = transactions[index]
+        print(
+            f"  [충돌] {index + 1}행 승인번호 {transaction.get('approval_number')}: "
+            f"파일 금액 {to_won(transaction['amount']):,}, 기존 금액 {existing_amount:,}"
+        )
+    return 0
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    """카드사용내역 내보내기 (CSV 또는 XLSX)"""
+    from app.services.card_transaction_service import CardTransactionService
+    
+    card_company_id = _resolve_card_company_id(args.database, args.card_company)
+    rows = CardTransactionService(args.database).search_transaction_rows(
+        card_company_id=card_company_id,
+        transaction_date_from=args.date_from,
+        transaction_date_to=args.date_to,
+        vat_period=_parse_vat_period(args.period)
+    )
+    records = [row.to_dict() for row in rows]
+    
+    output = Path(args.output)
+    if output.suffix.lower() == '.xlsx':
+        import pandas as pd
+        
+        pd.DataFrame.from_records(records).to_excel(output, index=False)
+    else:
+        # 엑셀에서 바로 열 수 있도록 BOM이 있는 UTF-8로 저장
+        with open(output, 'w', newline='', encoding='utf-8-sig') as f:
+            if records:
+                writer = csv.DictWriter(f, fieldnames=list(records[0].keys()))
+                writer.writeheader()
+                writer.writerows(records)
+    
+    print(f"{len(records):,}건을 내보냈습니다: {output}")
+    return 0
+
+
+def cmd_dedupe(args: argparse.Namespace) -> int:
+    """중복 카드사용내역 정리"""
+    from app.services.card_transaction_service import CardTransactionService
+    
+    count = CardTransactionService(args.database).remove_duplicate_transactions(dry_run=args.dry_run)
+    if args.dry_run:
+        print(f"중복 카드사용내역: {count:,}건 (삭제하지 않음)")
+    else:
+        print(f"중복 카드사용내역 {count:,}건을 삭제했습니다.")
+    return 0
+
+
+def cmd_pair(args: argparse.Namespace) -> int:
+    """취소 거래를 원거래와 연결"""
+    from app.services.card_transaction_service import CardTransactionService
+    
+    result = CardTransactionService(args.database).pair_cancellations(import_batch_id=args.batch)
+    print(f"취소 거래 {result['paired']:,}건을 원거래와 연결했습니다. (미연결 {result['unpaired']:,}건)")
+    return 0
+
+
+def cmd_duplicates(args: argparse.Namespace) -> int:
+    """서로 다른 가져오기에 중복으로 들어온 구매 후보 출력"""
+    from app.services.card_transaction_service import CardTransactionService
+    
+    candidates = CardTransactionService(args.database).find_duplicate_candidates(
+        transaction_date_from=args.date_from,
+        transaction_date_to=args.date_to,
+        threshold=args.threshold
+    )
+    for candidate in candidates:
+        approval_text = " 승인번호 같음" if candidate['same_approval_number'] else ""
+        print(
+            f"{candidate['transaction_day']} {candidate['business_number']} {candidate['amount_won']:>12,}  "
+            f"#{candidate['transaction_id']} {candidate['vendor_name']} / "
+            f"#{candidate['duplicate_transaction_id']} {candidate['duplicate_vendor_name']}  "
+            f"(유사도 {candidate['similarity']:.2f}{approval_text})"
+        )
+    print(f"중복 구매 후보 {len(candidates):,}쌍")
+    return 0
+
+
+def cmd_summary(args: argparse.Namespace) -> int:
+    """기간 내 금액 합계 출력 (원 단위, 취소 금액 차감)"""
+    from app.services.card_transaction_service import CardTransactionService
+    
+    card_company_id = _resolve_card_company_id(args.database, args.card_company)
+    summary = CardTransactionService(args.database).get_amount_summary(
+        card_company_id=card_company_id,
+        transaction_date_from=args.date_from,
+        transaction_date_to=args.date_to,
+        vat_period=_parse_vat_period(args.period)
+    )
+    print(f"거래 {summary['transaction_count']:,}건 (취소 {summary['cancel_count']:,}건)")
+    print(f"승인 금액: {summary['purchase_amount_won']:>15,}원")
+    print(f"취소 금액: {summary['cancel_amount_won']:>15,}원")
+    print(f"합계 금액: {summary['net_amount_won']:>15,}원")
+    print(f"공급가액:  {summary['net_supply_amount_won']:>15,}원")
+    print(f"부가세:    {summary['net_vat_amount_won']:>15,}원")
+    return 0
+
+
+def cmd_report(args: argparse.Namespace) -> int:
+    """집계 테이블에서 월/분기/신고기간별 합계 출력"""
+    from app.services.report_service import ReportService
+    
+    service = ReportService(args.database)
+    if args.rebuild:
+        print(f"집계를 다시 계산했습니다: {service.rebuild_rollup():,}행")
+        return 0
+    
+    vat_period = _parse_vat_period(args.period)
+    if vat_period is not None:
+        if args.by == 'vendor':
+            rows = service.get_vendor_summary(vat_period)
+        elif args.by == 'card':
+            rows = service.get_card_summary(vat_period)
+        else:
+            rows = [service.get_vat_period_summary(vat_period)]
+        print(vat_period.label)
+    elif args.year:
+        rows = service.get_monthly_summary(args.year) if args.by == 'month' else service.get_quarterly_summary(args.year)
+    else:
+        raise ValueError("--year 또는 --period를 지정하세요.")
+    
+    for row in rows:
+        key = " ".join(str(row[column]) for column in row if column not in _REPORT_AMOUNT_COLUMNS)
+        print(
+            f"{key:<24} {row['transaction_count']:>8,}건 (취소 {row['cancel_count']:,}건)  "
+            f"합계 {row['gross_amount_won']:>15,}  공급가액 {row['supply_amount_won']:>15,}  "
+            f"부가세 {row['vat_amount_won']:>13,}  공제 제외 부가세 {row['excluded_vat_amount_won']:>13,}"
+        )
+    return 0
+
+
+def _load_exclusion_rules(path: Optional[str]):
+    """제외 규칙 JSON 파일 읽기 (경로가 없으면 None: 기본 규칙)"""
+    from app.utils.exclusion_rules import load_rules
+    
+    if not path:
+        return None
+    with open(path, encoding="utf-8") as rules_file:
+        return load_rules(json.load(rules_file))
+
+
+def cmd_exclude(args: argparse.Namespace) -> int:
+    """부가세 공제 제외 규칙 적용 및 제외 사유별 건수 출력"""
+    from app.services.vat_service import VatService
+    
+    rules = _load_exclusion_rules(args.rules)
+    
+    started = time.perf_counter()
+    result = VatService(args.database).identify_exclusion_targets(
+        vat_period=_parse_vat_period(args.period), rules=rules, dirty_vendors_only=args.dirty
+    )
+    elapsed = time.perf_counter() - started
+    if args.dirty:
+        print(f"변경된 거래처 {result['vendors']:,}곳 재판정")
+    print(f"제외 사유 변경: {result['updated']:,}건 ({elapsed:.2f}초)")
+    for reason, count in result.get('reasons', {}).items():
+        print(f"{reason:<20} {count:>10,}건")
+    return 0
+
+
+def cmd_filing(args: argparse.Namespace) -> int:
+    """신용카드매출전표등 수령명세서 전산매체 파일 작성"""
+    from app.services.vat_service import VatService
+    
+    vat_period = _parse_vat_period(args.period)
+    started = time.perf_counter()
+    result = VatService(args.database).generate_electronic_file(
+        args.output, vat_period, business_number=args.business_number, rules=_load_exclusion_rules(args.rules)
+    )
+    elapsed = time.perf_counter() - started
+    print(f"{vat_period.label} 전산매체 작성: {result['output_path']} ({result['file_size']:,}바이트, {elapsed:.2f}초)")
+    print(f"레코드 {result['data_count']:,}건, 거래 {result['transaction_count']:,}건, 검증값 {result['checksum']}")
+    if result['exclusion_updates']:
+        print(f"작성 전 공제 제외 재판정: {result['exclusion_updates']:,}건 변경")
+    print(f"공급가액: {result['supply_amount']:>15,}원")
+    print(f"세액:     {result['vat_amount']:>15,}원")
+    if result['excluded_supply_amount'] or result['excluded_vat_amount']:
+        print(
+            f"미기재(공제 제외/카드 미매칭/사업자등록번호 없음): 공급가액 {result['excluded_supply_amount']:,}원, "
+            f"세액 {result['excluded_vat_amount']:,}원"
+        )
+    return 0
+
+
+def cmd_reindex(args: argparse.Namespace) -> int:
+    """인덱스 재구성 및 통계 갱신"""
+    from app.services.maintenance_service import MaintenanceService
+    
+    service = MaintenanceService(args.database)
+    service.reindex()
+    service.incremental_vacuum()
+    return 0
+
+
+def cmd_backup(args: argparse.Namespace) -> int:
+    """온라인 백업 생성 또는 백업 목록 출력"""
+    from app.services.backup_service import BackupService
+    
+    service = BackupService(args.database, backup_dir=args.backup_dir, keep_count=args.keep)
+    if args.list:
+        for backup_path in service.list_backups():
+            print(backup_path)
+        return 0
+    
+    service.create_backup()
+    return 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    """대표 조회 쿼리 실행 시간 측정 (실행 계획 포함)"""
+    from app.repositories.database import get_database
+    from app.repositories.index_audit import IndexAuditor
+    
+    auditor = IndexAuditor(get_database(args.database).engine)
+    plans = auditor.run_workload()
+    for name, (row_count, elapsed_ms) in auditor.benchmark(repeat=args.repeat).items():
+        print(f"{elapsed_ms:10.2f}ms  {row_count:>10,}행  {name}")
+        if args.plan:
+            for detail in plans.get(name, []):
+                print(f"{'':26}{detail}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    명령줄 인자 파서 생성
+    
+    Returns:
+        ArgumentParser 객체
+    """
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="부가세 도우미 명령줄 도구")
+    parser.add_argument("--database", help="데이터베이스 파일 경로 (기본값: 설정의 DATABASE_PATH)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    import_parser = subparsers.add_parser("import", help="엑셀 파일/폴더 일괄 가져오기")
+    import_parser.add_argument("paths", nargs="+", help="엑셀 파일 또는 폴더 경로")
+    import_parser.add_argument("--card-company", help="카드사 코드 또는 ID (없으면 파일명 패턴/헤더로 판단)")
+    import_parser.add_argument("--workers", type=int, help="파싱 프로세스 수 (기본값: CPU 코어 수)")
+    import_parser.add_argument("--force", action="store_true", help="이미 가져온 파일도 다시 가져오기")
+    import_parser.add_argument(
+        "--confirm-mapping", action="store_true",
+        help="처음 보는 양식의 추측 컬럼 매핑(또는 --map 지정 매핑)을 확인한 것으로 저장하고 가져오기"
+    )
+    import_parser.add_argument(
+        "--map", action="append", metavar="FIELD=COLUMN",
+        help="컬럼 매핑 지정 (예: approval_number=승인번호, 여러 번 지정 가능)"
+    )
+    import_parser.set_defaults(handler=cmd_import)
+    
+    diff_parser = subparsers.add_parser("diff", help="엑셀 파일과 기존 카드사용내역 비교 (등록하지 않음)")
+    diff_parser.add_argument("path", help="엑셀 파일 경로")
+    diff_parser.add_argument("--card-company", required=True, help="카드사 코드 또는 ID")
+    diff_parser.add_argument("--limit", type=int, default=20, help="출력할 충돌 행 수 (기본값: 20)")
+    diff_parser.add_argument(
+        "--map", action="append", metavar="FIELD=COLUMN",
+        help="컬럼 매핑 지정 (예: approval_number=승인번호, 여러 번 지정 가능)"
+    )
+    diff_parser.set_defaults(handler=cmd_diff)
+    
+    export_parser = subparsers.add_parser("export", help="카드사용내역 내보내기")
+    export_parser.add_argument("output", help="출력 파일 경로 (.csv 또는 .xlsx)")
+    export_parser.add_argument("--card-company", help="카드사 코드 또는 ID")
+    export_parser.add_argument("--from", dest="date_from", help="거래 일자 시작일 (YYYY-MM-DD)")
+    export_parser.add_argument("--to", dest="date_to", help="거래 일자 종료일 (YYYY-MM-DD)")
+    export_parser.add_argument("--period", help="부가세 신고기간 (예: '2025-1', '2025 1기 예정', '2025 2기 확정')")
+    export_parser.set_defaults(handler=cmd_export)
+    
+    dedupe_parser = subparsers.add_parser("dedupe", help="중복 카드사용내역 정리")
+    dedupe_parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 건수만 출력")
+    dedupe_parser.set_defaults(handler=cmd_dedupe)
+    
+    pair_parser = subparsers.add_parser("pair", help="취소 거래를 원거래와 연결 (연결되지 않은 취소 거래만)")
+    pair_parser.add_argument("--batch", type=int, help="가져오기 배치 ID (없으면 전체)")
+    pair_parser.set_defaults(handler=cmd_pair)
+    
+    duplicates_parser = subparsers.add_parser("duplicates", help="다른 가져오기에 중복으로 들어온 구매 후보 출력")
+    duplicates_parser.add_argument("--from", dest="date_from", help="거래 일자 시작일 (YYYY-MM-DD)")
+    duplicates_parser.add_argument("--to", dest="date_to", help="거래 일자 종료일 (YYYY-MM-DD)")
+    duplicates_parser.add_argument("--threshold", type=float, default=0.8, help="가맹점명 최소 유사도 (기본값: 0.8)")
+    duplicates_parser.set_defaults(handler=cmd_duplicates)
+    
+    summary_parser = subparsers.add_parser("summary", help="기간 내 금액 합계 출력 (원 단위, 취소 금액 차감)")
+    summary_parser.add_argument("--from", dest="date_from", help="거래 일자 시작일 (YYYY-MM-DD)")
+    summary_parser.add_argument("--to", dest="date_to", help="거래 일자 종료일 (YYYY-MM-DD)")
+    summary_parser.add_argument("--period", help="부가세 신고기간 (예: '2025-1', '2025 1기 예정', '2025 2기 확정')")
+    summary_parser.add_argument("--card-company", help="카드사 코드 또는 ID")
+    summary_parser.set_defaults(handler=cmd_summary)
+    
+    report_parser = subparsers.add_parser("report", help="월/분기/신고기간별 합계 출력 (집계 테이블 사용)")
+    report_parser.add_argument("--year", type=int, help="연도 (월별/분기별 합계)")
+    report_parser.add_argument("--period", help="부가세 신고기간 (예: '2025-1', '2025 1기 예정')")
+    report_parser.add_argument(
+        "--by", choices=["month", "quarter", "vendor", "card"],
+        help="집계 기준 (--year: month/quarter, 기본값 quarter / --period: vendor/card, 없으면 합계)"
+    )
+    report_parser.add_argument("--rebuild", action="store_true", help="집계 테이블 전체 다시 계산")
+    report_parser.set_defaults(handler=cmd_report)
+    
+    exclude_parser = subparsers.add_parser("exclude", help="부가세 공제 제외 규칙 적용 (폐업/간이/면세 거래처, 병원/약국/학원)")
+    exclude_parser.add_argument("--period", help="부가세 신고기간 (생략하면 전체 카드사용내역)")
+    exclude_parser.add_argument("--rules", help="제외 규칙 JSON 파일 (생략하면 기본 규칙)")
+    exclude_parser.add_argument("--dirty", action="store_true", help="새로 등록되었거나 정보가 바뀐 거래처의 내역만 다시 판정")
+    exclude_parser.set_defaults(handler=cmd_exclude)
+    
+    filing_parser = subparsers.add_parser("filing", help="신용카드매출전표등 수령명세서 전산매체 파일 작성")
+    filing_parser.add_argument("output", help="출력 파일 경로")
+    filing_parser.add_argument("--period", required=True, help="부가세 신고기간 (예: '2025 1기 예정', '2025 1기 확정')")
+    filing_parser.add_argument("--business-number", help="제출자 사업자등록번호 (등록된 사업자가 하나이면 생략)")
+    filing_parser.add_argument("--rules", help="제외 규칙 JSON 파일 (생략하면 기본 규칙)")
+    filing_parser.set_defaults(handler=cmd_filing)
+    
+    reindex_parser = subparsers.add_parser("reindex", help="인덱스 재구성, 통계 갱신, 빈 페이지 반환")
+    reindex_parser.set_defaults(handler=cmd_reindex)
+    
+    backup_parser = subparsers.add_parser("backup", help="온라인 백업 생성")
+    backup_parser.add_argument("--backup-dir", help="백업 디렉토리 (기본값: 설정의 BACKUP_DIR)")
+    backup_parser.add_argument("--keep", type=int, help="보관할 백업 개수 (기본값: 설정의 BACKUP_KEEP_COUNT)")
+    backup_parser.add_argument("--list", action="store_true", help="백업 목록만 출력")
+    backup_parser.set_defaults(handler=cmd_backup)
+    
+    bench_parser = subparsers.add_parser("bench", help="대표 조회 쿼리 실행 시간 측정")
+    bench_parser.add_argument("--repeat", type=int, default=5, help="쿼리별 반복 횟수 (기본값: 5)")
+    bench_parser.add_argument("--plan", action="store_true", help="실행 계획 함께 출력")
+    bench_parser.set_defaults(handler=cmd_bench)
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    명령줄 도구 진입점
+    
+    Args:
+        argv: 명령줄 인자 (None인 경우 sys.argv 사용)
+    
+    Returns:
+        종료 코드
+    """
+    args = build_parser().parse_args(argv)
+    started = time.perf_counter()
+    try:
+        exit_code = args.handler(args)
+    except (ValueError, RuntimeError, FileNotFoundError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+    print(f"완료 ({time.perf_counter() - started:.2f}초)")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,7 @@ python-dotenv를 사용하여 .env 파일에서 환경 변수를 로드하고 
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from dotenv import load_dotenv
 
 
@@ -28,6 +28,16 @@ class Settings:
     # 데이터베이스 설정
     DATABASE_PATH: str = os.getenv("DATABASE_PATH", "data/vat_filemaker.db")
     
+    # 백업 설정
+    BACKUP_DIR: str = os.getenv("BACKUP_DIR", "data/backups")
+    BACKUP_KEEP_COUNT: int = int(os.getenv("BACKUP_KEEP_COUNT", "10"))
+    
+    # 일괄 가져오기 설정
+    # 파일명 패턴별 카드사 코드 (예: "*신한*=SHINHAN;*국민*=KB")
+    CARD_COMPANY_FILE_PATTERNS: str = os.getenv("CARD_COMPANY_FILE_PATTERNS", "")
+    # 엑셀 파싱 프로세스 수 (0이면 CPU 코어 수)
+    IMPORT_WORKERS: int = int(os.getenv("IMPORT_WORKERS", "0"))
+    
     # 로깅 설정
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE: str = os.getenv("LOG_FILE", "logs/app.log")
@@ -60,6 +70,35 @@ class Settings:
             return str(PROJECT_ROOT / db_path)
         return str(db_path)
     
+    @classmethod
+    def get_backup_dir_path(cls) -> str:
+        """
+        백업 디렉토리 경로 반환
+        
+        Returns:
+            백업 디렉토리 경로
+        """
+        backup_path = Path(cls.BACKUP_DIR)
+        # 상대 경로인 경우 프로젝트 루트 기준으로 절대 경로 변환
+        if not backup_path.is_absolute():
+            return str(PROJECT_ROOT / backup_path)
+        return str(backup_path)
+    
+    @classmethod
+    def get_card_company_file_patterns(cls) -> Dict[str, str]:
+        """
+        파일명 패턴별 카드사 코드 반환
+        
+        Returns:
+            {파일명 패턴: 카드사 코드} 딕셔너리 (설정 순서 유지)
+        """
+        patterns = {}
+        for item in cls.CARD_COMPANY_FILE_PATTERNS.split(";"):
+            pattern, _, code = item.partition("=")
+            if pattern.strip() and code.strip():
+                patterns[pattern.strip()] = code.strip()
+        return patterns
+    
     @classmethod
     def get_log_file_path(cls) -> str:
         """
@@ -4,9 +4,17 @@
 QAbstractTableModel을 상속받아 카드사용내역을 테이블에 표시하기 위한 모델입니다.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex
+from PySide6.QtGui import QColor
 from datetime import datetime
+from app.repositories.projections import CardTransactionRow
+from app.utils.amount import to_won
+from app.repositories.card_transaction_staging_repository import (
+  DIFF_STATUS_EXISTING,
+  DIFF_STATUS_CONFLICT,
+  DIFF_STATUS_INVALID
+)
 
 
 class CardTransactionModel(QAbstractTableModel):
@@ -48,6 +56,13 @@ class CardTransactionModel(QAbstractTableModel):
   COL_CREATED_AT = 11
   COL_UPDATED_AT = 12
   
+  # 기존 내역 비교 상태별 행 배경색 (신규 행은 기본 배경)
+  DIFF_STATUS_COLORS = {
+    DIFF_STATUS_EXISTING: QColor(224, 224, 224),
+    DIFF_STATUS_CONFLICT: QColor(255, 224, 178),
+    DIFF_STATUS_INVALID: QColor(255, 205, 210),
+  }
+  
   def __init__(self, parent=None):
     """
     모델 초기화
@@ -56,7 +71,10 @@ class CardTransactionModel(QAbstractTableModel):
       parent: 부모 객체
     """
     super().__init__(parent)
-    self._data: List[Dict[str, Any]] = []
+    self._data: List[Union[Dict[str, Any], CardTransactionRow]] = []
+    # 기존 내역 비교 결과 (행별 상태, 충돌 행의 기존 금액)
+    self._diff_statuses: List[str] = []
+    self._diff_conflicts: Dict[int, int] = {}
   
   def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
     """
@@ -119,6 +137,9 @@ class CardTransactionModel(QAbstractTableModel):
               return dt.strftime('%Y-%m-%d %H:%M:%S')
             except:
               return transaction_date[:19] if len(transaction_date) >= 19 else transaction_date
+          # 조회 전용 행(CardTransactionRow)은 datetime을 그대로 전달
+          if isinstance(transaction_date, datetime):
+            return transaction_date.strftime('%Y-%m-%d %H:%M:%S')
         return transaction_date
       elif col == self.COL_MASKED_CARD_NUMBER:
         return transaction.get('masked_card_number', '')
@@ -126,10 +147,13 @@ class CardTransactionModel(QAbstractTableModel):
         is_cancel = transaction.get('is_cancel', False)
         return "취소" if is_cancel else "정상"
       elif col == self.COL_AMOUNT:
-        amount = transaction.get('amount')
-        if amount is not None:
+        # 등록된 내역은 원 단위 정수 금액(amount_won), 엑셀 미리보기 행은 등록 시와 같은 규칙으로 변환한 금액
+        amount_won = transaction.get('amount_won')
+        if amount_won is None:
+          amount_won = to_won(transaction.get('amount'))
+        if amount_won is not None:
           # 금액을 천단위 구분자와 함께 표시
-          return f"{float(amount):,.0f}"
+          return f"{amount_won:,}"
         return ''
       elif col == self.COL_VENDOR_NAME:
         return transaction.get('vendor_name', '')
@@ -151,6 +175,8 @@ class CardTransactionModel(QAbstractTableModel):
           # ISO 형식 문자열을 간단한 형식으로 변환
           if isinstance(created_at, str):
             return created_at[:19] if len(created_at) >= 19 else created_at
+          if isinstance(created_at, datetime):
+            return created_at.strftime('%Y-%m-%d %H:%M:%S')
         return created_at
       elif col == self.COL_UPDATED_AT:
         updated_at = transaction.get('updated_at', '')
@@ -158,8 +184,27 @@ class CardTransactionModel(QAbstractTableModel):
           # ISO 형식 문자열을 간단한 형식으로 변환
           if isinstance(updated_at, str):
             return updated_at[:19] if len(updated_at) >= 19 else updated_at
+          if isinstance(updated_at, datetime):
+            return updated_at.strftime('%Y-%m-%d %H:%M:%S')
         return updated_at
     
+    elif role == Qt.ItemDataRole.BackgroundRole:
+      if row < len(self._diff_statuses):
+        return self.DIFF_STATUS_COLORS.get(self._diff_statuses[row])
+    
+    elif role == Qt.ItemDataRole.ToolTipRole:
+      if row < len(self._diff_statuses):
+        status = self._diff_statuses[row]
+        if status == DIFF_STATUS_EXISTING:
+          return "이미 등록된 카드사용내역입니다. (등록 시 제외)"
+        elif status == DIFF_STATUS_CONFLICT:
+          return (
+            f"같은 승인번호의 기존 내역과 금액이 다릅니다. "
+            f"(기존 금액: {self._diff_conflicts[row]:,})"
+          )
+        elif status == DIFF_STATUS_INVALID:
+          return "필수 항목(거래 일자, 금액)이 없습니다. (등록 시 제외)"
+    
     elif role == Qt.ItemDataRole.TextAlignmentRole:
       # 숫자 컬럼은 우측 정렬, 나머지는 좌측 정렬
       if col in [self.COL_ID, self.COL_CARD_COMPANY_ID, self.COL_CARD_ID, self.COL_VENDOR_ID, self.COL_AMOUNT]:
@@ -193,18 +238,36 @@ class CardTransactionModel(QAbstractTableModel):
     
     return None
   
-  def set_data(self, data: List[Dict[str, Any]]) -> None:
+  def set_data(self, data: List[Union[Dict[str, Any], CardTransactionRow]]) -> None:
     """
     모델 데이터 설정
     
     Args:
-      data: 카드사용내역 리스트
+      data: 카드사용내역 리스트 (엑셀 딕셔너리 또는 CardTransactionRow)
     """
     self.beginResetModel()
     self._data = data.copy() if data else []
+    self._diff_statuses = []
+    self._diff_conflicts = {}
     self.endResetModel()
   
-  def get_data(self) -> List[Dict[str, Any]]:
+  def set_diff(self, diff: Dict[str, Any]) -> None:
+    """
+    기존 내역 비교 결과 설정 (행 배경색과 툴팁으로 표시)
+    
+    Args:
+      diff: ImportService.diff_transactions 결과 (현재 데이터와 같은 순서)
+    """
+    self._diff_statuses = list(diff.get('statuses', []))
+    self._diff_conflicts = dict(diff.get('conflicts', {}))
+    if self._data:
+      self.dataChanged.emit(
+        self.index(0, 0),
+        self.index(len(self._data) - 1, len(self.COLUMN_HEADERS) - 1),
+        [Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ToolTipRole]
+      )
+  
+  def get_data(self) -> List[Union[Dict[str, Any], CardTransactionRow]]:
     """
     현재 모델 데이터 반환
     
@@ -224,7 +287,8 @@ class CardTransactionModel(QAbstractTableModel):
       해당 행의 카드사용내역 또는 None
     """
     if 0 <= row < len(self._data):
-      return self._data[row].copy()
+      transaction = self._data[row]
+      return transaction.copy() if isinstance(transaction, dict) else transaction.to_dict()
     return None
   
   def clear(self) -> None:
@@ -233,5 +297,7 @@ class CardTransactionModel(QAbstractTableModel):
     """
     self.beginResetModel()
     self._data = []
+    self._diff_statuses = []
+    self._diff_conflicts = {}
     self.endResetModel()
 
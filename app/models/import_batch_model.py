@@ -0,0 +1,199 @@
+"""
+가져오기 배치 테이블 모델
+
+QAbstractTableModel을 상속받아 카드사용내역 가져오기 이력을 테이블에 표시하기 위한 모델입니다.
+"""
+
+from typing import List, Dict, Any, Optional
+from pathlib import Path
+from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex
+
+
+class ImportBatchModel(QAbstractTableModel):
+  """
+  가져오기 배치 테이블 모델 클래스
+  
+  가져오기 이력과 배치별 처리량을 테이블 뷰에 표시합니다.
+  """
+  
+  # 컬럼 헤더 정의
+  COLUMN_HEADERS = [
+    "ID",
+    "원본 파일",
+    "카드사 ID",
+    "상태",
+    "대상 건수",
+    "등록 건수",
+    "실패 건수",
+    "소요 시간(초)",
+    "처리량(건/초)",
+    "시작 시간"
+  ]
+  
+  # 컬럼 인덱스 상수
+  COL_ID = 0
+  COL_SOURCE_FILE = 1
+  COL_CARD_COMPANY_ID = 2
+  COL_STATUS = 3
+  COL_TOTAL_ROWS = 4
+  COL_INSERTED_ROWS = 5
+  COL_FAILED_ROWS = 6
+  COL_ELAPSED_SECONDS = 7
+  COL_ROWS_PER_SECOND = 8
+  COL_STARTED_AT = 9
+  
+  # 상태 표시명
+  STATUS_NAMES = {
+    'running': "진행 중",
+    'completed': "완료",
+    'failed': "실패",
+    'undone': "되돌림"
+  }
+  
+  def __init__(self, parent=None):
+    """
+    모델 초기화
+    
+    Args:
+      parent: 부모 객체
+    """
+    super().__init__(parent)
+    self._data: List[Dict[str, Any]] = []
+  
+  def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+    """
+    행 개수 반환
+    
+    Args:
+      parent: 부모 인덱스
+    
+    Returns:
+      행 개수
+    """
+    return len(self._data)
+  
+  def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+    """
+    열 개수 반환
+    
+    Args:
+      parent: 부모 인덱스
+    
+    Returns:
+      열 개수
+    """
+    return len(self.COLUMN_HEADERS)
+  
+  def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+    """
+    인덱스 위치의 데이터 반환
+    
+    Args:
+      index: 데이터 인덱스
+      role: 데이터 역할
+    
+    Returns:
+      인덱스 위치의 데이터
+    """
+    if not index.isValid():
+      return None
+    
+    row = index.row()
+    col = index.column()
+    
+    if row >= len(self._data):
+      return None
+    
+    batch = self._data[row]
+    
+    if role == Qt.ItemDataRole.DisplayRole:
+      if col == self.COL_ID:
+        return batch.get('id', '')
+      elif col == self.COL_SOURCE_FILE:
+        source_file = batch.get('source_file')
+        return Path(source_file).name if source_file else ''
+      elif col == self.COL_CARD_COMPANY_ID:
+        return batch.get('card_company_id', '')
+      elif col == self.COL_STATUS:
+        status = batch.get('status', '')
+        return self.STATUS_NAMES.get(status, status)
+      elif col == self.COL_TOTAL_ROWS:
+        return f"{batch.get('total_rows', 0):,}"
+      elif col == self.COL_INSERTED_ROWS:
+        return f"{batch.get('inserted_rows', 0):,}"
+      elif col == self.COL_FAILED_ROWS:
+        return f"{batch.get('failed_rows', 0):,}"
+      elif col == self.COL_ELAPSED_SECONDS:
+        elapsed_seconds = batch.get('elapsed_seconds')
+        return f"{elapsed_seconds:,.2f}" if elapsed_seconds is not None else ''
+      elif col == self.COL_ROWS_PER_SECOND:
+        rows_per_second = batch.get('rows_per_second')
+        return f"{rows_per_second:,.0f}" if rows_per_second is not None else ''
+      elif col == self.COL_STARTED_AT:
+        started_at = batch.get('started_at') or ''
+        return started_at[:19].replace('T', ' ')
+    
+    elif role == Qt.ItemDataRole.ToolTipRole:
+      if col == self.COL_SOURCE_FILE:
+        return batch.get('source_file')
+    
+    elif role == Qt.ItemDataRole.TextAlignmentRole:
+      # 숫자 컬럼은 우측 정렬, 나머지는 좌측 정렬
+      if col in [
+        self.COL_ID, self.COL_CARD_COMPANY_ID, self.COL_TOTAL_ROWS, self.COL_INSERTED_ROWS,
+        self.COL_FAILED_ROWS, self.COL_ELAPSED_SECONDS, self.COL_ROWS_PER_SECOND
+      ]:
+        return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+      else:
+        return int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+    
+    return None
+  
+  def headerData(
+    self,
+    section: int,
+    orientation: Qt.Orientation,
+    role: int = Qt.ItemDataRole.DisplayRole
+  ) -> Any:
+    """
+    헤더 데이터 반환
+    
+    Args:
+      section: 섹션 인덱스
+      orientation: 방향 (가로/세로)
+      role: 데이터 역할
+    
+    Returns:
+      헤더 데이터
+    """
+    if role == Qt.ItemDataRole.DisplayRole:
+      if orientation == Qt.Orientation.Horizontal:
+        if 0 <= section < len(self.COLUMN_HEADERS):
+          return self.COLUMN_HEADERS[section]
+    
+    return None
+  
+  def set_data(self, data: List[Dict[str, Any]]) -> None:
+    """
+    모델 데이터 설정
+    
+    Args:
+      data: 가져오기 배치 리스트
+    """
+    self.beginResetModel()
+    self._data = data.copy() if data else []
+    self.endResetModel()
+  
+  def get_row_data(self, row: int) -> Optional[Dict[str, Any]]:
+    """
+    특정 행의 데이터 반환
+    
+    Args:
+      row: 행 인덱스
+    
+    Returns:
+      해당 행의 가져오기 배치 또는 None
+    """
+    if 0 <= row < len(self._data):
+      return self._data[row].copy()
+    return None
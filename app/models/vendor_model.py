@@ -4,9 +4,11 @@
 QAbstractTableModel을 상속받아 거래처정보를 테이블에 표시하기 위한 모델입니다.
 """
 
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Union
 from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex
 from app.utils.font import get_app_font
+from app.repositories.projections import VendorRow
 
 
 class VendorModel(QAbstractTableModel):
@@ -46,7 +48,7 @@ class VendorModel(QAbstractTableModel):
             parent: 부모 객체
         """
         super().__init__(parent)
-        self._data: List[Dict[str, Any]] = []
+        self._data: List[Union[Dict[str, Any], VendorRow]] = []
         
         # 폰트 설정 (맑은 고딕)
         self._font = get_app_font()
@@ -124,6 +126,9 @@ class VendorModel(QAbstractTableModel):
                     # ISO 형식 문자열을 간단한 형식으로 변환
                     if isinstance(status_updated_at, str):
                         return status_updated_at[:19] if len(status_updated_at) >= 19 else status_updated_at
+                    # 조회 전용 행(VendorRow)은 datetime을 그대로 전달
+                    if isinstance(status_updated_at, datetime):
+                        return status_updated_at.strftime('%Y-%m-%d %H:%M:%S')
                 return status_updated_at
             elif col == self.COL_CREATED_AT:
                 created_at = vendor.get('created_at', '')
@@ -131,6 +136,9 @@ class VendorModel(QAbstractTableModel):
                     # ISO 형식 문자열을 간단한 형식으로 변환
                     if isinstance(created_at, str):
                         return created_at[:19] if len(created_at) >= 19 else created_at
+                    # 조회 전용 행(VendorRow)은 datetime을 그대로 전달
+                    if isinstance(created_at, datetime):
+                        return created_at.strftime('%Y-%m-%d %H:%M:%S')
                 return created_at
             elif col == self.COL_UPDATED_AT:
                 updated_at = vendor.get('updated_at', '')
@@ -138,6 +146,9 @@ class VendorModel(QAbstractTableModel):
                     # ISO 형식 문자열을 간단한 형식으로 변환
                     if isinstance(updated_at, str):
                         return updated_at[:19] if len(updated_at) >= 19 else updated_at
+                    # 조회 전용 행(VendorRow)은 datetime을 그대로 전달
+                    if isinstance(updated_at, datetime):
+                        return updated_at.strftime('%Y-%m-%d %H:%M:%S')
                 return updated_at
         
         elif role == Qt.ItemDataRole.TextAlignmentRole:
@@ -181,18 +192,18 @@ class VendorModel(QAbstractTableModel):
         
         return None
     
-    def set_data(self, data: List[Dict[str, Any]]) -> None:
+    def set_data(self, data: List[Union[Dict[str, Any], VendorRow]]) -> None:
         """
         모델 데이터 설정
         
         Args:
-            data: 거래처정보 리스트
+            data: 거래처정보 리스트 (딕셔너리 또는 VendorRow)
         """
         self.beginResetModel()
         self._data = data.copy() if data else []
         self.endResetModel()
     
-    def get_data(self) -> List[Dict[str, Any]]:
+    def get_data(self) -> List[Union[Dict[str, Any], VendorRow]]:
         """
         현재 모델 데이터 반환
         
@@ -212,7 +223,8 @@ class VendorModel(QAbstractTableModel):
             해당 행의 거래처정보 또는 None
         """
         if 0 <= row < len(self._data):
-            return self._data[row].copy()
+            vendor = self._data[row]
+            return vendor.copy() if isinstance(vendor, dict) else vendor.to_dict()
         return None
     
     def clear(self) -> None:
@@ -68,3 +68,7 @@ class CardCompanyRepository:
         self.session.commit()
         return True
 
+    def get_all(self) -> List[CardCompanyInfo]:
+        """전체 카드사정보 조회"""
+        return self.session.query(CardCompanyInfo).order_by(CardCompanyInfo.id).all()
+
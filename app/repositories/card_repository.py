@@ -4,7 +4,7 @@
 card_info 테이블에 대한 CRUD 작업을 담당합니다.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.repositories.schema import CardInfo
@@ -67,3 +67,20 @@ class CardRepository:
         self.session.commit()
         return True
 
+    def get_masked_card_numbers(self, card_company_id: Optional[int] = None) -> List[Tuple[int, int, str]]:
+        """
+        마스킹 카드번호 목록 조회 (카드 매칭 인덱스용, 복호화하지 않음)
+
+        Args:
+            card_company_id: 카드사 ID (None인 경우 전체)
+
+        Returns:
+            (카드 ID, 카드사 ID, 마스킹 카드번호) 리스트
+        """
+        query = self.session.query(
+            CardInfo.id, CardInfo.card_company_id, CardInfo.masked_card_number
+        ).filter(CardInfo.masked_card_number.isnot(None))
+        if card_company_id is not None:
+            query = query.filter(CardInfo.card_company_id == card_company_id)
+        return [tuple(row) for row in query.all()]
+
@@ -4,11 +4,61 @@
 card_transaction 테이블에 대한 CRUD 작업을 담당합니다.
 """
 
-from typing import List, Optional, Dict, Any
+from dataclasses import fields
+from typing import List, Optional, Dict, Any, Sequence
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_, or_
-from app.repositories.schema import CardTransaction
+from sqlalchemy import and_, case, delete, func, null, or_, select, text, tuple_, update
+from app.repositories.schema import CardTransaction, VendorInfo, VendorExclusionQueue
+from app.repositories.projections import CardTransactionRow
+from app.utils.exclusion_rules import (
+    ExclusionRule, MANUAL_EXCLUSION_REASON, RULE_FIELD_VENDOR_TAX_TYPE, RULE_FIELD_VENDOR_BUSINESS_STATUS,
+    RULE_FIELD_VENDOR_NAME, RULE_OPERATOR_CONTAINS
+)
+from app.utils.vat_period import VatPeriod, to_ymd
+
+
+# 취소 거래의 원거래 후보 조회 (통계가 없어도 승인번호 인덱스를 쓰도록 INDEXED BY 지정)
+# 같은 카드사/승인번호/카드번호의 정상 거래 중 취소 일시 이전이고, 원거래 금액에서 이미 연결된 취소 금액을 뺀
+# 남은 금액이 취소 금액 이상인 거래를 찾으며(부분 취소 여러 건의 합이 원거래 금액을 넘지 않도록),
+# 금액이 가장 작은 거래(전액 취소이면 금액이 같은 거래), 그다음 가장 최근 거래를 선택합니다.
+_ORIGINAL_TRANSACTION_SUBQUERY = (
+    "SELECT o.id FROM card_transaction o INDEXED BY idx_card_transaction_approval_number"
+    " WHERE o.approval_number = c.approval_number"
+    " AND o.card_company_id = c.card_company_id"
+    " AND o.is_cancel = 0"
+    " AND o.masked_card_number IS c.masked_card_number"
+    " AND o.transaction_date <= c.transaction_date"
+    " AND ABS(o.amount_won) - COALESCE(("
+    "   SELECT SUM(ABS(l.amount_won)) FROM card_transaction l"
+    "   WHERE l.original_transaction_id = o.id"
+    " ), 0) >= ABS(c.amount_won)"
+    " ORDER BY ABS(o.amount_won), o.transaction_date DESC, o.id"
+    " LIMIT 1"
+)
+
+
+def _compile_exclusion_case(rules: Sequence[ExclusionRule], columns: Dict[str, Any]) -> Any:
+    """
+    제외 규칙을 SQL CASE 식으로 변환 (처음 일치한 규칙의 코드, 일치하는 규칙이 없으면 NULL)
+    
+    Args:
+        rules: 제외 규칙 (우선순위 순)
+        columns: 규칙 필드별 SQL 컬럼 식 튜플 (컬럼 중 하나라도 일치하면 규칙 일치)
+    
+    Returns:
+        CASE 식 (규칙이 없으면 NULL)
+    """
+    whens = []
+    for rule in rules:
+        predicates = []
+        for column in columns[rule.field]:
+            if rule.operator == RULE_OPERATOR_CONTAINS:
+                predicates.extend(column.contains(value, autoescape=True) for value in rule.values)
+            else:
+                predicates.append(column.in_(rule.values))
+        whens.append((or_(*predicates), rule.code))
+    return case(*whens, else_=None) if whens else null()
 
 
 class CardTransactionRepository:
@@ -39,6 +89,109 @@ class CardTransactionRepository:
             self.session.rollback()
             raise RuntimeError(f"카드사용내역 저장 중 오류가 발생했습니다: {str(e)}")
 
+    def _duplicate_condition(self) -> Any:
+        """
+        중복 행 조건 생성
+        
+        (카드사, 거래 일시, 승인번호, 금액, 취소 여부)가 같은 행 중 ID가 가장 작은 행만 남깁니다.
+        """
+        keep_ids = select(func.min(CardTransaction.id)).group_by(
+            CardTransaction.card_company_id,
+            CardTransaction.transaction_date,
+            CardTransaction.approval_number,
+            CardTransaction.amount_won,
+            CardTransaction.is_cancel
+        )
+        return CardTransaction.id.not_in(keep_ids)
+
+    def count_duplicates(self) -> int:
+        """중복 카드사용내역 건수 조회"""
+        return self.session.execute(
+            select(func.count()).select_from(CardTransaction).where(self._duplicate_condition())
+        ).scalar()
+
+    def delete_duplicates(self) -> int:
+        """
+        중복 카드사용내역 삭제 (단일 DELETE 문)
+        
+        Returns:
+            삭제된 건수
+        """
+        try:
+            result = self.session.execute(delete(CardTransaction).where(self._duplicate_condition()))
+            self.session.commit()
+            return result.rowcount
+        except Exception as e:
+            self.session.rollback()
+            raise RuntimeError(f"중복 카드사용내역 삭제 중 오류가 발생했습니다: {str(e)}")
+
+    def pair_cancellations(self, import_batch_id: Optional[int] = None) -> int:
+        """
+        취소 거래를 원거래와 연결 (original_transaction_id 설정, 회차별 UPDATE 문)
+        
+        원거래가 없는 취소 거래만 idx_card_transaction_unpaired_cancel 부분 인덱스로 읽으므로
+        이미 연결된 거래는 다시 처리하지 않으며, 가져오기 후 반복 실행할 수 있습니다.
+        부분 취소는 원거래의 남은 금액(원거래 금액 - 이미 연결된 취소 금액)이 취소 금액 이상이면 연결합니다.
+        한 회차에서는 원거래마다 취소 일시가 가장 이른 취소 거래 하나만 연결하고, 연결이 없을 때까지
+        반복하므로 같은 원거래의 부분 취소는 일시 순으로 남은 금액 안에서만 연결됩니다
+        (회차 수는 원거래 하나에 딸린 부분 취소 건수 정도).
+        원거래가 삭제되어 남은 연결은 먼저 해제하여 다시 연결 대상이 되게 합니다.
+        
+        Args:
+            import_batch_id: 가져오기 배치 ID (None인 경우 연결되지 않은 모든 취소 거래)
+        
+        Returns:
+            새로 연결된 취소 거래 건수
+        """
+        batch_condition = "AND c.import_batch_id = :import_batch_id" if import_batch_id is not None else ""
+        try:
+            self.session.execute(text(
+                "UPDATE card_transaction SET original_transaction_id = NULL "
+                "WHERE original_transaction_id IS NOT NULL "
+                "AND NOT EXISTS (SELECT 1 FROM card_transaction o WHERE o.id = card_transaction.original_transaction_id)"
+            ))
+            # 원거래 조회가 취소 거래마다 한 번만 실행되도록 결과를 먼저 구체화하고,
+            # 같은 원거래를 고른 취소 거래 중 가장 이른 거래만 이번 회차에 연결
+            pair_statement = text(
+                "WITH m AS MATERIALIZED ("
+                "  SELECT c.id AS cancel_id, c.transaction_date,"
+                f"  ({_ORIGINAL_TRANSACTION_SUBQUERY}) AS original_id"
+                "  FROM card_transaction c INDEXED BY idx_card_transaction_unpaired_cancel"
+                "  WHERE c.is_cancel = 1 AND c.original_transaction_id IS NULL"
+                f"  AND c.approval_number IS NOT NULL {batch_condition}"
+                "), "
+                "f AS ("
+                "  SELECT cancel_id, original_id,"
+                "  ROW_NUMBER() OVER (PARTITION BY original_id ORDER BY transaction_date, cancel_id) AS pair_rank"
+                "  FROM m WHERE original_id IS NOT NULL"
+                ") "
+                "UPDATE card_transaction SET original_transaction_id = f.original_id "
+                "FROM f "
+                "WHERE card_transaction.id = f.cancel_id AND f.pair_rank = 1"
+            )
+            paired = 0
+            while True:
+                self.session.execute(pair_statement, {'import_batch_id': import_batch_id})
+                # WITH로 시작하는 문장은 드라이버가 rowcount를 제공하지 않으므로 changes()로 확인
+                changed = self.session.execute(text("SELECT changes()")).scalar()
+                if not changed:
+                    break
+                paired += changed
+            self.session.commit()
+            return paired
+        except Exception as e:
+            self.session.rollback()
+            raise RuntimeError(f"취소 거래 연결 중 오류가 발생했습니다: {str(e)}")
+
+    def count_unpaired_cancellations(self) -> int:
+        """원거래와 연결되지 않은 취소 거래 건수 조회"""
+        return self.session.execute(
+            select(func.count()).select_from(CardTransaction).where(
+                CardTransaction.is_cancel.is_(True),
+                CardTransaction.original_transaction_id.is_(None)
+            )
+        ).scalar()
+
     def get(self, entity_id: int) -> Optional[CardTransaction]:
         """ID로 단건 조회"""
         return self.session.query(CardTransaction).get(entity_id)
@@ -60,6 +213,10 @@ class CardTransactionRepository:
                 except:
                     pass
             
+            # 금액이 바뀌면 원 단위 금액과 공급가액/부가세도 함께 갱신
+            if update_data.get('amount') is not None:
+                update_data = {**update_data, **CardTransaction.amount_columns(update_data['amount'])}
+            
             for key, value in update_data.items():
                 if hasattr(entity, key) and value is not None:
                     setattr(entity, key, value)
@@ -91,6 +248,7 @@ class CardTransactionRepository:
         vendor_id: Optional[int] = None,
         transaction_date_from: Optional[str] = None,
         transaction_date_to: Optional[str] = None,
+        vat_period: Optional[VatPeriod] = None,
         is_cancel: Optional[bool] = None,
         vendor_name: Optional[str] = None,
         business_number: Optional[str] = None,
@@ -105,6 +263,7 @@ class CardTransactionRepository:
             vendor_id: 거래처 ID
             transaction_date_from: 거래 일자 시작일
             transaction_date_to: 거래 일자 종료일
+            vat_period: 부가세 신고기간 (거래 일자 조건과 함께 지정하면 둘 다 적용)
             is_cancel: 거래취소여부
             vendor_name: 거래처명 (부분 일치)
             business_number: 사업자등록번호
@@ -112,7 +271,268 @@ class CardTransactionRepository:
         """
         query = self.session.query(CardTransaction)
         
-        # 필터 조건 추가
+        conditions = self._build_conditions(
+            card_company_id=card_company_id,
+            card_id=card_id,
+            vendor_id=vendor_id,
+            transaction_date_from=transaction_date_from,
+            transaction_date_to=transaction_date_to,
+            vat_period=vat_period,
+            is_cancel=is_cancel,
+            vendor_name=vendor_name,
+            business_number=business_number,
+            approval_number=approval_number
+        )
+        if conditions:
+            query = query.filter(and_(*conditions))
+        
+        return query.order_by(CardTransaction.transaction_date.desc()).all()
+
+    def list_rows(
+        self,
+        card_company_id: Optional[int] = None,
+        card_id: Optional[int] = None,
+        vendor_id: Optional[int] = None,
+        transaction_date_from: Optional[str] = None,
+        transaction_date_to: Optional[str] = None,
+        vat_period: Optional[VatPeriod] = None,
+        is_cancel: Optional[bool] = None,
+        vendor_name: Optional[str] = None,
+        business_number: Optional[str] = None,
+        approval_number: Optional[str] = None,
+        import_batch_id: Optional[int] = None
+    ) -> List[CardTransactionRow]:
+        """
+        카드사용내역 목록 조회 (조회 전용 프로젝션)
+        
+        검색 조건은 search()와 같고 가져오기 배치 ID로도 조회할 수 있습니다.
+        필요한 컬럼만 SELECT하여 CardTransactionRow로 반환합니다.
+        ORM 엔티티를 만들지 않으므로 세션 식별자 맵에도 등록되지 않습니다.
+        
+        Returns:
+            CardTransactionRow 리스트
+        """
+        stmt = select(*[CardTransaction.__table__.c[column.name] for column in fields(CardTransactionRow)])
+        
+        conditions = self._build_conditions(
+            card_company_id=card_company_id,
+            card_id=card_id,
+            vendor_id=vendor_id,
+            transaction_date_from=transaction_date_from,
+            transaction_date_to=transaction_date_to,
+            vat_period=vat_period,
+            is_cancel=is_cancel,
+            vendor_name=vendor_name,
+            business_number=business_number,
+            approval_number=approval_number,
+            import_batch_id=import_batch_id
+        )
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        
+        stmt = stmt.order_by(CardTransaction.transaction_date.desc())
+        return [CardTransactionRow(*row) for row in self.session.execute(stmt)]
+
+    def list_rows_sharing_purchase_key(
+        self,
+        transaction_date_from: Optional[str] = None,
+        transaction_date_to: Optional[str] = None
+    ) -> List[CardTransactionRow]:
+        """
+        (거래 일자, 금액, 사업자등록번호, 취소 여부)가 같은 내역이 둘 이상인 행만 조회
+        
+        중복 구매 후보 탐지의 사전 필터입니다. 키별 건수는 SQLite에서 한 번의 집계로 계산하고,
+        혼자인 행은 가져오지 않습니다.
+        
+        Args:
+            transaction_date_from: 거래 일자 시작일 (YYYY-MM-DD 형식)
+            transaction_date_to: 거래 일자 종료일 (YYYY-MM-DD 형식)
+        
+        Returns:
+            CardTransactionRow 리스트
+        """
+        conditions = self._build_conditions(
+            transaction_date_from=transaction_date_from,
+            transaction_date_to=transaction_date_to
+        )
+        conditions.append(CardTransaction.business_number.isnot(None))
+        purchase_key = (
+            func.date(CardTransaction.transaction_date),
+            CardTransaction.amount_won,
+            CardTransaction.business_number,
+            CardTransaction.is_cancel
+        )
+        shared_keys = select(*purchase_key).where(*conditions).group_by(*purchase_key).having(func.count() > 1)
+        
+        stmt = select(
+            *[CardTransaction.__table__.c[column.name] for column in fields(CardTransactionRow)]
+        ).where(*conditions, tuple_(*purchase_key).in_(shared_keys))
+        return [CardTransactionRow(*row) for row in self.session.execute(stmt)]
+
+    def summarize_amounts(
+        self,
+        card_company_id: Optional[int] = None,
+        transaction_date_from: Optional[str] = None,
+        transaction_date_to: Optional[str] = None,
+        vat_period: Optional[VatPeriod] = None
+    ) -> Dict[str, int]:
+        """
+        기간 내 금액 집계 (원 단위 정수 컬럼을 SQL에서 SUM)
+        
+        취소 거래는 저장된 부호와 관계없이 차감합니다.
+        거래 일자/신고기간 조건은 idx_card_transaction_ymd_cancel_amount_won 인덱스 범위 검색으로 처리됩니다.
+        
+        Args:
+            card_company_id: 카드사 ID
+            transaction_date_from: 거래 일자 시작일 (YYYY-MM-DD 형식)
+            transaction_date_to: 거래 일자 종료일 (YYYY-MM-DD 형식)
+            vat_period: 부가세 신고기간
+        
+        Returns:
+            건수와 금액 합계 딕셔너리 (transaction_count, cancel_count, purchase_amount_won,
+            cancel_amount_won, net_amount_won, net_supply_amount_won, net_vat_amount_won)
+        """
+        is_cancel = CardTransaction.is_cancel.is_(True)
+        
+        def net(column):
+            return func.coalesce(func.sum(case((is_cancel, -func.abs(column)), else_=column)), 0)
+        
+        stmt = select(
+            func.count(),
+            func.coalesce(func.sum(case((is_cancel, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((is_cancel, 0), else_=CardTransaction.amount_won)), 0),
+            func.coalesce(func.sum(case((is_cancel, func.abs(CardTransaction.amount_won)), else_=0)), 0),
+            net(CardTransaction.amount_won),
+            net(CardTransaction.supply_amount_won),
+            net(CardTransaction.vat_amount_won)
+        ).select_from(CardTransaction)
+        
+        conditions = self._build_conditions(
+            card_company_id=card_company_id,
+            transaction_date_from=transaction_date_from,
+            transaction_date_to=transaction_date_to,
+            vat_period=vat_period
+        )
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        
+        keys = (
+            'transaction_count', 'cancel_count', 'purchase_amount_won', 'cancel_amount_won',
+            'net_amount_won', 'net_supply_amount_won', 'net_vat_amount_won'
+        )
+        return dict(zip(keys, self.session.execute(stmt).one()))
+
+    def apply_exclusion_rules(
+        self,
+        rules: Sequence[ExclusionRule],
+        vat_period: Optional[VatPeriod] = None,
+        dirty_vendors_only: bool = False,
+        import_batch_id: Optional[int] = None
+    ) -> int:
+        """
+        부가세 공제 제외 규칙 적용 (exclusion_reason 설정, 단일 UPDATE 문)
+        
+        규칙 전체를 CASE 식 하나로 변환하여 거래처 정보와 조인한 카드사용내역에 한 번에 평가하고,
+        판정 결과가 현재 값과 다른 행만 갱신합니다. 이전 규칙의 사유 코드도 다시 판정하며,
+        수동 지정 사유(MANUAL_EXCLUSION_REASON)가 설정된 행은 그대로 둡니다.
+        집계 테이블의 제외 금액은 card_transaction 트리거가 갱신합니다.
+        
+        dirty_vendors_only인 경우 재판정 대기 거래처(vendor_exclusion_queue)의 내역만
+        idx_card_transaction_vendor_id 인덱스로 읽으므로 거래처 정보 변경 후 재판정 비용이 변경된 거래처의
+        내역 수에 비례합니다. 신고기간을 지정하지 않은 평가는 대상 거래처 전체를 판정하므로
+        같은 트랜잭션에서 대기열을 비웁니다.
+        
+        import_batch_id를 지정하면 가져오기 배치로 등록된 내역만 평가합니다. 이 경우 가져오기
+        트랜잭션의 일부로 실행되며 커밋하지 않습니다 (집계 반영 add_import_batch 전에 호출).
+        
+        Args:
+            rules: 제외 규칙 (우선순위 순)
+            vat_period: 부가세 신고기간 (None인 경우 전체 카드사용내역)
+            dirty_vendors_only: 재판정 대기 거래처의 내역만 평가할지 여부
+            import_batch_id: 가져오기 배치 ID (None인 경우 배치 구분 없음)
+        
+        Returns:
+            제외 사유가 바뀐 건수
+        """
+        table = CardTransaction.__table__
+        transaction = table.alias('t')
+        vendor = VendorInfo.__table__.alias('v')
+        # 거래처명 규칙은 명세서의 가맹점명과 거래처정보에 등록된(수정된) 거래처명 중 하나만 일치해도 적용
+        reason = _compile_exclusion_case(rules, {
+            RULE_FIELD_VENDOR_TAX_TYPE: (vendor.c.tax_type,),
+            RULE_FIELD_VENDOR_BUSINESS_STATUS: (vendor.c.business_status,),
+            RULE_FIELD_VENDOR_NAME: (transaction.c.vendor_name, vendor.c.vendor_name),
+        })
+        
+        evaluated = select(
+            transaction.c.id,
+            reason.label('reason')
+        ).select_from(
+            transaction.outerjoin(vendor, vendor.c.id == transaction.c.vendor_id)
+        )
+        if vat_period is not None:
+            evaluated = evaluated.where(transaction.c.transaction_ymd.between(*vat_period.ymd_range))
+        if dirty_vendors_only:
+            evaluated = evaluated.where(transaction.c.vendor_id.in_(select(VendorExclusionQueue.vendor_id)))
+        if import_batch_id is not None:
+            evaluated = evaluated.where(transaction.c.import_batch_id == import_batch_id)
+        evaluated = evaluated.subquery('e')
+        
+        try:
+            result = self.session.execute(
+                update(table).values(exclusion_reason=evaluated.c.reason).where(
+                    table.c.id == evaluated.c.id,
+                    table.c.exclusion_reason.is_distinct_from(evaluated.c.reason),
+                    or_(table.c.exclusion_reason.is_(None), table.c.exclusion_reason != MANUAL_EXCLUSION_REASON)
+                )
+            )
+            if import_batch_id is not None:
+                return result.rowcount
+            if vat_period is None:
+                self.session.execute(delete(VendorExclusionQueue))
+            self.session.commit()
+            return result.rowcount
+        except Exception as e:
+            if import_batch_id is None:
+                self.session.rollback()
+            raise RuntimeError(f"부가세 공제 제외 규칙 적용 중 오류가 발생했습니다: {str(e)}")
+
+    def count_dirty_vendors(self) -> int:
+        """공제 제외 재판정 대기 거래처 수 조회"""
+        return self.session.execute(select(func.count()).select_from(VendorExclusionQueue)).scalar()
+
+    def count_exclusions(self, vat_period: Optional[VatPeriod] = None) -> Dict[str, int]:
+        """
+        제외 사유별 건수 조회
+        
+        Args:
+            vat_period: 부가세 신고기간 (None인 경우 전체 카드사용내역)
+        
+        Returns:
+            제외 사유 코드별 건수 딕셔너리 (제외 사유가 있는 내역만)
+        """
+        stmt = select(CardTransaction.exclusion_reason, func.count()).where(
+            CardTransaction.exclusion_reason.is_not(None)
+        ).group_by(CardTransaction.exclusion_reason).order_by(CardTransaction.exclusion_reason)
+        if vat_period is not None:
+            stmt = stmt.where(CardTransaction.transaction_ymd.between(*vat_period.ymd_range))
+        return {reason: count for reason, count in self.session.execute(stmt)}
+
+    def _build_conditions(
+        self,
+        card_company_id: Optional[int] = None,
+        card_id: Optional[int] = None,
+        vendor_id: Optional[int] = None,
+        transaction_date_from: Optional[str] = None,
+        transaction_date_to: Optional[str] = None,
+        vat_period: Optional[VatPeriod] = None,
+        is_cancel: Optional[bool] = None,
+        vendor_name: Optional[str] = None,
+        business_number: Optional[str] = None,
+        approval_number: Optional[str] = None,
+        import_batch_id: Optional[int] = None
+    ) -> List[Any]:
+        """검색 조건 목록 생성"""
         conditions = []
         
         if card_company_id is not None:
@@ -124,11 +544,15 @@ class CardTransactionRepository:
         if vendor_id is not None:
             conditions.append(CardTransaction.vendor_id == vendor_id)
         
+        # 거래 일자는 정수 키(transaction_ymd) 범위로 검색하고, 시각까지 지정한 경우에만 거래 일시를 함께 비교
+        # (날짜만 지정한 종료일은 그날 전체를 포함)
         if transaction_date_from:
             from datetime import datetime
             try:
                 date_from = datetime.fromisoformat(transaction_date_from.replace('Z', '+00:00'))
-                conditions.append(CardTransaction.transaction_date >= date_from)
+                conditions.append(CardTransaction.transaction_ymd >= to_ymd(date_from))
+                if len(transaction_date_from) > 10:
+                    conditions.append(CardTransaction.transaction_date >= date_from)
             except:
                 pass
         
@@ -136,10 +560,16 @@ class CardTransactionRepository:
             from datetime import datetime
             try:
                 date_to = datetime.fromisoformat(transaction_date_to.replace('Z', '+00:00'))
-                conditions.append(CardTransaction.transaction_date <= date_to)
+                conditions.append(CardTransaction.transaction_ymd <= to_ymd(date_to))
+                if len(transaction_date_to) > 10:
+                    conditions.append(CardTransaction.transaction_date <= date_to)
             except:
                 pass
         
+        # 신고기간도 거래 일자 정수 키 범위로 검색
+        if vat_period is not None:
+            conditions.append(CardTransaction.transaction_ymd.between(*vat_period.ymd_range))
+        
         if is_cancel is not None:
             conditions.append(CardTransaction.is_cancel == is_cancel)
         
@@ -152,8 +582,8 @@ class CardTransactionRepository:
         if approval_number:
             conditions.append(CardTransaction.approval_number == approval_number)
         
-        if conditions:
-            query = query.filter(and_(*conditions))
+        if import_batch_id is not None:
+            conditions.append(CardTransaction.import_batch_id == import_batch_id)
         
-        return query.order_by(CardTransaction.transaction_date.desc()).all()
+        return conditions
 
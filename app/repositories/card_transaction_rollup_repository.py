@@ -0,0 +1,222 @@
+"""
+카드사용내역 집계 Repository
+
+card_transaction_rollup 테이블(신고기간/월/카드/거래처별 건수와 금액 합계, 공제 제외 합계)의 갱신과 조회를 담당합니다.
+일반적인 등록/수정/삭제는 card_transaction 트리거가 증분으로 반영하고(card_transaction_rollup.sql),
+가져오기로 대량 등록/되돌리기되는 행은 add_import_batch()/subtract_import_batch()가
+배치 단위 집합 연산으로 한 번에 반영합니다.
+"""
+
+from typing import List, Dict, Any, Iterator, Sequence, Tuple
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+from app.repositories.schema import CardTransactionRollup, CardInfo
+
+
+# card_transaction에서 집계 행을 계산하는 SELECT (WHERE 조건은 호출 시 추가, :sign은 1 또는 -1)
+_ROLLUP_SELECT = (
+    "SELECT"
+    "  vat_period, transaction_ymd / 100,"
+    "  COALESCE(card_id, 0), COALESCE(vendor_id, 0), COALESCE(business_number, ''),"
+    "  :sign * COUNT(*), :sign * SUM(is_cancel),"
+    "  :sign * SUM(CASE WHEN is_cancel THEN -ABS(COALESCE(amount_won, 0)) ELSE COALESCE(amount_won, 0) END),"
+    "  :sign * SUM(CASE WHEN is_cancel THEN -ABS(COALESCE(supply_amount_won, 0)) ELSE COALESCE(supply_amount_won, 0) END),"
+    "  :sign * SUM(CASE WHEN is_cancel THEN -ABS(COALESCE(vat_amount_won, 0)) ELSE COALESCE(vat_amount_won, 0) END),"
+    "  :sign * SUM(exclusion_reason IS NOT NULL),"
+    "  :sign * SUM(CASE WHEN exclusion_reason IS NULL THEN 0"
+    "    WHEN is_cancel THEN -ABS(COALESCE(supply_amount_won, 0)) ELSE COALESCE(supply_amount_won, 0) END),"
+    "  :sign * SUM(CASE WHEN exclusion_reason IS NULL THEN 0"
+    "    WHEN is_cancel THEN -ABS(COALESCE(vat_amount_won, 0)) ELSE COALESCE(vat_amount_won, 0) END) "
+    "FROM card_transaction "
+    "{where} "
+    "GROUP BY 1, 2, 3, 4, 5"
+)
+
+_ROLLUP_INSERT = (
+    "INSERT INTO card_transaction_rollup ("
+    "  vat_period, transaction_month, card_id, vendor_id, business_number,"
+    "  transaction_count, cancel_count, gross_amount_won, supply_amount_won, vat_amount_won,"
+    "  excluded_count, excluded_supply_amount_won, excluded_vat_amount_won"
+    ") "
+)
+
+# 집계 기준으로 사용할 수 있는 컬럼
+ROLLUP_GROUP_COLUMNS = ('vat_period', 'transaction_month', 'card_id', 'vendor_id', 'business_number')
+
+
+class CardTransactionRollupRepository:
+    """
+    카드사용내역 집계 Repository 클래스
+    
+    조회는 card_transaction을 읽지 않고 집계 테이블의 기본 키(신고기간 선두) 범위 검색으로 처리합니다.
+    """
+    
+    def __init__(self, session: Session):
+        """Repository 초기화"""
+        self.session = session
+    
+    def add_import_batch(self, import_batch_id: int) -> int:
+        """
+        가져오기 배치로 등록된 카드사용내역을 집계에 반영 (INSERT ... SELECT ... ON CONFLICT)
+        
+        가져오기 중(배치 상태 running)에 등록된 행은 트리거가 집계하지 않으므로 등록 직후 호출해야 합니다.
+        가져오기 트랜잭션의 일부로 실행되며 이 메서드는 커밋하지 않습니다.
+        
+        Args:
+            import_batch_id: 가져오기 배치 ID
+        
+        Returns:
+            반영된 집계 행 수
+        """
+        return self._apply_import_batch(import_batch_id, 1)
+    
+    def subtract_import_batch(self, import_batch_id: int) -> int:
+        """
+        가져오기 배치의 카드사용내역을 집계에서 차감 (배치 되돌리기 전에 호출)
+        
+        배치 상태가 undone인 행의 삭제는 트리거가 집계하지 않으므로 상태를 먼저 변경한 뒤 호출합니다.
+        되돌리기 트랜잭션의 일부로 실행되며 이 메서드는 커밋하지 않습니다.
+        
+        Args:
+            import_batch_id: 가져오기 배치 ID
+        
+        Returns:
+            반영된 집계 행 수
+        """
+        count = self._apply_import_batch(import_batch_id, -1)
+        self.session.execute(text("DELETE FROM card_transaction_rollup WHERE transaction_count = 0"))
+        return count
+    
+    def _apply_import_batch(self, import_batch_id: int, sign: int) -> int:
+        """
+        가져오기 배치의 집계를 더하거나 빼기
+        
+        Args:
+            import_batch_id: 가져오기 배치 ID
+            sign: 1 (더하기) 또는 -1 (빼기)
+        
+        Returns:
+            반영된 집계 행 수
+        """
+        result = self.session.execute(text(
+            _ROLLUP_INSERT
+            + _ROLLUP_SELECT.format(where="WHERE import_batch_id = :import_batch_id")
+            + " ON CONFLICT (vat_period, transaction_month, card_id, vendor_id, business_number) DO UPDATE SET"
+            "  transaction_count = transaction_count + excluded.transaction_count,"
+            "  cancel_count = cancel_count + excluded.cancel_count,"
+            "  gross_amount_won = gross_amount_won + excluded.gross_amount_won,"
+            "  supply_amount_won = supply_amount_won + excluded.supply_amount_won,"
+            "  vat_amount_won = vat_amount_won + excluded.vat_amount_won,"
+            "  excluded_count = excluded_count + excluded.excluded_count,"
+            "  excluded_supply_amount_won = excluded_supply_amount_won + excluded.excluded_supply_amount_won,"
+            "  excluded_vat_amount_won = excluded_vat_amount_won + excluded.excluded_vat_amount_won"
+        ), {'import_batch_id': import_batch_id, 'sign': sign})
+        return result.rowcount
+    
+    def rebuild(self) -> int:
+        """
+        집계 테이블 전체 다시 계산 (집계가 어긋난 경우 복구용)
+        
+        Returns:
+            집계 행 수
+        """
+        try:
+            self.session.execute(text("DELETE FROM card_transaction_rollup"))
+            result = self.session.execute(text(_ROLLUP_INSERT + _ROLLUP_SELECT.format(where="")), {'sign': 1})
+            self.session.commit()
+            return result.rowcount
+        except Exception as e:
+            self.session.rollback()
+            raise RuntimeError(f"카드사용내역 집계 재계산 중 오류가 발생했습니다: {str(e)}")
+    
+    def summarize(
+        self,
+        vat_period_from: int,
+        vat_period_to: int,
+        group_by: Sequence[str] = ()
+    ) -> List[Dict[str, Any]]:
+        """
+        신고기간 범위의 집계 조회
+        
+        Args:
+            vat_period_from: 시작 신고기간 코드 (연도 * 10 + 분기, 포함)
+            vat_period_to: 종료 신고기간 코드 (포함)
+            group_by: 집계 기준 컬럼 (ROLLUP_GROUP_COLUMNS 중 선택, 비어 있으면 전체 합계 한 행)
+        
+        Returns:
+            집계 기준 컬럼과 transaction_count, cancel_count, gross_amount_won,
+            supply_amount_won, vat_amount_won, excluded_count, excluded_supply_amount_won,
+            excluded_vat_amount_won을 키로 하는 딕셔너리 리스트 (집계 기준 순, 제외 금액은 합계에 포함)
+        
+        Raises:
+            ValueError: 지원하지 않는 집계 기준인 경우
+        """
+        invalid = [column for column in group_by if column not in ROLLUP_GROUP_COLUMNS]
+        if invalid:
+            raise ValueError(f"지원하지 않는 집계 기준입니다: {', '.join(invalid)}")
+        
+        table = CardTransactionRollup.__table__
+        group_columns = [table.c[column] for column in group_by]
+        stmt = select(
+            *group_columns,
+            func.coalesce(func.sum(table.c.transaction_count), 0).label('transaction_count'),
+            func.coalesce(func.sum(table.c.cancel_count), 0).label('cancel_count'),
+            func.coalesce(func.sum(table.c.gross_amount_won), 0).label('gross_amount_won'),
+            func.coalesce(func.sum(table.c.supply_amount_won), 0).label('supply_amount_won'),
+            func.coalesce(func.sum(table.c.vat_amount_won), 0).label('vat_amount_won'),
+            func.coalesce(func.sum(table.c.excluded_count), 0).label('excluded_count'),
+            func.coalesce(func.sum(table.c.excluded_supply_amount_won), 0).label('excluded_supply_amount_won'),
+            func.coalesce(func.sum(table.c.excluded_vat_amount_won), 0).label('excluded_vat_amount_won')
+        ).where(table.c.vat_period.between(vat_period_from, vat_period_to))
+        if group_columns:
+            stmt = stmt.group_by(*group_columns).order_by(*group_columns)
+        
+        return [dict(row._mapping) for row in self.session.execute(stmt)]
+    
+    def iter_card_vendor_totals(
+        self,
+        vat_period_from: int,
+        vat_period_to: int,
+        chunk_size: int = 2000
+    ) -> Iterator[Tuple[int, str, str, int, int, int]]:
+        """
+        신고기간 범위의 카드/가맹점(사업자등록번호)별 합계를 커서로 순회 (전산매체 작성용)
+        
+        결과를 리스트로 만들지 않고 chunk_size 행씩 가져오므로 메모리 사용량이 행 수와 무관합니다.
+        공제 제외 사유가 있는 내역은 건수와 금액에서 뺍니다.
+        카드 미매칭(card_id 0), 사업자등록번호가 없는 행, 공제 대상 순 금액이 0인 조합(전액 취소/제외)은 제외합니다.
+        
+        Args:
+            vat_period_from: 시작 신고기간 코드 (포함)
+            vat_period_to: 종료 신고기간 코드 (포함)
+            chunk_size: 한 번에 가져올 행 수
+        
+        Returns:
+            (card_id, 암호화된 카드번호, 사업자등록번호, 건수, 공급가액, 세액) 튜플 이터레이터
+            (card_id, 사업자등록번호 순)
+        """
+        table = CardTransactionRollup.__table__
+        stmt = select(
+            table.c.card_id,
+            CardInfo.card_number,
+            table.c.business_number,
+            func.sum(table.c.transaction_count - table.c.excluded_count),
+            func.sum(table.c.supply_amount_won - table.c.excluded_supply_amount_won),
+            func.sum(table.c.vat_amount_won - table.c.excluded_vat_amount_won)
+        ).join(
+            CardInfo, CardInfo.id == table.c.card_id
+        ).where(
+            table.c.vat_period.between(vat_period_from, vat_period_to),
+            table.c.business_number != ''
+        ).group_by(
+            table.c.card_id, table.c.business_number
+        ).having(
+            func.sum(
+                table.c.gross_amount_won - table.c.excluded_supply_amount_won - table.c.excluded_vat_amount_won
+            ) != 0
+        ).order_by(
+            table.c.card_id, table.c.business_number
+        ).execution_options(yield_per=chunk_size)
+        
+        for row in self.session.execute(stmt):
+            yield tuple(row)
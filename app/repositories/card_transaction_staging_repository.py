@@ -0,0 +1,225 @@
+"""
+카드사용내역 가져오기 스테이징 Repository
+
+가져온 행을 임시 테이블에 한 번에 적재한 뒤 거래처 등록/매칭, 검증, 중복 제외를
+집합 단위 SQL로 처리하고 INSERT ... SELECT로 card_transaction에 등록합니다.
+등록 전 기존 내역과의 비교(신규/기존/충돌)도 같은 임시 테이블에서 조인으로 계산합니다.
+"""
+
+from typing import List, Dict, Any, Tuple
+from sqlalchemy import (
+    Table, MetaData, Column, Integer, String, Boolean, DateTime, insert, text
+)
+from sqlalchemy.orm import Session
+
+
+# 스테이징 임시 테이블 정의 (연결별로 존재하며 다른 연결에서는 보이지 않음)
+_staging_metadata = MetaData()
+card_transaction_staging = Table(
+    'card_transaction_staging',
+    _staging_metadata,
+    Column('row_no', Integer, primary_key=True),
+    Column('card_company_id', Integer),
+    Column('transaction_date', DateTime),
+    Column('masked_card_number', String(50)),
+    Column('is_cancel', Boolean),
+    # 원 단위 정수 금액 (card_transaction.amount_won)
+    Column('amount', Integer),
+    Column('vendor_name', String(255)),
+    Column('business_number', String(10)),
+    Column('approval_number', String(50)),
+    Column('card_id', Integer),
+    Column('vendor_id', Integer),
+    prefixes=['TEMPORARY']
+)
+
+# 등록 가능한 스테이징 행 조건 (필수 항목)
+_VALID_ROW_CONDITION = (
+    "card_company_id IS NOT NULL AND transaction_date IS NOT NULL AND amount IS NOT NULL"
+)
+
+# 중복 판별 키 (카드사, 거래 일시, 승인번호, 금액(원), 취소 여부)
+_DUPLICATE_KEY_COLUMNS = "card_company_id, transaction_date, approval_number, amount, is_cancel"
+
+# 기존 카드사용내역과 같은 행 조인 조건 (중복 판별 키 일치)
+_EXISTING_JOIN_CONDITION = (
+    "t.card_company_id = s.card_company_id"
+    " AND t.transaction_date = s.transaction_date"
+    " AND t.approval_number IS s.approval_number"
+    " AND t.amount_won = s.amount"
+    " AND t.is_cancel = s.is_cancel"
+)
+
+# 등록 전 비교 결과 상태
+DIFF_STATUS_NEW = 'new'
+DIFF_STATUS_EXISTING = 'existing'
+DIFF_STATUS_CONFLICT = 'conflict'
+DIFF_STATUS_INVALID = 'invalid'
+
+
+class CardTransactionStagingRepository:
+    """
+    카드사용내역 가져오기 스테이징 Repository 클래스
+    
+    모든 작업은 같은 세션(연결)의 하나의 트랜잭션에서 실행되며 이 Repository는 커밋하지 않습니다.
+    호출자가 가져오기 배치 상태와 함께 커밋하고, 실패 시 세션이 롤백합니다.
+    """
+    
+    def __init__(self, session: Session):
+        """Repository 초기화"""
+        self.session = session
+    
+    def create(self) -> None:
+        """스테이징 임시 테이블 생성 (이전 가져오기에서 남은 테이블은 삭제)"""
+        connection = self.session.connection()
+        card_transaction_staging.drop(connection, checkfirst=True)
+        card_transaction_staging.create(connection)
+    
+    def drop(self) -> None:
+        """스테이징 임시 테이블 삭제"""
+        card_transaction_staging.drop(self.session.connection(), checkfirst=True)
+    
+    def load(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        스테이징 테이블에 일괄 적재 (Core INSERT executemany)
+        
+        Args:
+            rows: card_transaction_staging 컬럼명을 키로 하는 행 리스트
+        
+        Returns:
+            적재된 건수
+        """
+        if rows:
+            self.session.execute(insert(card_transaction_staging), rows)
+        return len(rows)
+    
+    def register_vendors(self) -> int:
+        """
+        스테이징의 사업자등록번호 중 거래처정보에 없는 번호를 거래처로 등록
+        
+        사업자등록번호별로 한 번만 등록하며 거래처명은 카드사용내역의 가맹점명을 사용합니다.
+        이미 있는 거래처는 변경하지 않습니다 (ON CONFLICT(business_number) DO NOTHING).
+        
+        Returns:
+            새로 등록된 거래처 수
+        """
+        result = self.session.execute(text(
+            "INSERT INTO vendor_info (business_number, vendor_name, created_at, updated_at) "
+            "SELECT business_number, COALESCE(MAX(vendor_name), business_number),"
+            "  CURRENT_TIMESTAMP, CURRENT_TIMESTAMP "
+            "FROM card_transaction_staging "
+            "WHERE business_number IS NOT NULL "
+            "GROUP BY business_number "
+            "ON CONFLICT(business_number) DO NOTHING"
+        ))
+        return result.rowcount
+    
+    def resolve_vendor_ids(self) -> int:
+        """
+        사업자등록번호로 vendor_id 채우기 (UPDATE ... FROM, vendor_info.business_number UNIQUE 인덱스 사용)
+        
+        Returns:
+            vendor_id가 채워진 건수
+        """
+        result = self.session.execute(text(
+            "UPDATE card_transaction_staging SET vendor_id = v.id "
+            "FROM vendor_info v "
+            "WHERE v.business_number = card_transaction_staging.business_number "
+            "AND card_transaction_staging.vendor_id IS NULL"
+        ))
+        return result.rowcount
+    
+    def count_invalid(self) -> int:
+        """필수 항목이 없어 등록할 수 없는 행 수"""
+        return self.session.execute(text(
+            f"SELECT COUNT(*) FROM card_transaction_staging WHERE NOT ({_VALID_ROW_CONDITION})"
+        )).scalar()
+    
+    def insert_transactions(self, import_batch_id: int) -> int:
+        """
+        스테이징 행을 card_transaction에 등록 (INSERT ... SELECT)
+        
+        공급가액/부가세는 등록 시 함께 계산합니다 (app/utils/amount.py split_vat()와 같은 규칙).
+        필수 항목이 없는 행, 같은 가져오기 안의 중복 행(첫 행만 등록),
+        이미 등록된 카드사용내역과 같은 행은 제외합니다.
+        기존 내역 확인은 idx_card_transaction_company_date 인덱스를 사용합니다.
+        
+        Args:
+            import_batch_id: 가져오기 배치 ID
+        
+        Returns:
+            등록된 건수
+        """
+        result = self.session.execute(text(
+            "INSERT INTO card_transaction ("
+            "  card_company_id, transaction_date, masked_card_number, is_cancel,"
+            "  amount, amount_won, supply_amount_won, vat_amount_won,"
+            "  vendor_name, business_number, approval_number, card_id, vendor_id, import_batch_id,"
+            "  created_at, updated_at"
+            ") "
+            "SELECT"
+            "  s.card_company_id, s.transaction_date, s.masked_card_number, s.is_cancel,"
+            "  s.amount, s.amount, s.amount - s.amount / 11, s.amount / 11,"
+            "  s.vendor_name, s.business_number, s.approval_number, s.card_id, s.vendor_id,"
+            "  :import_batch_id, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP "
+            "FROM card_transaction_staging s "
+            "WHERE s.row_no IN ("
+            f"  SELECT MIN(row_no) FROM card_transaction_staging WHERE {_VALID_ROW_CONDITION}"
+            f"  GROUP BY {_DUPLICATE_KEY_COLUMNS}"
+            ") "
+            f"AND NOT EXISTS (SELECT 1 FROM card_transaction t WHERE {_EXISTING_JOIN_CONDITION}) "
+            "ORDER BY s.row_no"
+        ), {'import_batch_id': import_batch_id})
+        return result.rowcount
+    
+    def classify_rows(self) -> Tuple[Dict[int, str], Dict[int, int]]:
+        """
+        스테이징 행을 기존 카드사용내역과 비교하여 분류
+        
+        행마다 조회하지 않고 임시 테이블과 card_transaction의 조인 세 번으로 계산합니다.
+        - invalid: 필수 항목이 없는 행
+        - existing: 중복 판별 키가 같은 내역이 이미 있는 행 (idx_card_transaction_company_date 사용)
+        - conflict: 기존 내역은 없지만 같은 카드사/승인번호/취소 여부에 금액이 다른 내역이 있는 행
+          (idx_card_transaction_approval_number 사용)
+        - new: 나머지 행
+        
+        Returns:
+            ({row_no: 상태}, {충돌 row_no: 기존 내역 금액(원)})
+        """
+        statuses = {
+            row_no: DIFF_STATUS_NEW
+            for row_no in self.session.execute(text(
+                "SELECT row_no FROM card_transaction_staging"
+            )).scalars()
+        }
+        
+        conflicts: Dict[int, int] = {}
+        for row_no, existing_amount in self.session.execute(text(
+            "SELECT s.row_no, MIN(t.amount_won) "
+            "FROM card_transaction_staging s "
+            "JOIN card_transaction t"
+            "  ON t.approval_number = s.approval_number"
+            "  AND t.card_company_id = s.card_company_id"
+            "  AND t.is_cancel = s.is_cancel"
+            "  AND t.amount_won <> s.amount "
+            "GROUP BY s.row_no"
+        )):
+            statuses[row_no] = DIFF_STATUS_CONFLICT
+            conflicts[row_no] = existing_amount
+        
+        # 같은 내역이 이미 있으면 승인번호 충돌보다 우선
+        for row_no in self.session.execute(text(
+            "SELECT DISTINCT s.row_no "
+            "FROM card_transaction_staging s "
+            f"JOIN card_transaction t ON {_EXISTING_JOIN_CONDITION}"
+        )).scalars():
+            statuses[row_no] = DIFF_STATUS_EXISTING
+            conflicts.pop(row_no, None)
+        
+        for row_no in self.session.execute(text(
+            f"SELECT row_no FROM card_transaction_staging WHERE NOT ({_VALID_ROW_CONDITION})"
+        )).scalars():
+            statuses[row_no] = DIFF_STATUS_INVALID
+            conflicts.pop(row_no, None)
+        
+        return statuses, conflicts
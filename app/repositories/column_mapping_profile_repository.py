@@ -0,0 +1,104 @@
+"""
+컬럼 매핑 프로파일 Repository
+
+column_mapping_profile 테이블에 대한 조회/저장 작업을 담당합니다.
+"""
+
+import json
+from datetime import datetime
+from typing import List, Optional, Dict
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from app.repositories.schema import ColumnMappingProfile
+
+
+class ColumnMappingProfileRepository:
+    """
+    컬럼 매핑 프로파일 Repository 클래스
+    
+    카드사별 엑셀 헤더 서명과 컬럼 매핑을 관리합니다.
+    """
+    
+    def __init__(self, session: Session):
+        """Repository 초기화"""
+        self.session = session
+    
+    def get_by_signature(self, card_company_id: int, header_signature: str) -> Optional[ColumnMappingProfile]:
+        """
+        카드사와 헤더 서명으로 프로파일 조회 (idx_column_mapping_profile_signature 사용)
+        
+        Args:
+            card_company_id: 카드사 ID
+            header_signature: 헤더 서명
+        
+        Returns:
+            ColumnMappingProfile 객체 또는 None
+        """
+        return self.session.query(ColumnMappingProfile).filter(
+            ColumnMappingProfile.card_company_id == card_company_id,
+            ColumnMappingProfile.header_signature == header_signature
+        ).first()
+    
+    def get_all_by_company(self, card_company_id: int) -> List[ColumnMappingProfile]:
+        """카드사별 프로파일 조회 (최근 사용순)"""
+        return self.session.query(ColumnMappingProfile).filter(
+            ColumnMappingProfile.card_company_id == card_company_id
+        ).order_by(ColumnMappingProfile.last_used_at.desc()).all()
+    
+    def get_company_ids_by_signature(self, header_signature: str) -> List[int]:
+        """헤더 서명이 같은 프로파일을 가진 카드사 ID 목록 조회"""
+        rows = self.session.query(ColumnMappingProfile.card_company_id).filter(
+            ColumnMappingProfile.header_signature == header_signature
+        ).distinct().all()
+        return [row[0] for row in rows]
+    
+    def save(
+        self,
+        card_company_id: int,
+        header_signature: str,
+        headers: List[str],
+        column_mapping: Dict[str, str]
+    ) -> ColumnMappingProfile:
+        """
+        프로파일 저장 (같은 헤더 서명이 있으면 매핑을 교체)
+        
+        Args:
+            card_company_id: 카드사 ID
+            header_signature: 헤더 서명
+            headers: 정규화된 헤더 목록
+            column_mapping: 컬럼 매핑 {내부컬럼명: 엑셀컬럼명}
+        
+        Returns:
+            저장된 ColumnMappingProfile 객체
+        """
+        try:
+            entity = self.get_by_signature(card_company_id, header_signature)
+            if entity is None:
+                entity = ColumnMappingProfile.from_dict({
+                    'card_company_id': card_company_id,
+                    'header_signature': header_signature,
+                    'headers': headers,
+                    'column_mapping': column_mapping,
+                })
+                self.session.add(entity)
+            else:
+                entity.column_mapping = json.dumps(column_mapping, ensure_ascii=False)
+            self.session.commit()
+            self.session.refresh(entity)
+            return entity
+        except IntegrityError as e:
+            self.session.rollback()
+            error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
+            raise ValueError(f"컬럼 매핑 프로파일 저장 중 제약조건 위반이 발생했습니다: {error_msg}")
+        except Exception as e:
+            self.session.rollback()
+            raise RuntimeError(f"컬럼 매핑 프로파일 저장 중 오류가 발생했습니다: {str(e)}")
+    
+    def touch(self, entity_id: int) -> None:
+        """프로파일 사용 기록 (사용 횟수 증가, 최종 사용 시간 갱신)"""
+        entity = self.session.get(ColumnMappingProfile, entity_id)
+        if not entity:
+            return
+        entity.use_count = (entity.use_count or 0) + 1
+        entity.last_used_at = datetime.now()
+        self.session.commit()
@@ -5,14 +5,25 @@ SQLite 데이터베이스를 초기화하고 테이블을 생성합니다.
 """
 
 import os
+import re
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
-from app.repositories.schema import Base, BusinessInfo, CardCompanyInfo, CardInfo, CommonCode, VendorInfo, CardTransaction
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session, sessionmaker
+from app.repositories.schema import Base, BusinessInfo, CardCompanyInfo, CardInfo, CommonCode, VendorInfo, ColumnMappingProfile, ImportBatch, CardTransaction
 from app.config.settings import settings
 
 
+# 마이그레이션 SQL 파일 디렉토리 (파일명 형식: 0001_설명.sql)
+MIGRATIONS_DIR = Path(__file__).parent / "sql" / "migrations"
+MIGRATION_FILE_PATTERN = re.compile(r"^(\d{4})_.+\.sql$")
+
+# 트랜잭션 밖에서 실행해야 하는 마이그레이션 표시 (VACUUM 등). 파일 첫 줄에 기재
+NO_TRANSACTION_MARKER = "-- migration: no-transaction"
+
+
 class DatabaseInitializer:
     """
     데이터베이스 초기화 클래스
@@ -64,9 +75,11 @@ class DatabaseInitializer:
         )
         
         # 세션 팩토리 생성
+        # 세션은 작업 단위로 생성/종료되므로 커밋 후에도 반환된 객체를 읽을 수 있도록 만료하지 않음
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
+            expire_on_commit=False,
             bind=self.engine
         )
     
@@ -107,24 +120,122 @@ class DatabaseInitializer:
         with self.engine.connect() as connection:
             # 트리거는 별도로 처리 (세미콜론 분리 시 문제 발생)
             if 'CREATE TRIGGER' in sql_content:
-                # 트리거 부분을 별도로 추출
+                # 트리거 부분을 별도로 추출 (트리거가 여러 개인 경우 하나씩 실행)
                 trigger_start = sql_content.find('CREATE TRIGGER')
                 if trigger_start != -1:
                     trigger_sql = sql_content[trigger_start:].strip()
-                    connection.execute(text(trigger_sql))
+                    for trigger_statement in re.split(r'(?=CREATE TRIGGER)', trigger_sql):
+                        if trigger_statement.strip():
+                            connection.execute(text(trigger_statement.strip()))
             
             # 나머지 SQL 문장들 실행
             sql_without_trigger = sql_content[:sql_content.find('CREATE TRIGGER')] if 'CREATE TRIGGER' in sql_content else sql_content
             sql_statements = [stmt.strip() for stmt in sql_without_trigger.split(';') if stmt.strip()]
             
             for statement in sql_statements:
-                if statement and not statement.startswith('--'):
+                # 주석 줄만 있는 문장은 제외 (문장 앞에 붙은 설명 주석은 SQLite가 무시)
+                code_lines = [
+                    line for line in statement.splitlines()
+                    if line.strip() and not line.strip().startswith('--')
+                ]
+                if code_lines:
                     connection.execute(text(statement))
             
             connection.commit()
         
         print(f"SQL 파일이 성공적으로 실행되었습니다: {sql_file_path}")
     
+    def enable_incremental_vacuum(self) -> None:
+        """
+        증분 VACUUM 모드 설정
+        
+        빈 데이터베이스에 PRAGMA auto_vacuum = INCREMENTAL을 설정하여
+        삭제로 생긴 빈 페이지를 PRAGMA incremental_vacuum으로 반환할 수 있게 합니다.
+        """
+        if not self.engine:
+            raise RuntimeError("엔진이 초기화되지 않았습니다. create_engine()을 먼저 호출하세요.")
+        
+        with self.engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+    
+    def is_new_database(self) -> bool:
+        """
+        신규 데이터베이스 여부 확인
+        
+        애플리케이션 테이블이 하나도 없으면 신규 데이터베이스로 판단합니다.
+        
+        Returns:
+            신규 데이터베이스 여부
+        """
+        if not self.engine:
+            raise RuntimeError("엔진이 초기화되지 않았습니다. create_engine()을 먼저 호출하세요.")
+        
+        existing_tables = set(inspect(self.engine).get_table_names())
+        return not (existing_tables & set(Base.metadata.tables.keys()))
+    
+    def get_migrations(self) -> List[Tuple[int, Path]]:
+        """
+        마이그레이션 파일 목록 반환
+        
+        Returns:
+            (버전, 파일 경로) 튜플 리스트 (버전 오름차순)
+        """
+        migrations = []
+        if MIGRATIONS_DIR.exists():
+            for sql_file in MIGRATIONS_DIR.iterdir():
+                match = MIGRATION_FILE_PATTERN.match(sql_file.name)
+                if match:
+                    migrations.append((int(match.group(1)), sql_file))
+        return sorted(migrations)
+    
+    def apply_migrations(self, is_new_database: bool = False) -> None:
+        """
+        마이그레이션 적용
+        
+        PRAGMA user_version에 기록된 버전보다 높은 마이그레이션 파일을 순서대로 실행합니다.
+        신규 데이터베이스는 ORM 스키마와 SQL 스크립트가 이미 최신 상태이므로 버전만 기록합니다.
+        첫 줄이 NO_TRANSACTION_MARKER인 파일은 VACUUM처럼 트랜잭션 안에서 실행할 수 없는
+        문장을 포함하므로 트랜잭션 없이 실행합니다.
+        
+        Args:
+            is_new_database: 신규 데이터베이스 여부
+        """
+        if not self.engine:
+            raise RuntimeError("엔진이 초기화되지 않았습니다. create_engine()을 먼저 호출하세요.")
+        
+        migrations = self.get_migrations()
+        latest_version = migrations[-1][0] if migrations else 0
+        
+        connection = self.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            current_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+            
+            if is_new_database:
+                cursor.execute(f"PRAGMA user_version = {latest_version}")
+                connection.commit()
+                return
+            
+            for version, sql_file in migrations:
+                if version <= current_version:
+                    continue
+                
+                sql_content = sql_file.read_text(encoding='utf-8')
+                try:
+                    if sql_content.startswith(NO_TRANSACTION_MARKER):
+                        cursor.executescript(f"{sql_content}\nPRAGMA user_version = {version};")
+                    else:
+                        # 마이그레이션 단위로 트랜잭션 처리 (버전 기록 포함)
+                        cursor.executescript(
+                            f"BEGIN;\n{sql_content}\nPRAGMA user_version = {version};\nCOMMIT;"
+                        )
+                except Exception:
+                    connection.rollback()
+                    raise
+                print(f"마이그레이션이 적용되었습니다: {sql_file.name}")
+        finally:
+            connection.close()
+    
     def initialize_database(self) -> None:
         """
         데이터베이스 전체 초기화
@@ -139,9 +250,16 @@ class DatabaseInitializer:
             print("데이터베이스 엔진이 생성되었습니다.")
             
             # 2. 테이블 생성 (SQLAlchemy 모델 기반)
+            is_new_database = self.is_new_database()
+            if is_new_database:
+                # auto_vacuum은 첫 테이블 생성 전에만 변경 가능 (기존 데이터베이스는 마이그레이션에서 설정)
+                self.enable_incremental_vacuum()
             self.create_tables()
             
-            # 3. 추가 SQL 스크립트 실행 (인덱스, 트리거 등)
+            # 3. 마이그레이션 적용 (기존 데이터베이스의 컬럼 추가, 인덱스 정리 등)
+            self.apply_migrations(is_new_database)
+            
+            # 4. 추가 SQL 스크립트 실행 (인덱스, 트리거 등)
             # business_info.sql 실행
             business_info_sql = Path(__file__).parent / "sql" / "business_info.sql"
             if business_info_sql.exists():
@@ -167,11 +285,31 @@ class DatabaseInitializer:
             if vendor_info_sql.exists():
                 self.execute_sql_file(str(vendor_info_sql))
             
+            # vendor_exclusion_queue.sql 실행
+            vendor_exclusion_queue_sql = Path(__file__).parent / "sql" / "vendor_exclusion_queue.sql"
+            if vendor_exclusion_queue_sql.exists():
+                self.execute_sql_file(str(vendor_exclusion_queue_sql))
+            
+            # column_mapping_profile.sql 실행
+            column_mapping_profile_sql = Path(__file__).parent / "sql" / "column_mapping_profile.sql"
+            if column_mapping_profile_sql.exists():
+                self.execute_sql_file(str(column_mapping_profile_sql))
+            
+            # import_batch.sql 실행
+            import_batch_sql = Path(__file__).parent / "sql" / "import_batch.sql"
+            if import_batch_sql.exists():
+                self.execute_sql_file(str(import_batch_sql))
+            
             # card_transaction.sql 실행
             card_transaction_sql = Path(__file__).parent / "sql" / "card_transaction.sql"
             if card_transaction_sql.exists():
                 self.execute_sql_file(str(card_transaction_sql))
             
+            # card_transaction_rollup.sql 실행 (card_transaction 트리거 포함)
+            card_transaction_rollup_sql = Path(__file__).parent / "sql" / "card_transaction_rollup.sql"
+            if card_transaction_rollup_sql.exists():
+                self.execute_sql_file(str(card_transaction_rollup_sql))
+            
             print("데이터베이스 초기화가 완료되었습니다!")
             
         except Exception as e:
@@ -189,6 +327,56 @@ class DatabaseInitializer:
             raise RuntimeError("세션이 초기화되지 않았습니다. initialize_database()을 먼저 호출하세요.")
         
         return self.SessionLocal()
+    
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """
+        작업 단위(Unit of Work) 세션 컨텍스트 매니저
+        
+        블록이 정상 종료되면 커밋하고, 예외가 발생하면 롤백합니다.
+        블록을 벗어나면 세션을 닫아 식별자 맵을 비우고 연결을 풀에 반환합니다.
+        
+        Yields:
+            SQLAlchemy 세션 객체
+        """
+        session = self.get_session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+
+# 데이터베이스 경로별 공유 인스턴스 (엔진/연결 풀 공유)
+_database_initializers: Dict[str, DatabaseInitializer] = {}
+_database_lock = threading.Lock()
+
+
+def get_database(database_path: Optional[str] = None) -> DatabaseInitializer:
+    """
+    공유 DatabaseInitializer 반환
+    
+    데이터베이스 경로별로 한 번만 초기화하고 엔진과 연결 풀을 서비스 간에 공유합니다.
+    
+    Args:
+        database_path: 데이터베이스 파일 경로 (None인 경우 설정에서 가져옴)
+        
+    Returns:
+        초기화된 DatabaseInitializer 인스턴스
+    """
+    if database_path is None:
+        database_path = settings.get_database_path()
+    key = str(Path(database_path).resolve())
+    
+    with _database_lock:
+        initializer = _database_initializers.get(key)
+        if initializer is None:
+            initializer = initialize_database(database_path)
+            _database_initializers[key] = initializer
+        return initializer
 
 
 def initialize_database(database_path: Optional[str] = None) -> DatabaseInitializer:
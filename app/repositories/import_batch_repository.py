@@ -0,0 +1,119 @@
+"""
+가져오기 배치 Repository
+
+import_batch 테이블에 대한 CRUD 작업과 배치 단위 되돌리기를 담당합니다.
+"""
+
+from typing import List, Optional, Dict, Any
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from app.repositories.schema import CardTransaction, ImportBatch
+from app.repositories.card_transaction_rollup_repository import CardTransactionRollupRepository
+
+
+# 가져오기 배치 상태
+IMPORT_STATUS_RUNNING = 'running'
+IMPORT_STATUS_COMPLETED = 'completed'
+IMPORT_STATUS_FAILED = 'failed'
+IMPORT_STATUS_UNDONE = 'undone'
+
+
+class ImportBatchRepository:
+    """
+    가져오기 배치 Repository 클래스
+    
+    카드사용내역 가져오기 이력을 관리합니다.
+    """
+    
+    def __init__(self, session: Session):
+        """Repository 초기화"""
+        self.session = session
+    
+    def create(self, data: Dict[str, Any]) -> ImportBatch:
+        """새로운 가져오기 배치 생성"""
+        try:
+            entity = ImportBatch(**data)
+            self.session.add(entity)
+            self.session.commit()
+            self.session.refresh(entity)
+            return entity
+        except IntegrityError as e:
+            self.session.rollback()
+            error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
+            raise ValueError(f"가져오기 배치 저장 중 제약조건 위반이 발생했습니다: {error_msg}")
+        except Exception as e:
+            self.session.rollback()
+            raise RuntimeError(f"가져오기 배치 저장 중 오류가 발생했습니다: {str(e)}")
+    
+    def get(self, entity_id: int) -> Optional[ImportBatch]:
+        """ID로 단건 조회"""
+        return self.session.get(ImportBatch, entity_id)
+    
+    def update(self, entity_id: int, update_data: Dict[str, Any]) -> Optional[ImportBatch]:
+        """가져오기 배치 수정 (건수, 상태, 종료 시간 등)"""
+        entity = self.get(entity_id)
+        if not entity:
+            return None
+        for key, value in update_data.items():
+            if hasattr(entity, key):
+                setattr(entity, key, value)
+        self.session.commit()
+        self.session.refresh(entity)
+        return entity
+    
+    def get_completed_by_hash(self, file_hash: str) -> Optional[ImportBatch]:
+        """
+        파일 해시로 가장 최근에 완료된 가져오기 배치 조회
+        
+        Args:
+            file_hash: 원본 파일 SHA-256 해시
+        
+        Returns:
+            ImportBatch 객체 또는 None
+        """
+        return self.session.query(ImportBatch).filter(
+            ImportBatch.file_hash == file_hash,
+            ImportBatch.status == IMPORT_STATUS_COMPLETED
+        ).order_by(ImportBatch.id.desc()).first()
+    
+    def get_all(self) -> List[ImportBatch]:
+        """전체 가져오기 배치 조회 (최신순)"""
+        return self.session.query(ImportBatch).order_by(ImportBatch.id.desc()).all()
+    
+    def undo(self, entity_id: int) -> int:
+        """
+        배치 되돌리기
+        
+        배치로 등록된 카드사용내역을 idx_card_transaction_import_batch_id 인덱스를 사용하는
+        단일 DELETE 문으로 삭제하고, 같은 트랜잭션에서 배치 상태를 undone으로 변경하고 집계에서 차감합니다.
+        
+        Args:
+            entity_id: 가져오기 배치 ID
+        
+        Returns:
+            삭제된 카드사용내역 건수
+        """
+        try:
+            # 외래 키 검사를 켜지 않으므로 ON DELETE SET NULL 대신 다른 배치의 취소 거래 연결을 직접 해제
+            batch_transaction_ids = select(CardTransaction.id).where(CardTransaction.import_batch_id == entity_id)
+            self.session.execute(
+                update(CardTransaction)
+                .where(CardTransaction.original_transaction_id.in_(batch_transaction_ids))
+                .values(original_transaction_id=None)
+                .execution_options(synchronize_session=False)
+            )
+            # 배치 상태를 먼저 undone으로 바꿔 삭제 트리거가 행마다 집계를 갱신하지 않게 하고, 집계는 배치 단위로 차감
+            entity = self.get(entity_id)
+            if entity:
+                entity.status = IMPORT_STATUS_UNDONE
+                self.session.flush()
+                CardTransactionRollupRepository(self.session).subtract_import_batch(entity_id)
+            result = self.session.execute(
+                delete(CardTransaction).where(CardTransaction.import_batch_id == entity_id)
+            )
+            self.session.commit()
+            return result.rowcount
+        except Exception as e:
+            self.session.rollback()
+            raise RuntimeError(f"가져오기 배치 되돌리기 중 오류가 발생했습니다: {str(e)}")
@@ -0,0 +1,382 @@
+"""
+인덱스 감사 도구
+
+sqlite_master, sqlite_stat1과 실제 조회 쿼리의 실행 계획을 분석하여
+중복되거나 사용되지 않는 인덱스를 찾아냅니다.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+
+# 실제 Repository/Service가 실행하는 대표 조회 쿼리 (이름, SQL, 바인딩 파라미터)
+INDEX_AUDIT_WORKLOAD: List[Tuple[str, str, Dict[str, object]]] = [
+    (
+        "거래 일자 범위 조회 (최신순)",
+        "SELECT * FROM card_transaction "
+        "WHERE transaction_ymd >= :ymd_from AND transaction_ymd <= :ymd_to "
+        "ORDER BY transaction_date DESC",
+        {"ymd_from": 20250101, "ymd_to": 20250630},
+    ),
+    (
+        "신고기간 취소여부별 금액 집계",
+        "SELECT is_cancel, COUNT(*), SUM(amount_won) FROM card_transaction "
+        "WHERE transaction_ymd >= :ymd_from AND transaction_ymd <= :ymd_to "
+        "GROUP BY is_cancel",
+        {"ymd_from": 20250101, "ymd_to": 20250630},
+    ),
+    (
+        "카드사별 기간 조회",
+        "SELECT * FROM card_transaction "
+        "WHERE card_company_id = :card_company_id "
+        "AND transaction_ymd >= :ymd_from AND transaction_ymd <= :ymd_to "
+        "ORDER BY transaction_date DESC",
+        {"card_company_id": 1, "ymd_from": 20250101, "ymd_to": 20250630},
+    ),
+    (
+        "카드별 기간 조회",
+        "SELECT * FROM card_transaction "
+        "WHERE card_id = :card_id "
+        "AND transaction_ymd >= :ymd_from AND transaction_ymd <= :ymd_to "
+        "ORDER BY transaction_date DESC",
+        {"card_id": 1, "ymd_from": 20250101, "ymd_to": 20250630},
+    ),
+    (
+        "거래처별 조회",
+        "SELECT * FROM card_transaction WHERE vendor_id = :vendor_id "
+        "ORDER BY transaction_date DESC",
+        {"vendor_id": 1},
+    ),
+    (
+        "사업자등록번호 조회",
+        "SELECT * FROM card_transaction WHERE business_number = :business_number "
+        "ORDER BY transaction_date DESC",
+        {"business_number": "1234567890"},
+    ),
+    (
+        "승인번호 중복 확인",
+        "SELECT id FROM card_transaction WHERE approval_number = :approval_number",
+        {"approval_number": "12345678"},
+    ),
+    (
+        "가져오기 기존 내역 중복 확인",
+        "SELECT 1 FROM card_transaction "
+        "WHERE card_company_id = :card_company_id AND transaction_date = :transaction_date "
+        "AND approval_number IS :approval_number AND amount_won = :amount AND is_cancel = :is_cancel",
+        {
+            "card_company_id": 1, "transaction_date": "2025-01-01 00:00:00.000000",
+            "approval_number": "12345678", "amount": 10000, "is_cancel": 0,
+        },
+    ),
+    (
+        "가져오기 배치 되돌리기",
+        "DELETE FROM card_transaction WHERE import_batch_id = :import_batch_id",
+        {"import_batch_id": 1},
+    ),
+    (
+        "취소거래 조회",
+        "SELECT * FROM card_transaction WHERE is_cancel = 1 "
+        "ORDER BY transaction_date DESC",
+        {},
+    ),
+    (
+        "거래처 사업자등록번호 조회",
+        "SELECT * FROM vendor_info WHERE business_number = :business_number",
+        {"business_number": "1234567890"},
+    ),
+    (
+        "거래처 과세유형/상태 조회",
+        "SELECT * FROM vendor_info WHERE tax_type = :tax_type AND business_status = :business_status",
+        {"tax_type": "01", "business_status": "01"},
+    ),
+]
+
+# EXPLAIN QUERY PLAN 결과에서 사용된 인덱스명 추출
+_PLAN_INDEX_PATTERN = re.compile(r"USING (?:COVERING )?INDEX (\S+)")
+
+# 작업 부하 쿼리가 조회하는 테이블명 추출
+_FROM_TABLE_PATTERN = re.compile(r"\bFROM\s+(\w+)", re.IGNORECASE)
+
+# 인덱스 키 하나당 평균 행 수가 전체 행의 이 비율 이상이면 선택도가 낮은 것으로 판단
+LOW_SELECTIVITY_RATIO = 0.2
+
+
+@dataclass
+class IndexInfo:
+    """인덱스 메타 정보"""
+    name: str
+    table_name: str
+    columns: List[str]
+    is_unique: bool
+    origin: str  # c: CREATE INDEX, u: UNIQUE 제약조건, pk: PRIMARY KEY
+    stat: Optional[str] = None
+
+
+@dataclass
+class IndexFinding:
+    """인덱스 감사 결과 항목"""
+    index_name: str
+    table_name: str
+    reason: str
+    covered_by: Optional[str] = None
+
+
+@dataclass
+class IndexAuditReport:
+    """인덱스 감사 결과"""
+    indexes: List[IndexInfo] = field(default_factory=list)
+    findings: List[IndexFinding] = field(default_factory=list)
+    query_plans: Dict[str, List[str]] = field(default_factory=dict)
+    used_indexes: Dict[str, List[str]] = field(default_factory=dict)
+    unused_indexes: List[str] = field(default_factory=list)
+
+
+class IndexAuditor:
+    """
+    인덱스 감사 클래스
+
+    SQLite 카탈로그와 통계, 실행 계획을 조합하여 인덱스 구성을 점검합니다.
+    """
+
+    def __init__(self, engine: Engine, workload: Optional[List[Tuple[str, str, Dict[str, object]]]] = None):
+        """
+        인덱스 감사 도구 초기화
+
+        Args:
+            engine: SQLAlchemy 엔진
+            workload: 실행 계획을 확인할 쿼리 목록 (None인 경우 INDEX_AUDIT_WORKLOAD 사용)
+        """
+        self.engine = engine
+        self.workload = workload if workload is not None else INDEX_AUDIT_WORKLOAD
+
+    def collect_indexes(self) -> List[IndexInfo]:
+        """
+        sqlite_master와 PRAGMA index_list/index_info로 인덱스 목록 수집
+
+        Returns:
+            IndexInfo 리스트
+        """
+        indexes = []
+        with self.engine.connect() as connection:
+            table_names = connection.execute(text(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+            )).scalars().all()
+            stats = self._load_stats(connection)
+
+            for table_name in table_names:
+                index_list = connection.execute(text(f"PRAGMA index_list('{table_name}')")).all()
+                for _, index_name, is_unique, origin, _ in index_list:
+                    columns = [
+                        row[2] for row in connection.execute(text(f"PRAGMA index_info('{index_name}')")).all()
+                    ]
+                    indexes.append(IndexInfo(
+                        name=index_name,
+                        table_name=table_name,
+                        columns=columns,
+                        is_unique=bool(is_unique),
+                        origin=origin,
+                        stat=stats.get(index_name),
+                    ))
+        return indexes
+
+    def _load_stats(self, connection) -> Dict[str, str]:
+        """
+        sqlite_stat1 통계 로드 (ANALYZE 이전이면 빈 딕셔너리)
+
+        Args:
+            connection: SQLAlchemy 연결
+
+        Returns:
+            {인덱스명: stat 문자열}
+        """
+        has_stat_table = connection.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        )).first()
+        if not has_stat_table:
+            return {}
+        rows = connection.execute(text("SELECT idx, stat FROM sqlite_stat1 WHERE idx IS NOT NULL")).all()
+        return {idx: stat for idx, stat in rows}
+
+    def find_redundant(self, indexes: List[IndexInfo]) -> List[IndexFinding]:
+        """
+        중복/선두 컬럼 포함/저선택도 인덱스 찾기
+
+        Args:
+            indexes: 인덱스 목록
+
+        Returns:
+            IndexFinding 리스트
+        """
+        findings = []
+        for index in indexes:
+            # 제약조건으로 생성된 인덱스는 삭제 대상이 아님
+            if index.origin != 'c':
+                continue
+
+            for other in indexes:
+                if other is index or other.table_name != index.table_name:
+                    continue
+
+                if other.columns == index.columns:
+                    # 같은 컬럼 구성: 제약조건 인덱스 또는 UNIQUE 인덱스를 우선 유지
+                    if index.is_unique and not other.is_unique:
+                        continue
+                    if other.origin != 'c' or other.is_unique or other.name < index.name:
+                        findings.append(IndexFinding(index.name, index.table_name, "중복 인덱스", other.name))
+                        break
+                elif (
+                    not index.is_unique
+                    and len(other.columns) > len(index.columns)
+                    and other.columns[:len(index.columns)] == index.columns
+                ):
+                    findings.append(IndexFinding(index.name, index.table_name, "복합 인덱스 선두 컬럼과 중복", other.name))
+                    break
+            else:
+                if self._is_low_selectivity(index):
+                    findings.append(IndexFinding(index.name, index.table_name, "선택도가 낮음 (sqlite_stat1)"))
+        return findings
+
+    def _is_low_selectivity(self, index: IndexInfo) -> bool:
+        """
+        sqlite_stat1 통계로 저선택도 인덱스 판단
+
+        stat 형식: "전체행수 첫번째컬럼당평균행수 ..."
+
+        Args:
+            index: 인덱스 정보
+
+        Returns:
+            저선택도 여부
+        """
+        if not index.stat:
+            return False
+        try:
+            parts = [int(value) for value in index.stat.split()[:2]]
+        except ValueError:
+            return False
+        if len(parts) < 2 or parts[0] == 0:
+            return False
+        total_rows, rows_per_key = parts
+        return rows_per_key / total_rows >= LOW_SELECTIVITY_RATIO
+
+    def run_workload(self) -> Dict[str, List[str]]:
+        """
+        작업 부하 쿼리의 실행 계획 수집
+
+        Returns:
+            {쿼리 이름: 실행 계획 상세 리스트}
+        """
+        plans = {}
+        with self.engine.connect() as connection:
+            for name, sql, params in self.workload:
+                rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params).all()
+                plans[name] = [row[-1] for row in rows]
+        return plans
+
+    def benchmark(self, repeat: int = 5) -> Dict[str, Tuple[int, float]]:
+        """
+        작업 부하 쿼리 실행 시간 측정
+
+        Args:
+            repeat: 쿼리별 반복 횟수
+
+        Returns:
+            {쿼리 이름: (결과 행 수, 평균 실행 시간(ms))}
+        """
+        results = {}
+        with self.engine.connect() as connection:
+            for name, sql, params in self.workload:
+                # 되돌리기 DELETE 등 변경 쿼리는 실행 계획만 확인하고 측정하지 않음
+                if not sql.lstrip().upper().startswith("SELECT"):
+                    continue
+                row_count = 0
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    row_count = len(connection.execute(text(sql), params).all())
+                elapsed_ms = (time.perf_counter() - started) * 1000 / repeat
+                results[name] = (row_count, elapsed_ms)
+        return results
+
+    def audit(self) -> IndexAuditReport:
+        """
+        인덱스 감사 수행
+
+        Returns:
+            IndexAuditReport 객체
+        """
+        report = IndexAuditReport()
+        report.indexes = self.collect_indexes()
+        report.findings = self.find_redundant(report.indexes)
+        report.query_plans = self.run_workload()
+
+        for name, details in report.query_plans.items():
+            for detail in details:
+                match = _PLAN_INDEX_PATTERN.search(detail)
+                if match:
+                    report.used_indexes.setdefault(match.group(1), []).append(name)
+
+        # 작업 부하가 조회하는 테이블의 일반 인덱스 중 실행 계획에 나타나지 않은 인덱스
+        workload_tables = {
+            table_name for _, sql, _ in self.workload for table_name in _FROM_TABLE_PATTERN.findall(sql)
+        }
+        report.unused_indexes = [
+            index.name for index in report.indexes
+            if index.origin == 'c'
+            and not index.is_unique
+            and index.table_name in workload_tables
+            and index.name not in report.used_indexes
+        ]
+        return report
+
+
+def format_report(report: IndexAuditReport) -> str:
+    """
+    감사 결과를 사람이 읽을 수 있는 문자열로 변환
+
+    Args:
+        report: 인덱스 감사 결과
+
+    Returns:
+        보고서 문자열
+    """
+    lines = ["[인덱스 목록]"]
+    for index in report.indexes:
+        unique_mark = " UNIQUE" if index.is_unique else ""
+        stat = f" stat={index.stat}" if index.stat else ""
+        lines.append(f"  {index.table_name}.{index.name}{unique_mark} ({', '.join(index.columns)}){stat}")
+
+    lines.append("")
+    lines.append("[정리 대상 인덱스]")
+    if not report.findings:
+        lines.append("  없음")
+    for finding in report.findings:
+        covered_by = f" -> {finding.covered_by}" if finding.covered_by else ""
+        lines.append(f"  {finding.table_name}.{finding.index_name}: {finding.reason}{covered_by}")
+
+    lines.append("")
+    lines.append("[쿼리별 실행 계획]")
+    for name, details in report.query_plans.items():
+        lines.append(f"  {name}")
+        for detail in details:
+            lines.append(f"    {detail}")
+
+    lines.append("")
+    lines.append("[작업 부하에서 사용되지 않은 인덱스]")
+    if not report.unused_indexes:
+        lines.append("  없음")
+    for index_name in report.unused_indexes:
+        lines.append(f"  {index_name}")
+
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # 스크립트 직접 실행 시 현재 데이터베이스의 인덱스 감사
+    from app.repositories.database import initialize_database
+
+    db_initializer = initialize_database()
+    print(format_report(IndexAuditor(db_initializer.engine).audit()))
@@ -0,0 +1,92 @@
+"""
+조회 전용 프로젝션
+
+목록 화면용 경량 행 객체를 정의합니다.
+ORM 엔티티와 to_dict() 변환 없이 필요한 컬럼만 SELECT한 결과를 담습니다.
+"""
+
+from dataclasses import dataclass, fields
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+
+class _ProjectionRow:
+    """
+    프로젝션 행 공통 기능
+
+    테이블 모델이 딕셔너리와 같은 방식(row.get)으로 읽을 수 있도록 합니다.
+    """
+
+    __slots__ = ()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        컬럼 값 반환 (dict.get 호환)
+
+        Args:
+            key: 컬럼명
+            default: 컬럼이 없는 경우 기본값
+
+        Returns:
+            컬럼 값
+        """
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        딕셔너리로 변환 (ORM to_dict()와 같은 형식)
+
+        날짜는 ISO 문자열, 금액은 float로 변환합니다.
+
+        Returns:
+            행 딕셔너리
+        """
+        result = {}
+        for column in fields(self):
+            value = getattr(self, column.name)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, Decimal):
+                value = float(value)
+            result[column.name] = value
+        return result
+
+
+@dataclass(slots=True, frozen=True)
+class CardTransactionRow(_ProjectionRow):
+    """카드사용내역 목록 행"""
+    id: int
+    card_company_id: int
+    transaction_date: datetime
+    masked_card_number: Optional[str]
+    is_cancel: bool
+    amount: Decimal
+    amount_won: Optional[int]
+    supply_amount_won: Optional[int]
+    vat_amount_won: Optional[int]
+    vendor_name: Optional[str]
+    business_number: Optional[str]
+    approval_number: Optional[str]
+    card_id: Optional[int]
+    vendor_id: Optional[int]
+    import_batch_id: Optional[int]
+    original_transaction_id: Optional[int]
+    exclusion_reason: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+@dataclass(slots=True, frozen=True)
+class VendorRow(_ProjectionRow):
+    """거래처정보 목록 행 (공통코드명 포함)"""
+    id: int
+    business_number: str
+    vendor_name: str
+    tax_type: Optional[str]
+    tax_type_name: Optional[str]
+    business_status: Optional[str]
+    business_status_name: Optional[str]
+    status_updated_at: Optional[datetime]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
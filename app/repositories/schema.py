@@ -4,12 +4,14 @@
 SQLAlchemy ORM을 사용하여 사업자정보 테이블을 정의합니다.
 """
 
+import json
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, Boolean, Numeric
+from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, Boolean, Numeric, Computed
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from app.utils.amount import to_won, split_vat
 
 Base = declarative_base()
 
@@ -385,6 +387,159 @@ class VendorInfo(Base):
         )
 
 
+class VendorExclusionQueue(Base):
+    """
+    공제 제외 재판정 대기 거래처 테이블 모델
+    
+    새로 등록되었거나 과세유형/사업자 상태/거래처명이 바뀐 거래처를 vendor_info 트리거가 기록합니다.
+    제외 규칙 평가는 이 거래처의 카드사용내역만 다시 판정한 뒤 대기열을 비웁니다.
+    """
+    __tablename__ = 'vendor_exclusion_queue'
+    
+    # 거래처 ID (FK -> vendor_info.id)
+    vendor_id = Column(Integer, ForeignKey('vendor_info.id', ondelete='CASCADE'), primary_key=True, comment='거래처 ID')
+    
+    # 기록 시간
+    queued_at = Column(DateTime, default=func.current_timestamp(), comment='기록 시간')
+
+
+class ColumnMappingProfile(Base):
+    """
+    엑셀 컬럼 매핑 프로파일 테이블 모델
+    
+    카드사별 엑셀 헤더 구성(헤더 서명)에 대한 컬럼 매핑을 저장합니다.
+    (card_company_id, header_signature) 조합은 고유합니다.
+    """
+    __tablename__ = 'column_mapping_profile'
+    
+    # 자동 생성 기본 키
+    id = Column(Integer, primary_key=True, autoincrement=True, comment='기본 키')
+    
+    # 참조: 카드사 ID (FK -> card_company_info.id)
+    card_company_id = Column(Integer, ForeignKey('card_company_info.id'), nullable=False, comment='카드사 ID')
+    
+    # 정규화된 헤더 목록의 SHA-256 해시
+    header_signature = Column(String(64), nullable=False, comment='헤더 서명')
+    
+    # 정규화된 헤더 목록 (JSON 배열)
+    headers = Column(Text, nullable=False, comment='헤더 목록(JSON)')
+    
+    # 컬럼 매핑 {내부컬럼명: 엑셀컬럼명} (JSON 객체)
+    column_mapping = Column(Text, nullable=False, comment='컬럼 매핑(JSON)')
+    
+    # 사용 횟수 및 최종 사용 시간
+    use_count = Column(Integer, default=0, nullable=False, comment='사용 횟수')
+    last_used_at = Column(DateTime, comment='최종 사용 시간')
+    
+    # 생성/수정 시각
+    created_at = Column(DateTime, default=func.current_timestamp(), comment='생성 시간')
+    updated_at = Column(
+        DateTime,
+        default=func.current_timestamp(),
+        onupdate=func.current_timestamp(),
+        comment='최종 수정 시간'
+    )
+    
+    def to_dict(self) -> dict:
+        """객체를 딕셔너리로 변환합니다."""
+        return {
+            'id': self.id,
+            'card_company_id': self.card_company_id,
+            'header_signature': self.header_signature,
+            'headers': json.loads(self.headers) if self.headers else [],
+            'column_mapping': json.loads(self.column_mapping) if self.column_mapping else {},
+            'use_count': self.use_count,
+            'last_used_at': self.last_used_at.isoformat() if self.last_used_at else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ColumnMappingProfile':
+        """딕셔너리로부터 객체를 생성합니다."""
+        return cls(
+            card_company_id=data.get('card_company_id'),
+            header_signature=data.get('header_signature'),
+            headers=json.dumps(data.get('headers') or [], ensure_ascii=False),
+            column_mapping=json.dumps(data.get('column_mapping') or {}, ensure_ascii=False),
+            use_count=data.get('use_count', 0),
+            last_used_at=data.get('last_used_at'),
+        )
+
+
+class ImportBatch(Base):
+    """
+    가져오기 배치 테이블 모델
+    
+    엑셀 파일 한 번의 가져오기(등록) 이력을 저장합니다.
+    card_transaction.import_batch_id로 배치 단위 조회/되돌리기가 가능합니다.
+    """
+    __tablename__ = 'import_batch'
+    
+    # 자동 생성 기본 키
+    id = Column(Integer, primary_key=True, autoincrement=True, comment='기본 키')
+    
+    # 참조: 카드사 ID (FK -> card_company_info.id)
+    card_company_id = Column(Integer, ForeignKey('card_company_info.id'), nullable=False, comment='카드사 ID')
+    
+    # 원본 파일 경로
+    source_file = Column(String(1024), comment='원본 파일 경로')
+    
+    # 원본 파일 SHA-256 해시
+    file_hash = Column(String(64), comment='원본 파일 해시(SHA-256)')
+    
+    # 상태 (running: 진행 중, completed: 완료, failed: 실패, undone: 되돌림)
+    status = Column(String(20), default='running', nullable=False, comment='상태')
+    
+    # 건수
+    total_rows = Column(Integer, default=0, nullable=False, comment='대상 건수')
+    inserted_rows = Column(Integer, default=0, nullable=False, comment='등록 건수')
+    failed_rows = Column(Integer, default=0, nullable=False, comment='실패 건수')
+    
+    # 소요 시간
+    started_at = Column(DateTime, comment='시작 시간')
+    finished_at = Column(DateTime, comment='종료 시간')
+    
+    # 생성 시각
+    created_at = Column(DateTime, default=func.current_timestamp(), comment='생성 시간')
+    
+    # 관계 설정
+    card_company = relationship("CardCompanyInfo", backref="import_batches")
+    
+    @property
+    def elapsed_seconds(self) -> Optional[float]:
+        """소요 시간(초)"""
+        if not self.started_at or not self.finished_at:
+            return None
+        return (self.finished_at - self.started_at).total_seconds()
+    
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        """초당 등록 건수"""
+        elapsed = self.elapsed_seconds
+        if not elapsed:
+            return None
+        return self.inserted_rows / elapsed
+    
+    def to_dict(self) -> dict:
+        """객체를 딕셔너리로 변환합니다."""
+        return {
+            'id': self.id,
+            'card_company_id': self.card_company_id,
+            'source_file': self.source_file,
+            'file_hash': self.file_hash,
+            'status': self.status,
+            'total_rows': self.total_rows,
+            'inserted_rows': self.inserted_rows,
+            'failed_rows': self.failed_rows,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'elapsed_seconds': self.elapsed_seconds,
+            'rows_per_second': self.rows_per_second,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+        }
+
+
 class CardTransaction(Base):
     """
     카드사용내역 테이블 모델
@@ -402,6 +557,37 @@ class CardTransaction(Base):
     # 거래 일자
     transaction_date = Column(DateTime, nullable=False, comment='거래 일자')
     
+    # 거래 일자 정수 키 (생성 컬럼, 저장하지 않고 거래 일자 텍스트에서 계산)
+    # 신고기간/기간 조회를 정수 범위 인덱스 검색으로 처리 (app/utils/vat_period.py와 같은 규칙)
+    transaction_ymd = Column(
+        Integer,
+        Computed(
+            "CAST(substr(transaction_date, 1, 4) || substr(transaction_date, 6, 2)"
+            " || substr(transaction_date, 9, 2) AS INTEGER)",
+            persisted=False
+        ),
+        comment='거래 일자(yyyymmdd)'
+    )
+    transaction_year = Column(
+        Integer,
+        Computed("CAST(substr(transaction_date, 1, 4) AS INTEGER)", persisted=False),
+        comment='거래 연도'
+    )
+    transaction_quarter = Column(
+        Integer,
+        Computed("(CAST(substr(transaction_date, 6, 2) AS INTEGER) + 2) / 3", persisted=False),
+        comment='거래 분기'
+    )
+    vat_period = Column(
+        Integer,
+        Computed(
+            "CAST(substr(transaction_date, 1, 4) AS INTEGER) * 10"
+            " + (CAST(substr(transaction_date, 6, 2) AS INTEGER) + 2) / 3",
+            persisted=False
+        ),
+        comment='부가세 신고기간(연도*10+분기)'
+    )
+    
     # 카드번호(마스킹)
     masked_card_number = Column(String(50), comment='카드번호(마스킹)')
     
@@ -411,6 +597,15 @@ class CardTransaction(Base):
     # 거래 금액
     amount = Column(Numeric(15, 2), nullable=False, comment='거래 금액')
     
+    # 거래 금액 (원 단위 정수, 집계는 이 컬럼으로 SUM)
+    amount_won = Column(Integer, comment='거래 금액(원)')
+    
+    # 공급가액 (원, 거래 금액 - 부가세)
+    supply_amount_won = Column(Integer, comment='공급가액(원)')
+    
+    # 부가세 (원, 거래 금액 / 11 원 미만 절사)
+    vat_amount_won = Column(Integer, comment='부가세(원)')
+    
     # 거래처명
     vendor_name = Column(String(255), comment='거래처명')
     
@@ -426,6 +621,15 @@ class CardTransaction(Base):
     # 참조: 거래처 ID (FK -> vendor_info.id)
     vendor_id = Column(Integer, ForeignKey('vendor_info.id'), comment='거래처 ID')
     
+    # 참조: 가져오기 배치 ID (FK -> import_batch.id)
+    import_batch_id = Column(Integer, ForeignKey('import_batch.id'), comment='가져오기 배치 ID')
+    
+    # 참조: 취소 거래의 원거래 ID (FK -> card_transaction.id)
+    original_transaction_id = Column(Integer, ForeignKey('card_transaction.id'), comment='원거래 ID')
+    
+    # 부가세 공제 제외 사유 코드 (NULL: 공제 대상, 규칙 코드는 app/utils/exclusion_rules.py)
+    exclusion_reason = Column(String(20), comment='공제 제외 사유')
+    
     # 생성/수정 시각
     created_at = Column(DateTime, default=func.current_timestamp(), comment='생성 시간')
     updated_at = Column(
@@ -439,6 +643,8 @@ class CardTransaction(Base):
     card_company = relationship("CardCompanyInfo", backref="transactions")
     card = relationship("CardInfo", backref="transactions")
     vendor = relationship("VendorInfo", backref="transactions")
+    import_batch = relationship("ImportBatch", backref="transactions")
+    original_transaction = relationship("CardTransaction", remote_side=[id], backref="cancellations")
     
     def to_dict(self) -> dict:
         """객체를 딕셔너리로 변환합니다."""
@@ -449,15 +655,43 @@ class CardTransaction(Base):
             'masked_card_number': self.masked_card_number,
             'is_cancel': bool(self.is_cancel) if self.is_cancel is not None else False,
             'amount': float(self.amount) if self.amount is not None else None,
+            'amount_won': self.amount_won,
+            'supply_amount_won': self.supply_amount_won,
+            'vat_amount_won': self.vat_amount_won,
             'vendor_name': self.vendor_name,
             'business_number': self.business_number,
             'approval_number': self.approval_number,
             'card_id': self.card_id,
             'vendor_id': self.vendor_id,
+            'import_batch_id': self.import_batch_id,
+            'original_transaction_id': self.original_transaction_id,
+            'exclusion_reason': self.exclusion_reason,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
     
+    @staticmethod
+    def amount_columns(amount) -> dict:
+        """
+        거래 금액으로 금액 컬럼 값 계산 (amount, amount_won, supply_amount_won, vat_amount_won)
+        
+        Args:
+            amount: 거래 금액
+        
+        Returns:
+            컬럼명을 키로 하는 딕셔너리 (amount는 그대로, 금액이 없으면 나머지는 None)
+        """
+        amount_won = to_won(amount)
+        if amount_won is None:
+            return {'amount': amount, 'amount_won': None, 'supply_amount_won': None, 'vat_amount_won': None}
+        supply_amount_won, vat_amount_won = split_vat(amount_won)
+        return {
+            'amount': amount,
+            'amount_won': amount_won,
+            'supply_amount_won': supply_amount_won,
+            'vat_amount_won': vat_amount_won,
+        }
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'CardTransaction':
         """딕셔너리로부터 객체를 생성합니다."""
@@ -474,10 +708,60 @@ class CardTransaction(Base):
             transaction_date=transaction_date,
             masked_card_number=data.get('masked_card_number'),
             is_cancel=data.get('is_cancel', False),
-            amount=data.get('amount'),
+            **cls.amount_columns(data.get('amount')),
             vendor_name=data.get('vendor_name'),
             business_number=data.get('business_number'),
             approval_number=data.get('approval_number'),
             card_id=data.get('card_id'),
             vendor_id=data.get('vendor_id'),
+            import_batch_id=data.get('import_batch_id'),
+            original_transaction_id=data.get('original_transaction_id'),
+            exclusion_reason=data.get('exclusion_reason'),
         )
+
+
+class CardTransactionRollup(Base):
+    """
+    카드사용내역 집계 테이블 모델
+    
+    (신고기간, 거래 월, 카드, 거래처, 사업자등록번호)별 건수와 금액 합계를 저장합니다.
+    card_transaction 변경 시 트리거와 가져오기 작업이 증분으로 갱신하므로
+    월/분기/신고기간 집계는 card_transaction을 다시 읽지 않고 이 테이블에서 계산합니다.
+    카드/거래처/사업자등록번호가 없는 내역은 0 또는 빈 문자열 키로 집계합니다.
+    """
+    __tablename__ = 'card_transaction_rollup'
+    __table_args__ = {'sqlite_with_rowid': False}
+    
+    # 신고기간 코드 (연도 * 10 + 분기, card_transaction.vat_period)
+    vat_period = Column(Integer, primary_key=True, comment='신고기간')
+    
+    # 거래 월 (yyyymm)
+    transaction_month = Column(Integer, primary_key=True, comment='거래 월(yyyymm)')
+    
+    # 카드 ID (0: 카드 미매칭)
+    card_id = Column(Integer, primary_key=True, default=0, comment='카드 ID')
+    
+    # 거래처 ID (0: 거래처 미매칭)
+    vendor_id = Column(Integer, primary_key=True, default=0, comment='거래처 ID')
+    
+    # 사업자등록번호 ('': 사업자등록번호 없음)
+    business_number = Column(String(10), primary_key=True, default='', comment='사업자등록번호')
+    
+    # 건수 (취소 포함) / 취소 건수
+    transaction_count = Column(Integer, default=0, nullable=False, comment='건수')
+    cancel_count = Column(Integer, default=0, nullable=False, comment='취소 건수')
+    
+    # 금액 합계 (원, 취소 금액 차감)
+    gross_amount_won = Column(Integer, default=0, nullable=False, comment='합계 금액(원)')
+    supply_amount_won = Column(Integer, default=0, nullable=False, comment='공급가액(원)')
+    vat_amount_won = Column(Integer, default=0, nullable=False, comment='부가세(원)')
+    
+    # 부가세 공제 제외 건수와 금액 합계 (제외 사유가 있는 내역, 위 합계에 포함)
+    # 마이그레이션 0007의 집계 INSERT는 이 컬럼을 지정하지 않으므로 DDL 기본값(0)이 필요
+    excluded_count = Column(Integer, default=0, server_default='0', nullable=False, comment='제외 건수')
+    excluded_supply_amount_won = Column(
+        Integer, default=0, server_default='0', nullable=False, comment='제외 공급가액(원)'
+    )
+    excluded_vat_amount_won = Column(
+        Integer, default=0, server_default='0', nullable=False, comment='제외 부가세(원)'
+    )
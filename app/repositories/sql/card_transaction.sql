@@ -12,6 +12,21 @@ CREATE TABLE IF NOT EXISTS card_transaction (
     -- 거래 일자
     transaction_date DATETIME NOT NULL,
     
+    -- 거래 일자 정수 키 (생성 컬럼, 저장하지 않음)
+    -- 신고기간 코드는 연도 * 10 + 분기 (예: 20251 = 1기 예정, 20252 = 1기 확정)
+    transaction_ymd INTEGER GENERATED ALWAYS AS (
+        CAST(substr(transaction_date, 1, 4) || substr(transaction_date, 6, 2) || substr(transaction_date, 9, 2) AS INTEGER)
+    ) VIRTUAL,
+    transaction_year INTEGER GENERATED ALWAYS AS (
+        CAST(substr(transaction_date, 1, 4) AS INTEGER)
+    ) VIRTUAL,
+    transaction_quarter INTEGER GENERATED ALWAYS AS (
+        (CAST(substr(transaction_date, 6, 2) AS INTEGER) + 2) / 3
+    ) VIRTUAL,
+    vat_period INTEGER GENERATED ALWAYS AS (
+        CAST(substr(transaction_date, 1, 4) AS INTEGER) * 10 + (CAST(substr(transaction_date, 6, 2) AS INTEGER) + 2) / 3
+    ) VIRTUAL,
+    
     -- 카드번호(마스킹)
     masked_card_number VARCHAR(50),
     
@@ -19,9 +34,18 @@ CREATE TABLE IF NOT EXISTS card_transaction (
     -- SQLite는 BOOLEAN을 직접 지원하지 않으므로 내부적으로 INTEGER로 저장됨
     is_cancel BOOLEAN DEFAULT FALSE,
     
-    -- 거래 금액 (DECIMAL -> NUMERIC 사용)
+    -- 거래 금액 (DECIMAL -> NUMERIC 사용, 호환용으로 유지)
     amount NUMERIC(15, 2) NOT NULL,
     
+    -- 거래 금액 (원 단위 정수, 집계/비교에 사용)
+    amount_won INTEGER,
+    
+    -- 공급가액 (원 단위 정수, amount_won - vat_amount_won)
+    supply_amount_won INTEGER,
+    
+    -- 부가세 (원 단위 정수, amount_won / 11 원 미만 절사)
+    vat_amount_won INTEGER,
+    
     -- 거래처명
     vendor_name VARCHAR(255),
     
@@ -37,6 +61,15 @@ CREATE TABLE IF NOT EXISTS card_transaction (
     -- 참조: 거래처 ID (FK -> vendor_info.id)
     vendor_id INTEGER,
     
+    -- 참조: 가져오기 배치 ID (FK -> import_batch.id)
+    import_batch_id INTEGER,
+    
+    -- 참조: 취소 거래의 원거래 ID (FK -> card_transaction.id, 취소 연결 작업에서 설정)
+    original_transaction_id INTEGER,
+    
+    -- 부가세 공제 제외 사유 코드 (NULL: 공제 대상, 제외 규칙 평가 또는 수동 지정으로 설정)
+    exclusion_reason VARCHAR(20),
+    
     -- 생성 시간 (기본값: 현재 시간)
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     
@@ -54,27 +87,34 @@ CREATE TABLE IF NOT EXISTS card_transaction (
     
     FOREIGN KEY (vendor_id) 
         REFERENCES vendor_info(id) 
+        ON DELETE SET NULL,
+    
+    FOREIGN KEY (import_batch_id) 
+        REFERENCES import_batch(id) 
+        ON DELETE SET NULL,
+    
+    FOREIGN KEY (original_transaction_id) 
+        REFERENCES card_transaction(id) 
         ON DELETE SET NULL
 );
 
 -- 인덱스 생성
--- 카드사 ID로 검색할 때 성능 향상을 위한 인덱스
-CREATE INDEX IF NOT EXISTS idx_card_transaction_card_company_id 
-ON card_transaction(card_company_id);
+-- 대량 등록 시 모든 보조 인덱스가 갱신되므로 조회 패턴에 필요한 인덱스만 유지
+-- (단일 컬럼 인덱스가 복합 인덱스의 선두 컬럼과 겹치는 경우 복합 인덱스로 대체)
 
--- 거래 일자로 검색/정렬할 때 성능 향상을 위한 인덱스
-CREATE INDEX IF NOT EXISTS idx_card_transaction_transaction_date 
-ON card_transaction(transaction_date);
+-- 복합 인덱스: 거래 일자(yyyymmdd)/신고기간 정수 범위 조회 및 취소여부/금액 집계
+CREATE INDEX IF NOT EXISTS idx_card_transaction_ymd_cancel_amount_won 
+ON card_transaction(transaction_ymd, is_cancel, amount_won);
 
--- 거래취소여부로 필터링할 때 성능 향상을 위한 인덱스
-CREATE INDEX IF NOT EXISTS idx_card_transaction_is_cancel 
-ON card_transaction(is_cancel);
+-- 복합 인덱스: 카드사 ID와 거래 일자 조합 검색 성능 향상 (카드사 ID 단독 검색 포함)
+CREATE INDEX IF NOT EXISTS idx_card_transaction_company_date 
+ON card_transaction(card_company_id, transaction_date);
 
--- 카드 ID로 검색할 때 성능 향상을 위한 인덱스
-CREATE INDEX IF NOT EXISTS idx_card_transaction_card_id 
-ON card_transaction(card_id);
+-- 복합 인덱스: 카드 ID와 거래 일자(yyyymmdd) 조합 검색 성능 향상 (카드 ID 단독 검색 포함)
+CREATE INDEX IF NOT EXISTS idx_card_transaction_card_ymd 
+ON card_transaction(card_id, transaction_ymd);
 
--- 거래처 ID로 검색할 때 성능 향상을 위한 인덱스
+-- 거래처 ID로 검색할 때 성능 향상을 위한 인덱스 (거래처 삭제 시 ON DELETE SET NULL 처리 포함)
 CREATE INDEX IF NOT EXISTS idx_card_transaction_vendor_id 
 ON card_transaction(vendor_id);
 
@@ -82,25 +122,22 @@ ON card_transaction(vendor_id);
 CREATE INDEX IF NOT EXISTS idx_card_transaction_business_number 
 ON card_transaction(business_number);
 
--- 승인번호로 검색할 때 성능 향상을 위한 인덱스
+-- 승인번호로 검색할 때 성능 향상을 위한 인덱스 (중복 등록 확인)
 CREATE INDEX IF NOT EXISTS idx_card_transaction_approval_number 
 ON card_transaction(approval_number);
 
--- 생성 시간으로 정렬할 때 성능 향상을 위한 인덱스
-CREATE INDEX IF NOT EXISTS idx_card_transaction_created_at 
-ON card_transaction(created_at);
-
--- 복합 인덱스: 거래 일자와 거래취소여부 조합 검색 성능 향상
-CREATE INDEX IF NOT EXISTS idx_card_transaction_date_cancel 
-ON card_transaction(transaction_date, is_cancel);
+-- 가져오기 배치 ID로 배치 단위 조회/되돌리기(DELETE)할 때 성능 향상을 위한 인덱스
+CREATE INDEX IF NOT EXISTS idx_card_transaction_import_batch_id 
+ON card_transaction(import_batch_id);
 
--- 복합 인덱스: 카드사 ID와 거래 일자 조합 검색 성능 향상
-CREATE INDEX IF NOT EXISTS idx_card_transaction_company_date 
-ON card_transaction(card_company_id, transaction_date);
+-- 원거래 ID로 취소 거래를 찾을 때(취소 차감 집계, 원거래 삭제 시 연결 해제) 성능 향상을 위한 인덱스
+CREATE INDEX IF NOT EXISTS idx_card_transaction_original_id 
+ON card_transaction(original_transaction_id);
 
--- 복합 인덱스: 카드 ID와 거래 일자 조합 검색 성능 향상
-CREATE INDEX IF NOT EXISTS idx_card_transaction_card_date 
-ON card_transaction(card_id, transaction_date);
+-- 부분 인덱스: 원거래와 연결되지 않은 취소 거래만 색인 (취소 연결 작업이 새 취소 거래만 읽도록)
+CREATE INDEX IF NOT EXISTS idx_card_transaction_unpaired_cancel 
+ON card_transaction(approval_number) 
+WHERE is_cancel = 1 AND original_transaction_id IS NULL;
 
 -- 트리거 생성: updated_at 자동 업데이트
 CREATE TRIGGER IF NOT EXISTS update_card_transaction_updated_at
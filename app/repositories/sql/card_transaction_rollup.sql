@@ -0,0 +1,193 @@
+-- 카드사용내역 집계 테이블 생성 스크립트
+-- SQLite 데이터베이스용 DDL
+
+-- 카드사용내역 집계 테이블 생성
+-- (신고기간, 거래 월, 카드, 거래처, 사업자등록번호)별 건수와 금액 합계 (취소 금액 차감)
+CREATE TABLE IF NOT EXISTS card_transaction_rollup (
+    -- 신고기간 코드 (연도 * 10 + 분기, card_transaction.vat_period)
+    vat_period INTEGER NOT NULL,
+    
+    -- 거래 월 (yyyymm)
+    transaction_month INTEGER NOT NULL,
+    
+    -- 카드 ID (0: 카드 미매칭)
+    card_id INTEGER NOT NULL DEFAULT 0,
+    
+    -- 거래처 ID (0: 거래처 미매칭)
+    vendor_id INTEGER NOT NULL DEFAULT 0,
+    
+    -- 사업자등록번호 ('': 사업자등록번호 없음)
+    business_number VARCHAR(10) NOT NULL DEFAULT '',
+    
+    -- 건수 (취소 포함) / 취소 건수
+    transaction_count INTEGER NOT NULL DEFAULT 0,
+    cancel_count INTEGER NOT NULL DEFAULT 0,
+    
+    -- 금액 합계 (원, 취소 금액 차감)
+    gross_amount_won INTEGER NOT NULL DEFAULT 0,
+    supply_amount_won INTEGER NOT NULL DEFAULT 0,
+    vat_amount_won INTEGER NOT NULL DEFAULT 0,
+    
+    -- 부가세 공제 제외 건수와 금액 합계 (card_transaction.exclusion_reason이 있는 내역, 위 합계에 포함)
+    excluded_count INTEGER NOT NULL DEFAULT 0,
+    excluded_supply_amount_won INTEGER NOT NULL DEFAULT 0,
+    excluded_vat_amount_won INTEGER NOT NULL DEFAULT 0,
+    
+    PRIMARY KEY (vat_period, transaction_month, card_id, vendor_id, business_number)
+) WITHOUT ROWID;
+
+-- 트리거 생성: card_transaction 변경 시 집계 증분 갱신
+-- 가져오기 중(배치 상태 running)에 등록/수정되는 행과 되돌리기(배치 상태 undone)로 삭제되는 행은
+-- 가져오기 작업이 배치 단위 집합 연산으로 한 번에 반영합니다
+-- (CardTransactionRollupRepository.add_import_batch/subtract_import_batch). 대량 등록/삭제 시 행마다 집계를 갱신하지 않습니다.
+CREATE TRIGGER IF NOT EXISTS card_transaction_rollup_insert
+    AFTER INSERT ON card_transaction
+    FOR EACH ROW
+    WHEN NEW.import_batch_id IS NULL
+        OR (SELECT status FROM import_batch WHERE id = NEW.import_batch_id) IS NOT 'running'
+BEGIN
+    INSERT INTO card_transaction_rollup (
+        vat_period, transaction_month, card_id, vendor_id, business_number,
+        transaction_count, cancel_count, gross_amount_won, supply_amount_won, vat_amount_won,
+        excluded_count, excluded_supply_amount_won, excluded_vat_amount_won
+    )
+    VALUES (
+        NEW.vat_period, NEW.transaction_ymd / 100,
+        COALESCE(NEW.card_id, 0), COALESCE(NEW.vendor_id, 0), COALESCE(NEW.business_number, ''),
+        1, NEW.is_cancel,
+        CASE WHEN NEW.is_cancel THEN -ABS(COALESCE(NEW.amount_won, 0)) ELSE COALESCE(NEW.amount_won, 0) END,
+        CASE WHEN NEW.is_cancel THEN -ABS(COALESCE(NEW.supply_amount_won, 0)) ELSE COALESCE(NEW.supply_amount_won, 0) END,
+        CASE WHEN NEW.is_cancel THEN -ABS(COALESCE(NEW.vat_amount_won, 0)) ELSE COALESCE(NEW.vat_amount_won, 0) END,
+        (NEW.exclusion_reason IS NOT NULL),
+        CASE WHEN NEW.exclusion_reason IS NULL THEN 0
+            WHEN NEW.is_cancel THEN -ABS(COALESCE(NEW.supply_amount_won, 0)) ELSE COALESCE(NEW.supply_amount_won, 0) END,
+        CASE WHEN NEW.exclusion_reason IS NULL THEN 0
+            WHEN NEW.is_cancel THEN -ABS(COALESCE(NEW.vat_amount_won, 0)) ELSE COALESCE(NEW.vat_amount_won, 0) END
+    )
+    ON CONFLICT (vat_period, transaction_month, card_id, vendor_id, business_number) DO UPDATE SET
+        transaction_count = transaction_count + excluded.transaction_count,
+        cancel_count = cancel_count + excluded.cancel_count,
+        gross_amount_won = gross_amount_won + excluded.gross_amount_won,
+        supply_amount_won = supply_amount_won + excluded.supply_amount_won,
+        vat_amount_won = vat_amount_won + excluded.vat_amount_won,
+        excluded_count = excluded_count + excluded.excluded_count,
+        excluded_supply_amount_won = excluded_supply_amount_won + excluded.excluded_supply_amount_won,
+        excluded_vat_amount_won = excluded_vat_amount_won + excluded.excluded_vat_amount_won;
+END;
+
+CREATE TRIGGER IF NOT EXISTS card_transaction_rollup_delete
+    AFTER DELETE ON card_transaction
+    FOR EACH ROW
+    WHEN OLD.import_batch_id IS NULL
+        OR (SELECT status FROM import_batch WHERE id = OLD.import_batch_id) IS NOT 'undone'
+BEGIN
+    INSERT INTO card_transaction_rollup (
+        vat_period, transaction_month, card_id, vendor_id, business_number,
+        transaction_count, cancel_count, gross_amount_won, supply_amount_won, vat_amount_won,
+        excluded_count, excluded_supply_amount_won, excluded_vat_amount_won
+    )
+    VALUES (
+        OLD.vat_period, OLD.transaction_ymd / 100,
+        COALESCE(OLD.card_id, 0), COALESCE(OLD.vendor_id, 0), COALESCE(OLD.business_number, ''),
+        -1, -OLD.is_cancel,
+        -CASE WHEN OLD.is_cancel THEN -ABS(COALESCE(OLD.amount_won, 0)) ELSE COALESCE(OLD.amount_won, 0) END,
+        -CASE WHEN OLD.is_cancel THEN -ABS(COALESCE(OLD.supply_amount_won, 0)) ELSE COALESCE(OLD.supply_amount_won, 0) END,
+        -CASE WHEN OLD.is_cancel THEN -ABS(COALESCE(OLD.vat_amount_won, 0)) ELSE COALESCE(OLD.vat_amount_won, 0) END,
+        -(OLD.exclusion_reason IS NOT NULL),
+        -CASE WHEN OLD.exclusion_reason IS NULL THEN 0
+            WHEN OLD.is_cancel THEN -ABS(COALESCE(OLD.supply_amount_won, 0)) ELSE COALESCE(OLD.supply_amount_won, 0) END,
+        -CASE WHEN OLD.exclusion_reason IS NULL THEN 0
+            WHEN OLD.is_cancel THEN -ABS(COALESCE(OLD.vat_amount_won, 0)) ELSE COALESCE(OLD.vat_amount_won, 0) END
+    )
+    ON CONFLICT (vat_period, transaction_month, card_id, vendor_id, business_number) DO UPDATE SET
+        transaction_count = transaction_count + excluded.transaction_count,
+        cancel_count = cancel_count + excluded.cancel_count,
+        gross_amount_won = gross_amount_won + excluded.gross_amount_won,
+        supply_amount_won = supply_amount_won + excluded.supply_amount_won,
+        vat_amount_won = vat_amount_won + excluded.vat_amount_won,
+        excluded_count = excluded_count + excluded.excluded_count,
+        excluded_supply_amount_won = excluded_supply_amount_won + excluded.excluded_supply_amount_won,
+        excluded_vat_amount_won = excluded_vat_amount_won + excluded.excluded_vat_amount_won;
+    DELETE FROM card_transaction_rollup
+    WHERE vat_period = OLD.vat_period
+        AND transaction_month = OLD.transaction_ymd / 100
+        AND card_id = COALESCE(OLD.card_id, 0)
+        AND vendor_id = COALESCE(OLD.vendor_id, 0)
+        AND business_number = COALESCE(OLD.business_number, '')
+        AND transaction_count = 0;
+END;
+
+-- 집계 키, 금액, 제외 사유가 바뀐 경우에만 실행 (updated_at, 취소 연결 등 다른 컬럼 변경은 제외)
+CREATE TRIGGER IF NOT EXISTS card_transaction_rollup_update
+    AFTER UPDATE OF transaction_date, is_cancel, amount_won, supply_amount_won, vat_amount_won,
+        card_id, vendor_id, business_number, exclusion_reason ON card_transaction
+    FOR EACH ROW
+    WHEN NEW.import_batch_id IS NULL
+        OR (SELECT status FROM import_batch WHERE id = NEW.import_batch_id) IS NOT 'running'
+BEGIN
+    INSERT INTO card_transaction_rollup (
+        vat_period, transaction_month, card_id, vendor_id, business_number,
+        transaction_count, cancel_count, gross_amount_won, supply_amount_won, vat_amount_won,
+        excluded_count, excluded_supply_amount_won, excluded_vat_amount_won
+    )
+    VALUES (
+        OLD.vat_period, OLD.transaction_ymd / 100,
+        COALESCE(OLD.card_id, 0), COALESCE(OLD.vendor_id, 0), COALESCE(OLD.business_number, ''),
+        -1, -OLD.is_cancel,
+        -CASE WHEN OLD.is_cancel THEN -ABS(COALESCE(OLD.amount_won, 0)) ELSE COALESCE(OLD.amount_won, 0) END,
+        -CASE WHEN OLD.is_cancel THEN -ABS(COALESCE(OLD.supply_amount_won, 0)) ELSE COALESCE(OLD.supply_amount_won, 0) END,
+        -CASE WHEN OLD.is_cancel THEN -ABS(COALESCE(OLD.vat_amount_won, 0)) ELSE COALESCE(OLD.vat_amount_won, 0) END,
+        -(OLD.exclusion_reason IS NOT NULL),
+        -CASE WHEN OLD.exclusion_reason IS NULL THEN 0
+            WHEN OLD.is_cancel THEN -ABS(COALESCE(OLD.supply_amount_won, 0)) ELSE COALESCE(OLD.supply_amount_won, 0) END,
+        -CASE WHEN OLD.exclusion_reason IS NULL THEN 0
+            WHEN OLD.is_cancel THEN -ABS(COALESCE(OLD.vat_amount_won, 0)) ELSE COALESCE(OLD.vat_amount_won, 0) END
+    )
+    ON CONFLICT (vat_period, transaction_month, card_id, vendor_id, business_number) DO UPDATE SET
+        transaction_count = transaction_count + excluded.transaction_count,
+        cancel_count = cancel_count + excluded.cancel_count,
+        gross_amount_won = gross_amount_won + excluded.gross_amount_won,
+        supply_amount_won = supply_amount_won + excluded.supply_amount_won,
+        vat_amount_won = vat_amount_won + excluded.vat_amount_won,
+        excluded_count = excluded_count + excluded.excluded_count,
+        excluded_supply_amount_won = excluded_supply_amount_won + excluded.excluded_supply_amount_won,
+        excluded_vat_amount_won = excluded_vat_amount_won + excluded.excluded_vat_amount_won;
+    INSERT INTO card_transaction_rollup (
+        vat_period, transaction_month, card_id, vendor_id, business_number,
+        transaction_count, cancel_count, gross_amount_won, supply_amount_won, vat_amount_won,
+        excluded_count, excluded_supply_amount_won, excluded_vat_amount_won
+    )
+    VALUES (
+        NEW.vat_period, NEW.transaction_ymd / 100,
+        COALESCE(NEW.card_id, 0), COALESCE(NEW.vendor_id, 0), COALESCE(NEW.business_number, ''),
+        1, NEW.is_cancel,
+        CASE WHEN NEW.is_cancel THEN -ABS(COALESCE(NEW.amount_won, 0)) ELSE COALESCE(NEW.amount_won, 0) END,
+        CASE WHEN NEW.is_cancel THEN -ABS(COALESCE(NEW.supply_amount_won, 0)) ELSE COALESCE(NEW.supply_amount_won, 0) END,
+        CASE WHEN NEW.is_cancel THEN -ABS(COALESCE(NEW.vat_amount_won, 0)) ELSE COALESCE(NEW.vat_amount_won, 0) END,
+        (NEW.exclusion_reason IS NOT NULL),
+        CASE WHEN NEW.exclusion_reason IS NULL THEN 0
+            WHEN NEW.is_cancel THEN -ABS(COALESCE(NEW.supply_amount_won, 0)) ELSE COALESCE(NEW.supply_amount_won, 0) END,
+        CASE WHEN NEW.exclusion_reason IS NULL THEN 0
+            WHEN NEW.is_cancel THEN -ABS(COALESCE(NEW.vat_amount_won, 0)) ELSE COALESCE(NEW.vat_amount_won, 0) END
+    )
+    ON CONFLICT (vat_period, transaction_month, card_id, vendor_id, business_number) DO UPDATE SET
+        transaction_count = transaction_count + excluded.transaction_count,
+        cancel_count = cancel_count + excluded.cancel_count,
+        gross_amount_won = gross_amount_won + excluded.gross_amount_won,
+        supply_amount_won = supply_amount_won + excluded.supply_amount_won,
+        vat_amount_won = vat_amount_won + excluded.vat_amount_won,
+        excluded_count = excluded_count + excluded.excluded_count,
+        excluded_supply_amount_won = excluded_supply_amount_won + excluded.excluded_supply_amount_won,
+        excluded_vat_amount_won = excluded_vat_amount_won + excluded.excluded_vat_amount_won;
+    DELETE FROM card_transaction_rollup
+    WHERE vat_period = OLD.vat_period
+        AND transaction_month = OLD.transaction_ymd / 100
+        AND card_id = COALESCE(OLD.card_id, 0)
+        AND vendor_id = COALESCE(OLD.vendor_id, 0)
+        AND business_number = COALESCE(OLD.business_number, '')
+        AND transaction_count = 0;
+END;
+
+-- 테이블 코멘트 (SQLite는 코멘트를 직접 지원하지 않으므로 별도 문서로 관리)
+-- 테이블명: card_transaction_rollup
+-- 설명: 신고기간/월/카드/거래처별 카드사용내역 건수와 금액 합계, 공제 제외 합계 (보고서/전산매체 조회용 집계)
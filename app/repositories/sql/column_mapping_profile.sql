@@ -0,0 +1,44 @@
+-- 컬럼 매핑 프로파일 테이블 생성 스크립트
+-- SQLite 데이터베이스용 DDL
+
+-- 컬럼 매핑 프로파일 테이블 생성
+CREATE TABLE IF NOT EXISTS column_mapping_profile (
+    -- 기본 키 (자동 증가)
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    
+    -- 참조: 카드사 ID (FK -> card_company_info.id)
+    card_company_id INTEGER NOT NULL,
+    
+    -- 정규화된 헤더 목록의 SHA-256 해시
+    header_signature VARCHAR(64) NOT NULL,
+    
+    -- 정규화된 헤더 목록 (JSON 배열)
+    headers TEXT NOT NULL,
+    
+    -- 컬럼 매핑 {내부컬럼명: 엑셀컬럼명} (JSON 객체)
+    column_mapping TEXT NOT NULL,
+    
+    -- 사용 횟수 및 최종 사용 시간
+    use_count INTEGER NOT NULL DEFAULT 0,
+    last_used_at DATETIME,
+    
+    -- 생성 시간 (기본값: 현재 시간)
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    
+    -- 최종 수정 시간 (기본값: 현재 시간)
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    
+    -- 외래 키 제약조건
+    FOREIGN KEY (card_company_id) 
+        REFERENCES card_company_info(id) 
+        ON DELETE CASCADE
+);
+
+-- 인덱스 생성
+-- 카드사별 헤더 서명은 하나의 매핑만 가지며, 매핑 조회 시 이 인덱스를 사용
+CREATE UNIQUE INDEX IF NOT EXISTS idx_column_mapping_profile_signature 
+ON column_mapping_profile(card_company_id, header_signature);
+
+-- 테이블 코멘트 (SQLite는 코멘트를 직접 지원하지 않으므로 별도 문서로 관리)
+-- 테이블명: column_mapping_profile
+-- 설명: 카드사별 엑셀 헤더 서명에 대한 컬럼 매핑 (같은 양식은 추측 없이 매핑 재사용)
@@ -0,0 +1,46 @@
+-- 가져오기 배치 테이블 생성 스크립트
+-- SQLite 데이터베이스용 DDL
+
+-- 가져오기 배치 테이블 생성
+CREATE TABLE IF NOT EXISTS import_batch (
+    -- 기본 키 (자동 증가)
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    
+    -- 참조: 카드사 ID (FK -> card_company_info.id)
+    card_company_id INTEGER NOT NULL,
+    
+    -- 원본 파일 경로
+    source_file VARCHAR(1024),
+    
+    -- 원본 파일 SHA-256 해시
+    file_hash VARCHAR(64),
+    
+    -- 상태 (running: 진행 중, completed: 완료, failed: 실패, undone: 되돌림)
+    status VARCHAR(20) NOT NULL DEFAULT 'running',
+    
+    -- 대상/등록/실패 건수
+    total_rows INTEGER NOT NULL DEFAULT 0,
+    inserted_rows INTEGER NOT NULL DEFAULT 0,
+    failed_rows INTEGER NOT NULL DEFAULT 0,
+    
+    -- 시작/종료 시간 (처리량 계산용)
+    started_at DATETIME,
+    finished_at DATETIME,
+    
+    -- 생성 시간 (기본값: 현재 시간)
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    
+    -- 외래 키 제약조건
+    FOREIGN KEY (card_company_id) 
+        REFERENCES card_company_info(id) 
+        ON DELETE RESTRICT
+);
+
+-- 인덱스 생성
+-- 파일 해시로 이전 가져오기 이력을 찾을 때 성능 향상을 위한 인덱스
+CREATE INDEX IF NOT EXISTS idx_import_batch_file_hash 
+ON import_batch(file_hash);
+
+-- 테이블 코멘트 (SQLite는 코멘트를 직접 지원하지 않으므로 별도 문서로 관리)
+-- 테이블명: import_batch
+-- 설명: 카드사용내역 가져오기 이력 (원본 파일, 해시, 카드사, 건수, 소요 시간)
@@ -0,0 +1,30 @@
+-- 마이그레이션 0001: card_transaction / vendor_info 인덱스 정리
+-- 인덱스 감사(app/repositories/index_audit.py) 결과 중복되거나 복합 인덱스의 선두 컬럼과 겹치는
+-- 인덱스, 조회에 사용되지 않는 인덱스를 삭제합니다.
+-- 대체 인덱스는 card_transaction.sql / vendor_info.sql에서 생성됩니다.
+
+-- 복합 인덱스 idx_card_transaction_company_date의 선두 컬럼과 중복
+DROP INDEX IF EXISTS idx_card_transaction_card_company_id;
+
+-- 복합 인덱스 idx_card_transaction_card_date의 선두 컬럼과 중복
+DROP INDEX IF EXISTS idx_card_transaction_card_id;
+
+-- 커버링 인덱스 idx_card_transaction_date_cancel_amount로 대체
+DROP INDEX IF EXISTS idx_card_transaction_transaction_date;
+DROP INDEX IF EXISTS idx_card_transaction_date_cancel;
+
+-- 선택도가 낮아 조회에 사용되지 않는 인덱스 (0/1 두 값)
+DROP INDEX IF EXISTS idx_card_transaction_is_cancel;
+
+-- 생성 시간 기준 조회/정렬이 없음
+DROP INDEX IF EXISTS idx_card_transaction_created_at;
+
+-- UNIQUE 제약조건의 자동 인덱스와 중복
+DROP INDEX IF EXISTS idx_vendor_info_business_number;
+
+-- 복합 인덱스 idx_vendor_info_tax_status의 선두 컬럼과 중복
+DROP INDEX IF EXISTS idx_vendor_info_tax_type;
+
+-- 컬럼 통계 갱신
+ANALYZE card_transaction;
+ANALYZE vendor_info;
@@ -0,0 +1,7 @@
+-- migration: no-transaction
+-- 마이그레이션 0002: 증분 VACUUM 모드 전환
+-- 대량 삭제 후 빈 페이지를 PRAGMA incremental_vacuum으로 반환할 수 있도록 auto_vacuum을 변경합니다.
+-- auto_vacuum 변경은 VACUUM 이후에 반영되며, VACUUM은 트랜잭션 안에서 실행할 수 없으므로
+-- 트랜잭션 없이 실행합니다. (신규 데이터베이스는 테이블 생성 전에 설정됨)
+PRAGMA auto_vacuum = INCREMENTAL;
+VACUUM;
@@ -0,0 +1,5 @@
+-- 마이그레이션 0003: 가져오기 배치 연결 컬럼 추가
+-- import_batch 테이블은 ORM 스키마(create_all)와 import_batch.sql에서 생성됩니다.
+-- 인덱스(idx_card_transaction_import_batch_id)는 card_transaction.sql에서 생성됩니다.
+-- 기존 거래는 배치 정보가 없으므로 NULL로 남습니다.
+ALTER TABLE card_transaction ADD COLUMN import_batch_id INTEGER REFERENCES import_batch(id) ON DELETE SET NULL;
@@ -0,0 +1,4 @@
+-- 마이그레이션 0004: 취소 거래의 원거래 연결 컬럼 추가
+-- 인덱스(idx_card_transaction_original_id, idx_card_transaction_unpaired_cancel)는 card_transaction.sql에서 생성됩니다.
+-- 기존 취소 거래는 NULL로 남으며 취소 연결 작업(pair_cancellations)을 실행하면 연결됩니다.
+ALTER TABLE card_transaction ADD COLUMN original_transaction_id INTEGER REFERENCES card_transaction(id) ON DELETE SET NULL;
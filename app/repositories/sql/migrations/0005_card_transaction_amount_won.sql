@@ -0,0 +1,22 @@
+-- 마이그레이션 0005: 원 단위 정수 금액 컬럼 추가 및 기존 데이터 채우기
+-- amount(NUMERIC)는 호환을 위해 유지하고, 집계/비교는 정수 컬럼(amount_won)으로 처리합니다.
+-- 부가세는 합계 / 11에서 원 미만 절사(SQLite 정수 나눗셈), 공급가액은 합계 - 부가세입니다
+-- (app/utils/amount.py split_vat()와 같은 규칙).
+-- 커버링 인덱스 idx_card_transaction_date_cancel_amount_won은 card_transaction.sql에서 생성됩니다.
+
+ALTER TABLE card_transaction ADD COLUMN amount_won INTEGER;
+ALTER TABLE card_transaction ADD COLUMN supply_amount_won INTEGER;
+ALTER TABLE card_transaction ADD COLUMN vat_amount_won INTEGER;
+
+-- 채우기 UPDATE가 모든 행의 updated_at을 바꾸지 않도록 트리거를 잠시 삭제 (card_transaction.sql에서 다시 생성)
+DROP TRIGGER IF EXISTS update_card_transaction_updated_at;
+
+UPDATE card_transaction
+SET amount_won = CAST(ROUND(amount) AS INTEGER);
+
+UPDATE card_transaction
+SET vat_amount_won = amount_won / 11,
+    supply_amount_won = amount_won - amount_won / 11;
+
+-- 금액(NUMERIC) 커버링 인덱스는 amount_won 커버링 인덱스로 대체
+DROP INDEX IF EXISTS idx_card_transaction_date_cancel_amount;
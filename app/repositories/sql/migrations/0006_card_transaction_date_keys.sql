@@ -0,0 +1,25 @@
+-- 마이그레이션 0006: 거래 일자 정수 키 생성 컬럼 추가
+-- 저장하지 않는(VIRTUAL) 생성 컬럼이므로 기존 행을 다시 쓰지 않으며 ALTER TABLE로 추가할 수 있습니다.
+-- 신고기간 코드는 연도 * 10 + 분기입니다 (app/utils/vat_period.py와 같은 규칙).
+-- 정수 키 인덱스는 card_transaction.sql에서 생성됩니다.
+
+ALTER TABLE card_transaction ADD COLUMN transaction_ymd INTEGER GENERATED ALWAYS AS (
+    CAST(substr(transaction_date, 1, 4) || substr(transaction_date, 6, 2) || substr(transaction_date, 9, 2) AS INTEGER)
+) VIRTUAL;
+
+ALTER TABLE card_transaction ADD COLUMN transaction_year INTEGER GENERATED ALWAYS AS (
+    CAST(substr(transaction_date, 1, 4) AS INTEGER)
+) VIRTUAL;
+
+ALTER TABLE card_transaction ADD COLUMN transaction_quarter INTEGER GENERATED ALWAYS AS (
+    (CAST(substr(transaction_date, 6, 2) AS INTEGER) + 2) / 3
+) VIRTUAL;
+
+ALTER TABLE card_transaction ADD COLUMN vat_period INTEGER GENERATED ALWAYS AS (
+    CAST(substr(transaction_date, 1, 4) AS INTEGER) * 10 + (CAST(substr(transaction_date, 6, 2) AS INTEGER) + 2) / 3
+) VIRTUAL;
+
+-- 거래 일자(텍스트) 인덱스는 정수 키 인덱스로 대체
+-- (idx_card_transaction_company_date는 가져오기 기존 내역 확인(거래 일시 일치)에 사용하므로 유지)
+DROP INDEX IF EXISTS idx_card_transaction_date_cancel_amount_won;
+DROP INDEX IF EXISTS idx_card_transaction_card_date;
@@ -0,0 +1,18 @@
+-- 마이그레이션 0007: 카드사용내역 집계 테이블 채우기
+-- card_transaction_rollup 테이블은 ORM 스키마(create_all)와 card_transaction_rollup.sql에서 생성됩니다.
+-- 증분 갱신 트리거는 card_transaction_rollup.sql에서 이 마이그레이션 이후에 생성되므로 기존 내역은 여기서 한 번 집계합니다.
+DELETE FROM card_transaction_rollup;
+
+INSERT INTO card_transaction_rollup (
+    vat_period, transaction_month, card_id, vendor_id, business_number,
+    transaction_count, cancel_count, gross_amount_won, supply_amount_won, vat_amount_won
+)
+SELECT
+    vat_period, transaction_ymd / 100,
+    COALESCE(card_id, 0), COALESCE(vendor_id, 0), COALESCE(business_number, ''),
+    COUNT(*), SUM(is_cancel),
+    SUM(CASE WHEN is_cancel THEN -ABS(COALESCE(amount_won, 0)) ELSE COALESCE(amount_won, 0) END),
+    SUM(CASE WHEN is_cancel THEN -ABS(COALESCE(supply_amount_won, 0)) ELSE COALESCE(supply_amount_won, 0) END),
+    SUM(CASE WHEN is_cancel THEN -ABS(COALESCE(vat_amount_won, 0)) ELSE COALESCE(vat_amount_won, 0) END)
+FROM card_transaction
+GROUP BY 1, 2, 3, 4, 5;
@@ -0,0 +1,42 @@
+-- 마이그레이션 0008: 부가세 공제 제외 사유 컬럼과 집계 테이블의 제외 건수/금액 컬럼 추가
+-- 집계 테이블은 이전 버전에서 바로 올리는 경우 ORM 스키마(create_all)가 새 컬럼으로 이미 만들었을 수 있으므로
+-- ALTER TABLE 대신 다시 만들고 채웁니다. 기존 내역은 제외 사유가 NULL(공제 대상)입니다.
+-- 집계 트리거는 제외 사유를 반영하도록 card_transaction_rollup.sql에서 이 마이그레이션 이후에 다시 생성됩니다.
+ALTER TABLE card_transaction ADD COLUMN exclusion_reason VARCHAR(20);
+
+DROP TRIGGER IF EXISTS card_transaction_rollup_insert;
+DROP TRIGGER IF EXISTS card_transaction_rollup_delete;
+DROP TRIGGER IF EXISTS card_transaction_rollup_update;
+
+DROP TABLE IF EXISTS card_transaction_rollup;
+
+CREATE TABLE card_transaction_rollup (
+    vat_period INTEGER NOT NULL,
+    transaction_month INTEGER NOT NULL,
+    card_id INTEGER NOT NULL DEFAULT 0,
+    vendor_id INTEGER NOT NULL DEFAULT 0,
+    business_number VARCHAR(10) NOT NULL DEFAULT '',
+    transaction_count INTEGER NOT NULL DEFAULT 0,
+    cancel_count INTEGER NOT NULL DEFAULT 0,
+    gross_amount_won INTEGER NOT NULL DEFAULT 0,
+    supply_amount_won INTEGER NOT NULL DEFAULT 0,
+    vat_amount_won INTEGER NOT NULL DEFAULT 0,
+    excluded_count INTEGER NOT NULL DEFAULT 0,
+    excluded_supply_amount_won INTEGER NOT NULL DEFAULT 0,
+    excluded_vat_amount_won INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (vat_period, transaction_month, card_id, vendor_id, business_number)
+) WITHOUT ROWID;
+
+INSERT INTO card_transaction_rollup (
+    vat_period, transaction_month, card_id, vendor_id, business_number,
+    transaction_count, cancel_count, gross_amount_won, supply_amount_won, vat_amount_won
+)
+SELECT
+    vat_period, transaction_ymd / 100,
+    COALESCE(card_id, 0), COALESCE(vendor_id, 0), COALESCE(business_number, ''),
+    COUNT(*), SUM(is_cancel),
+    SUM(CASE WHEN is_cancel THEN -ABS(COALESCE(amount_won, 0)) ELSE COALESCE(amount_won, 0) END),
+    SUM(CASE WHEN is_cancel THEN -ABS(COALESCE(supply_amount_won, 0)) ELSE COALESCE(supply_amount_won, 0) END),
+    SUM(CASE WHEN is_cancel THEN -ABS(COALESCE(vat_amount_won, 0)) ELSE COALESCE(vat_amount_won, 0) END)
+FROM card_transaction
+GROUP BY 1, 2, 3, 4, 5;
@@ -0,0 +1,5 @@
+-- 마이그레이션 0009: 집계 수정 트리거가 가져오기 중(배치 상태 running)인 행을 건너뛰도록 다시 생성
+-- 가져오기는 등록한 행에 공제 제외 규칙을 판정한 뒤 배치 단위로 집계에 반영하므로,
+-- 판정 시 트리거가 제외 금액을 먼저 더하면 이중으로 집계됩니다.
+-- 트리거는 card_transaction_rollup.sql에서 이 마이그레이션 이후에 다시 생성됩니다.
+DROP TRIGGER IF EXISTS card_transaction_rollup_update;
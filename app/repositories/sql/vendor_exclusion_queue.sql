@@ -0,0 +1,44 @@
+-- 공제 제외 재판정 대기 거래처 테이블 생성 스크립트
+-- SQLite 데이터베이스용 DDL
+
+-- 공제 제외 재판정 대기 거래처 테이블 생성
+-- 새로 등록되었거나 과세유형/사업자 상태/거래처명이 바뀐 거래처를 기록하고, 제외 규칙 평가가 이 거래처의 카드사용내역만
+-- 다시 판정한 뒤 비웁니다 (CardTransactionRepository.apply_exclusion_rules(dirty_vendors_only=True)).
+CREATE TABLE IF NOT EXISTS vendor_exclusion_queue (
+    -- 거래처 ID (FK -> vendor_info.id)
+    vendor_id INTEGER PRIMARY KEY,
+    
+    -- 기록 시간 (기본값: 현재 시간)
+    queued_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    
+    FOREIGN KEY (vendor_id) 
+        REFERENCES vendor_info(id) 
+        ON DELETE CASCADE
+);
+
+-- 트리거 생성: 제외 규칙에 쓰이는 거래처 정보가 바뀌면 재판정 대기열에 추가
+-- 거래처 수정(VendorService.update_vendor)과 사업자 상태 갱신 등 모든 수정 경로에서 기록됩니다.
+-- 거래처명 규칙은 카드사용내역의 가맹점명과 함께 거래처정보의 거래처명도 판정하므로 거래처명 변경도 기록합니다.
+CREATE TRIGGER IF NOT EXISTS enqueue_vendor_exclusion
+    AFTER UPDATE OF tax_type, business_status, vendor_name ON vendor_info
+    FOR EACH ROW
+    WHEN OLD.tax_type IS NOT NEW.tax_type
+        OR OLD.business_status IS NOT NEW.business_status
+        OR OLD.vendor_name IS NOT NEW.vendor_name
+BEGIN
+    INSERT OR IGNORE INTO vendor_exclusion_queue (vendor_id) VALUES (NEW.id);
+END;
+
+-- 트리거 생성: 새 거래처를 재판정 대기열에 추가
+-- 가져오기의 거래처 자동 등록(CardTransactionStagingRepository.register_vendors)처럼 일괄 INSERT로 등록된
+-- 거래처도 exclude --dirty 경로로 판정됩니다.
+CREATE TRIGGER IF NOT EXISTS enqueue_new_vendor_exclusion
+    AFTER INSERT ON vendor_info
+    FOR EACH ROW
+BEGIN
+    INSERT OR IGNORE INTO vendor_exclusion_queue (vendor_id) VALUES (NEW.id);
+END;
+
+-- 테이블 코멘트 (SQLite는 코멘트를 직접 지원하지 않으므로 별도 문서로 관리)
+-- 테이블명: vendor_exclusion_queue
+-- 설명: 공제 제외를 다시 판정해야 하는 거래처 (거래처 등록/정보 변경 시 트리거가 기록)
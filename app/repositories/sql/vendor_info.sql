@@ -29,18 +29,12 @@ CREATE TABLE IF NOT EXISTS vendor_info (
 );
 
 -- 인덱스 생성
--- 사업자등록번호로 검색할 때 성능 향상을 위한 인덱스 (UNIQUE 제약조건으로 이미 인덱스 생성됨, 하지만 명시적으로 추가)
-CREATE INDEX IF NOT EXISTS idx_vendor_info_business_number 
-ON vendor_info(business_number);
+-- 사업자등록번호 검색은 UNIQUE 제약조건의 자동 인덱스(sqlite_autoindex_vendor_info_1)를 사용
 
 -- 거래처명으로 검색할 때 성능 향상을 위한 인덱스
 CREATE INDEX IF NOT EXISTS idx_vendor_info_vendor_name 
 ON vendor_info(vendor_name);
 
--- 과세유형으로 검색할 때 성능 향상을 위한 인덱스
-CREATE INDEX IF NOT EXISTS idx_vendor_info_tax_type 
-ON vendor_info(tax_type);
-
 -- 사업자 상태로 검색할 때 성능 향상을 위한 인덱스
 CREATE INDEX IF NOT EXISTS idx_vendor_info_business_status 
 ON vendor_info(business_status);
@@ -53,7 +47,7 @@ ON vendor_info(status_updated_at);
 CREATE INDEX IF NOT EXISTS idx_vendor_info_created_at 
 ON vendor_info(created_at);
 
--- 복합 인덱스: 과세유형과 사업자 상태 조합 검색 성능 향상
+-- 복합 인덱스: 과세유형과 사업자 상태 조합 검색 성능 향상 (과세유형 단독 검색 포함)
 CREATE INDEX IF NOT EXISTS idx_vendor_info_tax_status 
 ON vendor_info(tax_type, business_status);
 
@@ -0,0 +1,64 @@
+"""
+임시 키 테이블 유틸리티
+
+수천 개 키에 대한 조회(WHERE x IN (...))를 바인딩 변수 한도(SQLITE_MAX_VARIABLE_NUMBER)와
+긴 IN 목록의 실행 계획 비용 없이 처리하기 위해, 키를 세션 연결의 임시 테이블에
+executemany로 적재하고 조인할 수 있게 합니다. 호출자가 가진 키 목록으로 대량 조회해야 할 때는
+긴 IN 목록이나 청크 반복 대신 이 방법을 사용합니다. 가져오기의 거래처 매칭(스테이징 테이블 조인),
+카드 매칭(카드사 마스킹 번호 색인), 되돌리기(배치 ID), 신고 파일 작성(집계 테이블)은 키 목록을 만들지 않습니다.
+
+사용 예:
+    with temp_key_table(session, business_numbers) as keys:
+        stmt = select(VendorInfo.business_number, VendorInfo.id).join(
+            keys, keys.c.key == VendorInfo.business_number
+        )
+        rows = session.execute(stmt).all()
+"""
+
+from contextlib import contextmanager
+from itertools import count
+from typing import Any, Iterable, Iterator
+from sqlalchemy import Table, MetaData, Column, String, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.types import TypeEngine
+
+
+# 임시 키 테이블 이름 일련번호 (중첩 사용 시에도 이름이 겹치지 않도록)
+_table_numbers = count(1)
+
+
+@contextmanager
+def temp_key_table(
+    session: Session,
+    keys: Iterable[Any],
+    key_type: TypeEngine = String()
+) -> Iterator[Table]:
+    """
+    키 목록을 담은 임시 테이블 생성 (블록이 끝나면 삭제)
+
+    키는 중복과 None을 제거한 뒤 기본 키 컬럼 key에 적재하므로 조인 시 인덱스를 사용합니다.
+    임시 테이블은 세션의 연결에만 존재하며 세션 트랜잭션 안에서 생성/삭제됩니다.
+
+    Args:
+        session: 데이터베이스 세션
+        keys: 조회할 키 목록
+        key_type: 키 컬럼 타입 (기본값: String, ID 목록은 Integer)
+
+    Yields:
+        key 컬럼 하나를 가진 임시 Table
+    """
+    table = Table(
+        f"temp_keys_{next(_table_numbers)}",
+        MetaData(),
+        Column('key', key_type, primary_key=True),
+        prefixes=['TEMPORARY']
+    )
+    connection = session.connection()
+    table.create(connection)
+    try:
+        rows = [{'key': key} for key in dict.fromkeys(keys) if key is not None]
+        if rows:
+            session.execute(insert(table), rows)
+        yield table
+    finally:
+        table.drop(session.connection(), checkfirst=True)
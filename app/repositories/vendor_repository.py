@@ -5,9 +5,11 @@ vendor_info 테이블에 대한 CRUD 작업을 담당합니다.
 """
 
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session, aliased
 from sqlalchemy.exc import IntegrityError
-from app.repositories.schema import VendorInfo
+from app.repositories.schema import CommonCode, VendorInfo
+from app.repositories.projections import VendorRow
 
 
 class VendorRepository:
@@ -81,3 +83,59 @@ class VendorRepository:
         self.session.commit()
         return True
 
+    def list_rows(
+        self,
+        business_number: Optional[str] = None,
+        vendor_name: Optional[str] = None,
+        tax_type: Optional[str] = None,
+        business_status: Optional[str] = None
+    ) -> List[VendorRow]:
+        """
+        거래처정보 목록 조회 (조회 전용 프로젝션)
+        
+        과세유형/사업자 상태 코드명은 공통코드와 LEFT JOIN하여 한 번의 쿼리로 가져옵니다.
+        
+        Args:
+            business_number: 사업자등록번호 (부분 일치)
+            vendor_name: 거래처명 (부분 일치)
+            tax_type: 과세유형
+            business_status: 사업자 상태
+        
+        Returns:
+            VendorRow 리스트
+        """
+        tax_type_code = aliased(CommonCode)
+        business_status_code = aliased(CommonCode)
+        
+        stmt = select(
+            VendorInfo.id,
+            VendorInfo.business_number,
+            VendorInfo.vendor_name,
+            VendorInfo.tax_type,
+            tax_type_code.code_name,
+            VendorInfo.business_status,
+            business_status_code.code_name,
+            VendorInfo.status_updated_at,
+            VendorInfo.created_at,
+            VendorInfo.updated_at
+        ).outerjoin(
+            tax_type_code,
+            and_(tax_type_code.code_group == 'tax_type', tax_type_code.code == VendorInfo.tax_type)
+        ).outerjoin(
+            business_status_code,
+            and_(
+                business_status_code.code_group == 'business_status',
+                business_status_code.code == VendorInfo.business_status
+            )
+        )
+        
+        if business_number:
+            stmt = stmt.where(VendorInfo.business_number.like(f"%{business_number}%"))
+        if vendor_name:
+            stmt = stmt.where(VendorInfo.vendor_name.like(f"%{vendor_name}%"))
+        if tax_type:
+            stmt = stmt.where(VendorInfo.tax_type == tax_type)
+        if business_status:
+            stmt = stmt.where(VendorInfo.business_status == business_status)
+        
+        return [VendorRow(*row) for row in self.session.execute(stmt)]
@@ -0,0 +1,193 @@
+"""
+데이터베이스 백업 서비스
+
+SQLite 온라인 백업 API(sqlite3.Connection.backup)로 실행 중에도 일관된 백업을 만들고,
+백업 파일을 보고서용 읽기 전용 스냅샷으로 제공합니다.
+"""
+
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from app.repositories.database import DatabaseInitializer, get_database
+from app.config.settings import settings
+
+
+# 백업 1단계당 복사할 페이지 수 (단계 사이에 쓰기 작업이 잠금을 얻을 수 있음)
+BACKUP_PAGES_PER_STEP = 256
+
+# 백업 단계 사이 대기 시간 (초)
+BACKUP_STEP_SLEEP = 0.005
+
+# 백업 파일명 형식: {데이터베이스명}_YYYYMMDD_HHMMSS_ffffff.db (같은 초에 만들어도 겹치지 않음)
+BACKUP_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S_%f"
+
+
+class BackupService:
+    """
+    데이터베이스 백업 서비스 클래스
+
+    페이지 단위 온라인 백업, 무결성 검사(PRAGMA quick_check), 보관 개수 순환을 담당합니다.
+    """
+
+    def __init__(
+        self,
+        database_path: Optional[str] = None,
+        backup_dir: Optional[str] = None,
+        keep_count: Optional[int] = None
+    ):
+        """
+        서비스 초기화
+
+        Args:
+            database_path: 데이터베이스 파일 경로 (None인 경우 설정에서 가져옴)
+            backup_dir: 백업 디렉토리 경로 (None인 경우 설정에서 가져옴)
+            keep_count: 보관할 백업 개수 (None인 경우 설정에서 가져옴)
+        """
+        if database_path is None:
+            database_path = settings.get_database_path()
+        self.db_initializer: DatabaseInitializer = self._initialize_database(database_path)
+        self.backup_dir = Path(backup_dir or settings.get_backup_dir_path())
+        self.keep_count = keep_count if keep_count is not None else settings.BACKUP_KEEP_COUNT
+
+    def _initialize_database(self, database_path: str) -> DatabaseInitializer:
+        """
+        데이터베이스 초기화
+
+        경로별 공유 엔진을 가져옵니다.
+
+        Args:
+            database_path: 데이터베이스 파일 경로
+
+        Returns:
+            초기화된 DatabaseInitializer 인스턴스
+        """
+        try:
+            return get_database(database_path)
+        except Exception as e:
+            raise RuntimeError(f"데이터베이스 초기화 실패: {e}")
+
+    def create_backup(self, pages: int = BACKUP_PAGES_PER_STEP) -> Path:
+        """
+        온라인 백업 생성
+
+        pages 단위로 나누어 복사하므로 백업 중에도 쓰기 작업이 오래 대기하지 않습니다.
+        복사가 끝나면 quick_check로 검증하고 오래된 백업을 정리합니다.
+
+        Args:
+            pages: 1단계당 복사할 페이지 수
+
+        Returns:
+            생성된 백업 파일 경로
+
+        Raises:
+            RuntimeError: 백업 또는 검증 실패
+        """
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        database_name = Path(self.db_initializer.database_path).stem
+        timestamp = datetime.now().strftime(BACKUP_TIMESTAMP_FORMAT)
+        backup_path = self.backup_dir / f"{database_name}_{timestamp}.db"
+
+        started = time.perf_counter()
+        source = sqlite3.connect(self.db_initializer.database_path)
+        target = sqlite3.connect(str(backup_path))
+        try:
+            source.backup(target, pages=pages, sleep=BACKUP_STEP_SLEEP)
+        except Exception as e:
+            target.close()
+            backup_path.unlink(missing_ok=True)
+            raise RuntimeError(f"백업 실패: {e}")
+        finally:
+            source.close()
+        target.close()
+
+        if not self.verify_backup(backup_path):
+            backup_path.unlink(missing_ok=True)
+            raise RuntimeError(f"백업 파일 무결성 검사 실패: {backup_path}")
+
+        elapsed = time.perf_counter() - started
+        print(
+            f"백업이 생성되었습니다: {backup_path} "
+            f"({backup_path.stat().st_size / 1024:,.0f}KB, {elapsed:.3f}초)"
+        )
+
+        self.rotate_backups()
+        return backup_path
+
+    def verify_backup(self, backup_path: Path) -> bool:
+        """
+        백업 파일 무결성 검사 (PRAGMA quick_check)
+
+        Args:
+            backup_path: 백업 파일 경로
+
+        Returns:
+            검사 통과 여부
+        """
+        try:
+            connection = sqlite3.connect(f"file:{backup_path}?mode=ro", uri=True)
+            try:
+                result = connection.execute("PRAGMA quick_check").fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return False
+        return result == [("ok",)]
+
+    def list_backups(self) -> List[Path]:
+        """
+        백업 파일 목록 반환
+
+        Returns:
+            백업 파일 경로 리스트 (최신순)
+        """
+        if not self.backup_dir.exists():
+            return []
+        database_name = Path(self.db_initializer.database_path).stem
+        # 파일명의 타임스탬프가 고정 길이이므로 이름 역순이 최신순
+        return sorted(self.backup_dir.glob(f"{database_name}_*.db"), reverse=True)
+
+    def rotate_backups(self) -> List[Path]:
+        """
+        보관 개수를 초과한 오래된 백업 삭제
+
+        Returns:
+            삭제된 백업 파일 경로 리스트
+        """
+        removed = self.list_backups()[self.keep_count:]
+        for backup_path in removed:
+            backup_path.unlink(missing_ok=True)
+            print(f"오래된 백업이 삭제되었습니다: {backup_path}")
+        return removed
+
+    @contextmanager
+    def open_snapshot(self, backup_path: Optional[Path] = None) -> Iterator[Session]:
+        """
+        읽기 전용 스냅샷 세션 컨텍스트 매니저
+
+        장시간 실행되는 보고서가 운영 데이터베이스의 잠금이나 동시 수정의 영향을 받지 않도록
+        백업 파일을 읽기 전용으로 엽니다. Repository에 그대로 전달할 수 있습니다.
+
+        Args:
+            backup_path: 사용할 백업 파일 (None인 경우 새 백업 생성)
+
+        Yields:
+            읽기 전용 SQLAlchemy 세션
+        """
+        if backup_path is None:
+            backup_path = self.create_backup()
+
+        engine = create_engine(
+            f"sqlite:///file:{Path(backup_path).resolve()}?mode=ro&uri=true",
+            connect_args={"check_same_thread": False}
+        )
+        session = sessionmaker(bind=engine, autoflush=False)()
+        try:
+            yield session
+        finally:
+            session.close()
+            engine.dispose()
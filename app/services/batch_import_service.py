@@ -0,0 +1,295 @@
+"""
+카드사용내역 일괄 가져오기 서비스
+
+폴더 또는 파일 목록의 엑셀 파일(여러 시트 포함)을 프로세스 풀에서 병렬로 파싱하고,
+결과를 하나의 쓰기 작업에서 파일 단위로 등록합니다 (중복 제외는 가져오기 스테이징 단계).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable, Tuple
+from app.repositories.card_company_repository import CardCompanyRepository
+from app.repositories.column_mapping_profile_repository import ColumnMappingProfileRepository
+from app.services.import_service import ImportService, compute_file_hash
+from app.utils.excel_reader import (
+    read_card_transaction_excel,
+    read_excel_headers,
+    detect_header_row,
+    compute_header_signature,
+    describe_column_mapping,
+    get_sheet_names
+)
+from app.config.settings import settings
+
+
+# 일괄 가져오기 대상 파일 확장자
+EXCEL_FILE_SUFFIXES = ('.xlsx', '.xlsm', '.xls')
+
+# 파일별 처리 결과 상태
+BATCH_FILE_IMPORTED = 'imported'
+BATCH_FILE_SKIPPED = 'skipped'
+BATCH_FILE_FAILED = 'failed'
+
+
+class BatchImportService:
+    """
+    카드사용내역 일괄 가져오기 서비스 클래스
+    
+    파일별 카드사/컬럼 매핑 결정과 등록은 현재 프로세스에서, CPU를 쓰는 엑셀 파싱은
+    시트 단위로 프로세스 풀에서 수행합니다. 등록은 파일 하나당 가져오기 배치 하나입니다.
+    """
+    
+    def __init__(self, database_path: Optional[str] = None, max_workers: Optional[int] = None):
+        """
+        서비스 초기화
+        
+        Args:
+            database_path: 데이터베이스 파일 경로 (None인 경우 설정에서 가져옴)
+            max_workers: 파싱 프로세스 수 (None인 경우 설정, 설정이 0이면 CPU 코어 수)
+        """
+        self.import_service = ImportService(database_path)
+        self.db_initializer = self.import_service.db_initializer
+        self.max_workers = max_workers or settings.IMPORT_WORKERS or os.cpu_count() or 1
+    
+    def collect_files(self, paths: Iterable[str]) -> List[Path]:
+        """
+        가져올 엑셀 파일 목록 생성
+        
+        Args:
+            paths: 파일 또는 폴더 경로 목록 (폴더는 바로 아래의 엑셀 파일 포함)
+        
+        Returns:
+            엑셀 파일 경로 리스트 (중복 제거, 입력 순서 유지)
+        """
+        files: List[Path] = []
+        for path in map(Path, paths):
+            if path.is_dir():
+                candidates = sorted(
+                    child for child in path.iterdir()
+                    if child.suffix.lower() in EXCEL_FILE_SUFFIXES and not child.name.startswith('~$')
+                )
+            else:
+                candidates = [path]
+            for candidate in candidates:
+                if candidate not in files:
+                    files.append(candidate)
+        return files
+    
+    def resolve_card_company(self, file_path: Path, headers: List[str]) -> Optional[int]:
+        """
+        파일의 카드사 결정
+        
+        설정의 파일명 패턴(CARD_COMPANY_FILE_PATTERNS)을 먼저 확인하고, 없으면
+        헤더 서명이 같은 매핑 프로파일이 한 카드사에만 있을 때 그 카드사로 판단합니다.
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            headers: 정규화된 헤더 목록
+        
+        Returns:
+            카드사 ID 또는 None (판단할 수 없는 경우)
+        """
+        with self.db_initializer.session_scope() as session:
+            patterns = settings.get_card_company_file_patterns()
+            if patterns:
+                companies = CardCompanyRepository(session).get_all()
+                company_ids = {company.card_company_code: company.id for company in companies}
+                file_name = file_path.name.lower()
+                for pattern, card_company_code in patterns.items():
+                    if fnmatch(file_name, pattern.lower()) and card_company_code in company_ids:
+                        return company_ids[card_company_code]
+            
+            company_ids = ColumnMappingProfileRepository(session).get_company_ids_by_signature(
+                compute_header_signature(headers)
+            )
+            return company_ids[0] if len(company_ids) == 1 else None
+    
+    def _plan_file(
+        self,
+        file_path: Path,
+        card_company_id: Optional[int],
+        confirm_mapping: bool = False,
+        column_overrides: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[int], List[Dict[str, Any]]]:
+        """
+        파일의 카드사와 시트별 파싱 작업 결정
+        
+        필수 컬럼이 없거나 후보가 모호한 시트(요약, 안내 시트 등)는 제외합니다.
+        처음 보는 양식의 시트는 confirm_mapping이 True일 때만 추측한 매핑을 저장하여 가져옵니다.
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            card_company_id: 지정 카드사 ID (None인 경우 파일별로 판단)
+            confirm_mapping: 처음 보는 양식의 추측 매핑(또는 지정 매핑)을 확인된 것으로 저장할지 여부
+            column_overrides: 사용자가 지정한 매핑 {내부컬럼명: 엑셀컬럼명}
+        
+        Returns:
+            (카드사 ID, 시트별 read_card_transaction_excel 인자 리스트)
+        
+        Raises:
+            ValueError: 매핑이 확인되지 않은 새 양식의 시트가 있는 경우 (파일 전체를 가져오지 않음)
+        """
+        tasks = []
+        for sheet_name in get_sheet_names(str(file_path)):
+            header_row = detect_header_row(str(file_path), sheet_name)
+            if card_company_id is None:
+                headers = read_excel_headers(str(file_path), sheet_name, header_row)
+                card_company_id = self.resolve_card_company(file_path, headers)
+                if card_company_id is None:
+                    continue
+            try:
+                column_mapping, confirmed = self.import_service.find_column_mapping(
+                    str(file_path), card_company_id, header_row, sheet_name, column_overrides
+                )
+            except ValueError:
+                continue
+            if not confirmed:
+                if not confirm_mapping:
+                    raise ValueError(
+                        f"[{sheet_name}] 새 엑셀 양식의 컬럼 매핑을 확인해야 합니다: "
+                        f"{describe_column_mapping(column_mapping)}"
+                    )
+                column_mapping = self.import_service.resolve_column_mapping(
+                    str(file_path), card_company_id, header_row, sheet_name,
+                    confirm=True, column_overrides=column_overrides
+                )
+            tasks.append({
+                'sheet_name': sheet_name,
+                'column_mapping': column_mapping,
+                'header_row': header_row,
+            })
+        return card_company_id, tasks
+    
+    def import_files(
+        self,
+        paths: Iterable[str],
+        card_company_id: Optional[int] = None,
+        force: bool = False,
+        confirm_mapping: bool = False,
+        column_overrides: Optional[Dict[str, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        엑셀 파일 일괄 가져오기
+        
+        Args:
+            paths: 파일 또는 폴더 경로 목록
+            card_company_id: 모든 파일에 적용할 카드사 ID (None인 경우 파일별로 판단)
+            force: 이미 가져온 파일도 다시 가져올지 여부
+            confirm_mapping: 처음 보는 양식의 추측 매핑(또는 지정 매핑)을 확인된 것으로 저장할지 여부
+            column_overrides: 모든 파일에 적용할 사용자 지정 매핑 {내부컬럼명: 엑셀컬럼명}
+        
+        Returns:
+            파일별 결과 리스트 (file, status, message, batch, duplicate_rows)
+        """
+        results: Dict[Path, Dict[str, Any]] = {}
+        pending: Dict[Path, Dict[str, Any]] = {}
+        
+        for file_path in self.collect_files(paths):
+            result = {
+                'file': str(file_path),
+                'status': BATCH_FILE_SKIPPED,
+                'message': '',
+                'batch': None,
+                'duplicate_rows': 0,
+            }
+            results[file_path] = result
+            try:
+                file_hash = compute_file_hash(str(file_path))
+                if not force and self.import_service.find_completed_import(file_hash):
+                    result['message'] = "이미 가져온 파일입니다."
+                    continue
+                file_company_id, tasks = self._plan_file(
+                    file_path, card_company_id, confirm_mapping, column_overrides
+                )
+            except Exception as e:
+                result['status'] = BATCH_FILE_FAILED
+                result['message'] = str(e)
+                continue
+            
+            if file_company_id is None:
+                result['status'] = BATCH_FILE_FAILED
+                result['message'] = "카드사를 판단할 수 없습니다. 파일명 패턴을 설정하거나 카드사를 지정하세요."
+            elif not tasks:
+                result['status'] = BATCH_FILE_FAILED
+                result['message'] = "필수 컬럼이 있는 시트를 찾을 수 없습니다."
+            else:
+                pending[file_path] = {
+                    'card_company_id': file_company_id,
+                    'file_hash': file_hash,
+                    'tasks': tasks,
+                    'remaining': len(tasks),
+                    'transactions': [],
+                }
+        
+        if pending:
+            self._parse_and_write(pending, results)
+        return list(results.values())
+    
+    def _parse_and_write(self, pending: Dict[Path, Dict[str, Any]], results: Dict[Path, Dict[str, Any]]) -> None:
+        """
+        시트 파싱(프로세스 풀)과 파일 단위 등록(현재 프로세스)
+        
+        Args:
+            pending: 파일별 파싱 계획
+            results: 파일별 결과 (갱신됨)
+        """
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            for file_path, plan in pending.items():
+                for task in plan['tasks']:
+                    future = executor.submit(
+                        read_card_transaction_excel,
+                        str(file_path),
+                        plan['card_company_id'],
+                        **task
+                    )
+                    futures[future] = file_path
+            
+            for future in as_completed(futures):
+                file_path = futures[future]
+                plan = pending[file_path]
+                result = results[file_path]
+                try:
+                    plan['transactions'].extend(future.result())
+                except Exception as e:
+                    result['status'] = BATCH_FILE_FAILED
+                    result['message'] = str(e)
+                plan['remaining'] -= 1
+                
+                # 파일의 모든 시트 파싱이 끝나면 등록
+                if plan['remaining'] == 0 and result['status'] != BATCH_FILE_FAILED:
+                    self._write_file(file_path, plan, result)
+    
+    def _write_file(self, file_path: Path, plan: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """
+        파일 하나의 카드사용내역 등록
+        
+        중복 제외는 ImportService의 스테이징 단계에서 SQL로 처리되므로, 먼저 등록된 파일의
+        내역과 겹치는 행도 건너뜁니다.
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            plan: 파일 파싱 계획 (파싱 결과 포함)
+            result: 파일 결과 (갱신됨)
+        """
+        try:
+            batch = self.import_service.import_transactions(
+                plan['transactions'],
+                plan['card_company_id'],
+                source_file=str(file_path),
+                file_hash=plan['file_hash']
+            )
+        except Exception as e:
+            result['status'] = BATCH_FILE_FAILED
+            result['message'] = str(e)
+            return
+        
+        result['status'] = BATCH_FILE_IMPORTED
+        result['batch'] = batch
+        result['duplicate_rows'] = batch['total_rows'] - batch['inserted_rows'] - batch['failed_rows']
+        print(
+            f"[일괄 가져오기] {file_path.name}: {batch['inserted_rows']:,}건 등록, "
+            f"중복 {result['duplicate_rows']:,}건 제외"
+        )
@@ -5,7 +5,7 @@
 """
 
 from typing import Optional, Dict, Any, List
-from app.repositories.database import DatabaseInitializer
+from app.repositories.database import DatabaseInitializer, get_database
 from app.repositories.business_info_repository import BusinessInfoRepository
 from app.repositories.card_company_repository import CardCompanyRepository
 from app.repositories.schema import BusinessInfo, CardCompanyInfo
@@ -28,26 +28,22 @@ class BusinessService:
         """
         if database_path is None:
             database_path = settings.get_database_path()
-        self.db_initializer = DatabaseInitializer(database_path)
-        self.repository: Optional[BusinessInfoRepository] = None
-        self.card_company_repository: Optional[CardCompanyRepository] = None
-        self._initialize_repository()
+        self.db_initializer: DatabaseInitializer = self._initialize_database(database_path)
     
-    def _initialize_repository(self) -> None:
+    def _initialize_database(self, database_path: str) -> DatabaseInitializer:
         """
-        Repository 초기화
+        데이터베이스 초기화
         
-        데이터베이스가 초기화되지 않은 경우 초기화하고 Repository를 생성합니다.
+        경로별 공유 엔진을 가져옵니다. 세션과 Repository는 작업 단위로 생성합니다.
+        
+        Args:
+            database_path: 데이터베이스 파일 경로
+        
+        Returns:
+            초기화된 DatabaseInitializer 인스턴스
         """
         try:
-            # 데이터베이스 초기화 (이미 초기화된 경우 무시됨)
-            self.db_initializer.initialize_database()
-            
-            # 세션 생성
-            session = self.db_initializer.get_session()
-            self.repository = BusinessInfoRepository(session)
-            self.card_company_repository = CardCompanyRepository(session)
-            
+            return get_database(database_path)
         except Exception as e:
             raise RuntimeError(f"데이터베이스 초기화 실패: {e}")
     
@@ -65,28 +61,28 @@ class BusinessService:
             ValueError: 필수 필드가 누락된 경우
             IntegrityError: 중복된 사업자등록번호 또는 주민등록번호
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         # 필수 필드 검사
         required_fields = ['business_number', 'business_name', 'owner_name']
         for field in required_fields:
             if not business_data.get(field):
                 raise ValueError(f"{field}은(는) 필수 입력 항목입니다.")
         
-        # 사업자등록번호 중복 검사
-        if self.repository.exists(business_data['business_number']):
-            raise ValueError("이미 등록된 사업자등록번호입니다.")
-        
-        # 주민등록번호 중복 검사 (입력된 경우)
-        resident_number = business_data.get('owner_resident_number')
-        if resident_number and self.repository.get_by_resident_number(resident_number):
-            raise ValueError("이미 등록된 주민등록번호입니다.")
-        
-        try:
-            return self.repository.create(business_data)
-        except Exception as e:
-            raise RuntimeError(f"사업자 정보 생성 실패: {e}")
+        with self.db_initializer.session_scope() as session:
+            repository = BusinessInfoRepository(session)
+            
+            # 사업자등록번호 중복 검사
+            if repository.exists(business_data['business_number']):
+                raise ValueError("이미 등록된 사업자등록번호입니다.")
+            
+            # 주민등록번호 중복 검사 (입력된 경우)
+            resident_number = business_data.get('owner_resident_number')
+            if resident_number and repository.get_by_resident_number(resident_number):
+                raise ValueError("이미 등록된 주민등록번호입니다.")
+            
+            try:
+                return repository.create(business_data)
+            except Exception as e:
+                raise RuntimeError(f"사업자 정보 생성 실패: {e}")
     
     def get_business_info(self, business_number: str) -> Optional[Dict[str, Any]]:
         """
@@ -98,11 +94,9 @@ class BusinessService:
         Returns:
             사업자 정보 딕셔너리 또는 None
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
-        business_info = self.repository.get_by_registration_number(business_number)
-        return business_info.to_dict() if business_info else None
+        with self.db_initializer.session_scope() as session:
+            business_info = BusinessInfoRepository(session).get_by_registration_number(business_number)
+            return business_info.to_dict() if business_info else None
     
     def update_business_info(self, business_number: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -115,21 +109,21 @@ class BusinessService:
         Returns:
             수정된 사업자 정보 딕셔너리 또는 None
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
-        # 주민등록번호 중복 검사 (변경된 경우)
-        resident_number = update_data.get('owner_resident_number')
-        if resident_number:
-            existing = self.repository.get_by_resident_number(resident_number)
-            if existing and existing.business_number != business_number:
-                raise ValueError("이미 등록된 주민등록번호입니다.")
-        
-        try:
-            updated_business = self.repository.update(business_number, update_data)
-            return updated_business.to_dict() if updated_business else None
-        except Exception as e:
-            raise RuntimeError(f"사업자 정보 수정 실패: {e}")
+        with self.db_initializer.session_scope() as session:
+            repository = BusinessInfoRepository(session)
+            
+            # 주민등록번호 중복 검사 (변경된 경우)
+            resident_number = update_data.get('owner_resident_number')
+            if resident_number:
+                existing = repository.get_by_resident_number(resident_number)
+                if existing and existing.business_number != business_number:
+                    raise ValueError("이미 등록된 주민등록번호입니다.")
+            
+            try:
+                updated_business = repository.update(business_number, update_data)
+                return updated_business.to_dict() if updated_business else None
+            except Exception as e:
+                raise RuntimeError(f"사업자 정보 수정 실패: {e}")
     
     def delete_business_info(self, business_number: str) -> bool:
         """
@@ -141,11 +135,9 @@ class BusinessService:
         Returns:
             삭제 성공 여부
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         try:
-            return self.repository.delete(business_number)
+            with self.db_initializer.session_scope() as session:
+                return BusinessInfoRepository(session).delete(business_number)
         except Exception as e:
             raise RuntimeError(f"사업자 정보 삭제 실패: {e}")
     
@@ -159,12 +151,10 @@ class BusinessService:
         Returns:
             검색된 사업자 정보 리스트
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         try:
-            results = self.repository.search(search_term)
-            return [business.to_dict() for business in results]
+            with self.db_initializer.session_scope() as session:
+                results = BusinessInfoRepository(session).search(search_term)
+                return [business.to_dict() for business in results]
         except Exception as e:
             raise RuntimeError(f"사업자 정보 검색 실패: {e}")
     
@@ -179,12 +169,10 @@ class BusinessService:
         Returns:
             사업자 정보 리스트
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         try:
-            results = self.repository.get_all(limit, offset)
-            return [business.to_dict() for business in results]
+            with self.db_initializer.session_scope() as session:
+                results = BusinessInfoRepository(session).get_all(limit, offset)
+                return [business.to_dict() for business in results]
         except Exception as e:
             raise RuntimeError(f"사업자 정보 조회 실패: {e}")
     
@@ -195,11 +183,9 @@ class BusinessService:
         Returns:
             전체 개수
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         try:
-            return self.repository.count()
+            with self.db_initializer.session_scope() as session:
+                return BusinessInfoRepository(session).count()
         except Exception as e:
             raise RuntimeError(f"사업자 정보 개수 조회 실패: {e}")
     
@@ -235,52 +221,47 @@ class BusinessService:
             business_number: 사업자등록번호
             data: 카드사 정보 데이터 (card_company_code, card_company_name, card_company_name_en)
         """
-        if not self.repository or not self.card_company_repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
-        # 사업자 존재 확인
-        if not self.repository.exists(business_number):
-            raise ValueError("존재하지 않는 사업자등록번호입니다.")
-        
-        # 필수값 검사
-        required = ['card_company_code', 'card_company_name']
-        for field in required:
-            if not data.get(field):
-                raise ValueError(f"{field}은(는) 필수 입력 항목입니다.")
-        
-        payload = dict(data)
-        payload['business_number'] = business_number
-        try:
-            return self.card_company_repository.create(payload)
-        except Exception as e:
-            raise RuntimeError(f"카드사 정보 생성 실패: {e}")
+        with self.db_initializer.session_scope() as session:
+            # 사업자 존재 확인
+            if not BusinessInfoRepository(session).exists(business_number):
+                raise ValueError("존재하지 않는 사업자등록번호입니다.")
+            
+            # 필수값 검사
+            required = ['card_company_code', 'card_company_name']
+            for field in required:
+                if not data.get(field):
+                    raise ValueError(f"{field}은(는) 필수 입력 항목입니다.")
+            
+            payload = dict(data)
+            payload['business_number'] = business_number
+            try:
+                return CardCompanyRepository(session).create(payload)
+            except Exception as e:
+                raise RuntimeError(f"카드사 정보 생성 실패: {e}")
     
     def list_card_companies(self, business_number: str) -> List[Dict[str, Any]]:
         """해당 사업자에 연결된 카드사 목록 조회"""
-        if not self.card_company_repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
         try:
-            rows = self.card_company_repository.list_by_business(business_number)
-            return [row.to_dict() for row in rows]
+            with self.db_initializer.session_scope() as session:
+                rows = CardCompanyRepository(session).list_by_business(business_number)
+                return [row.to_dict() for row in rows]
         except Exception as e:
             raise RuntimeError(f"카드사 정보 조회 실패: {e}")
     
     def update_card_company(self, entity_id: int, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """카드사 정보 수정"""
-        if not self.card_company_repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
         try:
-            updated = self.card_company_repository.update(entity_id, update_data)
-            return updated.to_dict() if updated else None
+            with self.db_initializer.session_scope() as session:
+                updated = CardCompanyRepository(session).update(entity_id, update_data)
+                return updated.to_dict() if updated else None
         except Exception as e:
             raise RuntimeError(f"카드사 정보 수정 실패: {e}")
     
     def delete_card_company(self, entity_id: int) -> bool:
         """카드사 정보 삭제"""
-        if not self.card_company_repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
         try:
-            return self.card_company_repository.delete(entity_id)
+            with self.db_initializer.session_scope() as session:
+                return CardCompanyRepository(session).delete(entity_id)
         except Exception as e:
             raise RuntimeError(f"카드사 정보 삭제 실패: {e}")
     
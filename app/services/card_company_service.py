@@ -5,7 +5,7 @@
 """
 
 from typing import Optional, Dict, Any, List
-from app.repositories.database import DatabaseInitializer
+from app.repositories.database import DatabaseInitializer, get_database
 from app.repositories.card_company_repository import CardCompanyRepository
 from app.repositories.schema import CardCompanyInfo
 from app.config.settings import settings
@@ -27,24 +27,22 @@ class CardCompanyService:
     """
     if database_path is None:
       database_path = settings.get_database_path()
-    self.db_initializer = DatabaseInitializer(database_path)
-    self.repository: Optional[CardCompanyRepository] = None
-    self._initialize_repository()
+    self.db_initializer: DatabaseInitializer = self._initialize_database(database_path)
   
-  def _initialize_repository(self) -> None:
+  def _initialize_database(self, database_path: str) -> DatabaseInitializer:
     """
-    Repository 초기화
+    데이터베이스 초기화
     
-    데이터베이스가 초기화되지 않은 경우 초기화하고 Repository를 생성합니다.
+    경로별 공유 엔진을 가져옵니다. 세션과 Repository는 작업 단위로 생성합니다.
+    
+    Args:
+      database_path: 데이터베이스 파일 경로
+    
+    Returns:
+      초기화된 DatabaseInitializer 인스턴스
     """
     try:
-      # 데이터베이스 초기화 (이미 초기화된 경우 무시됨)
-      self.db_initializer.initialize_database()
-      
-      # 세션 생성
-      session = self.db_initializer.get_session()
-      self.repository = CardCompanyRepository(session)
-      
+      return get_database(database_path)
     except Exception as e:
       raise RuntimeError(f"데이터베이스 초기화 실패: {e}")
   
@@ -61,9 +59,6 @@ class CardCompanyService:
     Raises:
       ValueError: 필수 필드가 누락된 경우
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     # 필수 필드 검사
     required_fields = ['card_company_code', 'card_company_name']
     for field in required_fields:
@@ -71,7 +66,8 @@ class CardCompanyService:
         raise ValueError(f"{field}은(는) 필수 입력 항목입니다.")
     
     try:
-      return self.repository.create(data)
+      with self.db_initializer.session_scope() as session:
+        return CardCompanyRepository(session).create(data)
     except ValueError as e:
       # 제약조건 위반 등의 ValueError는 그대로 전달
       raise e
@@ -88,11 +84,9 @@ class CardCompanyService:
     Returns:
       카드사 정보 딕셔너리 또는 None
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
-    card_company = self.repository.get(card_company_id)
-    return card_company.to_dict() if card_company else None
+    with self.db_initializer.session_scope() as session:
+      card_company = CardCompanyRepository(session).get(card_company_id)
+      return card_company.to_dict() if card_company else None
   
   def update_card_company(self, card_company_id: int, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
@@ -105,12 +99,10 @@ class CardCompanyService:
     Returns:
       수정된 카드사 정보 딕셔너리 또는 None
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     try:
-      updated_card_company = self.repository.update(card_company_id, update_data)
-      return updated_card_company.to_dict() if updated_card_company else None
+      with self.db_initializer.session_scope() as session:
+        updated_card_company = CardCompanyRepository(session).update(card_company_id, update_data)
+        return updated_card_company.to_dict() if updated_card_company else None
     except Exception as e:
       raise RuntimeError(f"카드사 정보 수정 실패: {e}")
   
@@ -124,11 +116,9 @@ class CardCompanyService:
     Returns:
       삭제 성공 여부
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     try:
-      return self.repository.delete(card_company_id)
+      with self.db_initializer.session_scope() as session:
+        return CardCompanyRepository(session).delete(card_company_id)
     except Exception as e:
       raise RuntimeError(f"카드사 정보 삭제 실패: {e}")
   
@@ -139,14 +129,11 @@ class CardCompanyService:
     Returns:
       카드사 정보 리스트
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     try:
       from app.repositories.schema import CardCompanyInfo
-      session = self.db_initializer.get_session()
-      results = session.query(CardCompanyInfo).all()
-      return [card_company.to_dict() for card_company in results]
+      with self.db_initializer.session_scope() as session:
+        results = session.query(CardCompanyInfo).all()
+        return [card_company.to_dict() for card_company in results]
     except Exception as e:
       raise RuntimeError(f"카드사 정보 조회 실패: {e}")
   
@@ -165,31 +152,28 @@ class CardCompanyService:
     Returns:
       검색된 카드사 정보 리스트
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     try:
       from sqlalchemy import or_
       from app.repositories.schema import CardCompanyInfo
       
-      session = self.db_initializer.get_session()
-      query = session.query(CardCompanyInfo)
-      
-      # 카드사 코드로 검색 (부분 일치)
-      if card_company_code:
-        query = query.filter(CardCompanyInfo.card_company_code.like(f"%{card_company_code}%"))
-      
-      # 카드사 명칭으로 검색 (부분 일치)
-      if card_company_name:
-        query = query.filter(
-          or_(
-            CardCompanyInfo.card_company_name.like(f"%{card_company_name}%"),
-            CardCompanyInfo.card_company_name_en.like(f"%{card_company_name}%")
+      with self.db_initializer.session_scope() as session:
+        query = session.query(CardCompanyInfo)
+        
+        # 카드사 코드로 검색 (부분 일치)
+        if card_company_code:
+          query = query.filter(CardCompanyInfo.card_company_code.like(f"%{card_company_code}%"))
+        
+        # 카드사 명칭으로 검색 (부분 일치)
+        if card_company_name:
+          query = query.filter(
+            or_(
+              CardCompanyInfo.card_company_name.like(f"%{card_company_name}%"),
+              CardCompanyInfo.card_company_name_en.like(f"%{card_company_name}%")
+            )
           )
-        )
-      
-      results = query.all()
-      return [card_company.to_dict() for card_company in results]
+        
+        results = query.all()
+        return [card_company.to_dict() for card_company in results]
     except Exception as e:
       raise RuntimeError(f"카드사 정보 검색 실패: {e}")
 
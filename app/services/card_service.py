@@ -5,7 +5,7 @@
 """
 
 from typing import Optional, Dict, Any, List
-from app.repositories.database import DatabaseInitializer
+from app.repositories.database import DatabaseInitializer, get_database
 from app.repositories.card_repository import CardRepository
 from app.repositories.schema import CardInfo
 from app.config.settings import settings
@@ -28,24 +28,22 @@ class CardService:
     """
     if database_path is None:
       database_path = settings.get_database_path()
-    self.db_initializer = DatabaseInitializer(database_path)
-    self.repository: Optional[CardRepository] = None
-    self._initialize_repository()
+    self.db_initializer: DatabaseInitializer = self._initialize_database(database_path)
   
-  def _initialize_repository(self) -> None:
+  def _initialize_database(self, database_path: str) -> DatabaseInitializer:
     """
-    Repository 초기화
+    데이터베이스 초기화
     
-    데이터베이스가 초기화되지 않은 경우 초기화하고 Repository를 생성합니다.
+    경로별 공유 엔진을 가져옵니다. 세션과 Repository는 작업 단위로 생성합니다.
+    
+    Args:
+      database_path: 데이터베이스 파일 경로
+    
+    Returns:
+      초기화된 DatabaseInitializer 인스턴스
     """
     try:
-      # 데이터베이스 초기화 (이미 초기화된 경우 무시됨)
-      self.db_initializer.initialize_database()
-      
-      # 세션 생성
-      session = self.db_initializer.get_session()
-      self.repository = CardRepository(session)
-      
+      return get_database(database_path)
     except Exception as e:
       raise RuntimeError(f"데이터베이스 초기화 실패: {e}")
   
@@ -62,9 +60,6 @@ class CardService:
     Raises:
       ValueError: 필수 필드가 누락된 경우
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     # 필수 필드 검사
     required_fields = ['card_number', 'card_name', 'card_company_id']
     for field in required_fields:
@@ -82,7 +77,8 @@ class CardService:
         masked_value = card_data.get('masked_card_number') or None
         card_data['masked_card_number'] = masked_value
       
-      return self.repository.create(card_data)
+      with self.db_initializer.session_scope() as session:
+        return CardRepository(session).create(card_data)
     except ValueError as e:
       # 제약조건 위반 등의 ValueError는 그대로 전달
       raise e
@@ -99,14 +95,12 @@ class CardService:
     Returns:
       카드 정보 딕셔너리 또는 None (카드번호는 복호화된 상태)
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
-    card = self.repository.get(card_id)
-    if not card:
-      return None
-    
-    card_dict = card.to_dict()
+    with self.db_initializer.session_scope() as session:
+      card = CardRepository(session).get(card_id)
+      if not card:
+        return None
+      
+      card_dict = card.to_dict()
     # 카드번호 복호화
     if card_dict.get('card_number'):
       try:
@@ -128,9 +122,6 @@ class CardService:
     Returns:
       수정된 카드 정보 딕셔너리 또는 None (카드번호는 복호화된 상태)
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     try:
       # 카드번호 암호화
       update_data_encrypted = update_data.copy()
@@ -142,11 +133,12 @@ class CardService:
         masked_value = update_data_encrypted.get('masked_card_number') or None
         update_data_encrypted['masked_card_number'] = masked_value
       
-      updated_card = self.repository.update(card_id, update_data_encrypted)
-      if not updated_card:
-        return None
-      
-      card_dict = updated_card.to_dict()
+      with self.db_initializer.session_scope() as session:
+        updated_card = CardRepository(session).update(card_id, update_data_encrypted)
+        if not updated_card:
+          return None
+        
+        card_dict = updated_card.to_dict()
       # 카드번호 복호화
       if card_dict.get('card_number'):
         try:
@@ -168,11 +160,9 @@ class CardService:
     Returns:
       삭제 성공 여부
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     try:
-      return self.repository.delete(card_id)
+      with self.db_initializer.session_scope() as session:
+        return CardRepository(session).delete(card_id)
     except Exception as e:
       raise RuntimeError(f"카드 정보 삭제 실패: {e}")
   
@@ -183,13 +173,10 @@ class CardService:
     Returns:
       카드 정보 리스트 (카드번호는 복호화된 상태)
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     try:
       from app.repositories.schema import CardInfo
-      session = self.db_initializer.get_session()
-      results = session.query(CardInfo).all()
+      with self.db_initializer.session_scope() as session:
+        results = session.query(CardInfo).all()
       cards = []
       for card in results:
         card_dict = card.to_dict()
@@ -223,32 +210,29 @@ class CardService:
     Returns:
       검색된 카드 정보 리스트
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     try:
       from app.repositories.schema import CardInfo
       
-      session = self.db_initializer.get_session()
-      query = session.query(CardInfo)
-      
-      # 카드명으로 검색 (부분 일치)
-      if card_name:
-        query = query.filter(CardInfo.card_name.like(f"%{card_name}%"))
-      
-      # 카드유형으로 검색 (부분 일치)
-      if card_type:
-        query = query.filter(CardInfo.card_type.like(f"%{card_type}%"))
-      
-      # 카드사 ID로 필터링
-      if card_company_id is not None:
-        query = query.filter(CardInfo.card_company_id == card_company_id)
-      
-      # 사용여부로 필터링
-      if is_active is not None:
-        query = query.filter(CardInfo.is_active == is_active)
-      
-      results = query.all()
+      with self.db_initializer.session_scope() as session:
+        query = session.query(CardInfo)
+        
+        # 카드명으로 검색 (부분 일치)
+        if card_name:
+          query = query.filter(CardInfo.card_name.like(f"%{card_name}%"))
+        
+        # 카드유형으로 검색 (부분 일치)
+        if card_type:
+          query = query.filter(CardInfo.card_type.like(f"%{card_type}%"))
+        
+        # 카드사 ID로 필터링
+        if card_company_id is not None:
+          query = query.filter(CardInfo.card_company_id == card_company_id)
+        
+        # 사용여부로 필터링
+        if is_active is not None:
+          query = query.filter(CardInfo.is_active == is_active)
+        
+        results = query.all()
       cards = []
       for card in results:
         card_dict = card.to_dict()
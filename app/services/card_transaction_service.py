@@ -5,9 +5,12 @@
 """
 
 from typing import Optional, Dict, Any, List
-from app.repositories.database import DatabaseInitializer
+from app.repositories.database import DatabaseInitializer, get_database
 from app.repositories.card_transaction_repository import CardTransactionRepository
 from app.repositories.schema import CardTransaction
+from app.repositories.projections import CardTransactionRow
+from app.utils.duplicate_detector import find_duplicate_candidates, DEFAULT_SIMILARITY_THRESHOLD
+from app.utils.vat_period import VatPeriod
 from app.config.settings import settings
 
 
@@ -27,24 +30,22 @@ class CardTransactionService:
     """
     if database_path is None:
       database_path = settings.get_database_path()
-    self.db_initializer = DatabaseInitializer(database_path)
-    self.repository: Optional[CardTransactionRepository] = None
-    self._initialize_repository()
+    self.db_initializer: DatabaseInitializer = self._initialize_database(database_path)
   
-  def _initialize_repository(self) -> None:
+  def _initialize_database(self, database_path: str) -> DatabaseInitializer:
     """
-    Repository 초기화
+    데이터베이스 초기화
     
-    데이터베이스가 초기화되지 않은 경우 초기화하고 Repository를 생성합니다.
+    경로별 공유 엔진을 가져옵니다. 세션과 Repository는 작업 단위로 생성합니다.
+    
+    Args:
+      database_path: 데이터베이스 파일 경로
+    
+    Returns:
+      초기화된 DatabaseInitializer 인스턴스
     """
     try:
-      # 데이터베이스 초기화 (이미 초기화된 경우 무시됨)
-      self.db_initializer.initialize_database()
-      
-      # 세션 생성
-      session = self.db_initializer.get_session()
-      self.repository = CardTransactionRepository(session)
-      
+      return get_database(database_path)
     except Exception as e:
       raise RuntimeError(f"데이터베이스 초기화 실패: {e}")
   
@@ -61,9 +62,6 @@ class CardTransactionService:
     Raises:
       ValueError: 필수 필드가 누락된 경우
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     # 필수 필드 검사
     required_fields = ['card_company_id', 'transaction_date', 'amount']
     for field in required_fields:
@@ -71,7 +69,8 @@ class CardTransactionService:
         raise ValueError(f"{field}은(는) 필수 입력 항목입니다.")
     
     try:
-      return self.repository.create(data)
+      with self.db_initializer.session_scope() as session:
+        return CardTransactionRepository(session).create(data)
     except ValueError as e:
       # 제약조건 위반 등의 ValueError는 그대로 전달
       raise e
@@ -88,14 +87,12 @@ class CardTransactionService:
     Returns:
       카드사용내역 딕셔너리 또는 None
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
-    transaction = self.repository.get(transaction_id)
-    if not transaction:
-      return None
-    
-    return transaction.to_dict()
+    with self.db_initializer.session_scope() as session:
+      transaction = CardTransactionRepository(session).get(transaction_id)
+      if not transaction:
+        return None
+      
+      return transaction.to_dict()
   
   def update_transaction(self, transaction_id: int, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
@@ -108,15 +105,13 @@ class CardTransactionService:
     Returns:
       수정된 카드사용내역 딕셔너리 또는 None
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     try:
-      updated_transaction = self.repository.update(transaction_id, update_data)
-      if not updated_transaction:
-        return None
-      
-      return updated_transaction.to_dict()
+      with self.db_initializer.session_scope() as session:
+        updated_transaction = CardTransactionRepository(session).update(transaction_id, update_data)
+        if not updated_transaction:
+          return None
+        
+        return updated_transaction.to_dict()
     except Exception as e:
       raise RuntimeError(f"카드사용내역 수정 실패: {e}")
   
@@ -130,11 +125,9 @@ class CardTransactionService:
     Returns:
       삭제 성공 여부
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     try:
-      return self.repository.delete(transaction_id)
+      with self.db_initializer.session_scope() as session:
+        return CardTransactionRepository(session).delete(transaction_id)
     except Exception as e:
       raise RuntimeError(f"카드사용내역 삭제 실패: {e}")
   
@@ -145,12 +138,8 @@ class CardTransactionService:
     Returns:
       카드사용내역 리스트
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     try:
-      transactions = self.repository.get_all()
-      return [transaction.to_dict() for transaction in transactions]
+      return [row.to_dict() for row in self.search_transaction_rows()]
     except Exception as e:
       raise RuntimeError(f"카드사용내역 조회 실패: {e}")
   
@@ -161,6 +150,7 @@ class CardTransactionService:
     vendor_id: Optional[int] = None,
     transaction_date_from: Optional[str] = None,
     transaction_date_to: Optional[str] = None,
+    vat_period: Optional[VatPeriod] = None,
     is_cancel: Optional[bool] = None,
     vendor_name: Optional[str] = None,
     business_number: Optional[str] = None,
@@ -175,6 +165,7 @@ class CardTransactionService:
       vendor_id: 거래처 ID
       transaction_date_from: 거래 일자 시작일 (YYYY-MM-DD 형식)
       transaction_date_to: 거래 일자 종료일 (YYYY-MM-DD 형식)
+      vat_period: 부가세 신고기간 (예: VatPeriod(2025, 1, '예정'))
       is_cancel: 거래취소여부
       vendor_name: 거래처명 (부분 일치)
       business_number: 사업자등록번호
@@ -183,22 +174,175 @@ class CardTransactionService:
     Returns:
       검색된 카드사용내역 리스트
     """
-    if not self.repository:
-      raise RuntimeError("Repository가 초기화되지 않았습니다.")
-    
     try:
-      results = self.repository.search(
+      results = self.search_transaction_rows(
         card_company_id=card_company_id,
         card_id=card_id,
         vendor_id=vendor_id,
         transaction_date_from=transaction_date_from,
         transaction_date_to=transaction_date_to,
+        vat_period=vat_period,
         is_cancel=is_cancel,
         vendor_name=vendor_name,
         business_number=business_number,
         approval_number=approval_number
       )
-      return [transaction.to_dict() for transaction in results]
+      return [row.to_dict() for row in results]
     except Exception as e:
       raise RuntimeError(f"카드사용내역 검색 실패: {e}")
-
+  
+  def search_transaction_rows(
+    self,
+    card_company_id: Optional[int] = None,
+    card_id: Optional[int] = None,
+    vendor_id: Optional[int] = None,
+    transaction_date_from: Optional[str] = None,
+    transaction_date_to: Optional[str] = None,
+    vat_period: Optional[VatPeriod] = None,
+    is_cancel: Optional[bool] = None,
+    vendor_name: Optional[str] = None,
+    business_number: Optional[str] = None,
+    approval_number: Optional[str] = None
+  ) -> List[CardTransactionRow]:
+    """
+    카드사용내역 목록 조회 (조회 전용)
+    
+    대량 목록 표시용으로 ORM 엔티티와 딕셔너리 변환 없이 CardTransactionRow를 반환합니다.
+    테이블 모델은 반환된 행을 그대로 사용할 수 있습니다.
+    
+    Args:
+      card_company_id: 카드사 ID
+      card_id: 카드 ID
+      vendor_id: 거래처 ID
+      transaction_date_from: 거래 일자 시작일 (YYYY-MM-DD 형식)
+      transaction_date_to: 거래 일자 종료일 (YYYY-MM-DD 형식)
+      vat_period: 부가세 신고기간 (예: VatPeriod(2025, 1, '예정'))
+      is_cancel: 거래취소여부
+      vendor_name: 거래처명 (부분 일치)
+      business_number: 사업자등록번호
+      approval_number: 승인번호
+    
+    Returns:
+      CardTransactionRow 리스트
+    """
+    try:
+      with self.db_initializer.session_scope() as session:
+        return CardTransactionRepository(session).list_rows(
+          card_company_id=card_company_id,
+          card_id=card_id,
+          vendor_id=vendor_id,
+          transaction_date_from=transaction_date_from,
+          transaction_date_to=transaction_date_to,
+          vat_period=vat_period,
+          is_cancel=is_cancel,
+          vendor_name=vendor_name,
+          business_number=business_number,
+          approval_number=approval_number
+        )
+    except Exception as e:
+      raise RuntimeError(f"카드사용내역 조회 실패: {e}")
+  
+  def remove_duplicate_transactions(self, dry_run: bool = False) -> int:
+    """
+    중복 카드사용내역 정리
+    
+    같은 파일을 여러 번 가져오는 등으로 생긴 중복 행 중 처음 등록된 행만 남깁니다.
+    
+    Args:
+      dry_run: True이면 삭제하지 않고 중복 건수만 반환
+    
+    Returns:
+      삭제된(또는 삭제 대상) 건수
+    """
+    try:
+      with self.db_initializer.session_scope() as session:
+        repository = CardTransactionRepository(session)
+        if dry_run:
+          return repository.count_duplicates()
+        return repository.delete_duplicates()
+    except Exception as e:
+      raise RuntimeError(f"중복 카드사용내역 정리 실패: {e}")
+  
+  def pair_cancellations(self, import_batch_id: Optional[int] = None) -> Dict[str, int]:
+    """
+    취소 거래를 원거래와 연결
+    
+    승인번호, 카드번호, 금액(부분 취소 포함)으로 원거래를 찾아 original_transaction_id에 기록하므로
+    신고 집계에서 취소 금액을 SQL로 차감할 수 있습니다. 연결되지 않은 취소 거래만 처리합니다.
+    
+    Args:
+      import_batch_id: 가져오기 배치 ID (None인 경우 연결되지 않은 모든 취소 거래)
+    
+    Returns:
+      {'paired': 새로 연결된 건수, 'unpaired': 남은 미연결 취소 건수}
+    """
+    try:
+      with self.db_initializer.session_scope() as session:
+        repository = CardTransactionRepository(session)
+        paired = repository.pair_cancellations(import_batch_id)
+        return {'paired': paired, 'unpaired': repository.count_unpaired_cancellations()}
+    except Exception as e:
+      raise RuntimeError(f"취소 거래 연결 실패: {e}")
+  
+  def find_duplicate_candidates(
+    self,
+    transaction_date_from: Optional[str] = None,
+    transaction_date_to: Optional[str] = None,
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+  ) -> List[Dict[str, Any]]:
+    """
+    서로 다른 가져오기에 중복으로 들어온 구매 후보 조회 (검토용, 삭제하지 않음)
+    
+    카드사 명세서와 포털 내보내기처럼 가맹점명만 다른 같은 구매를
+    (거래 일자, 금액, 사업자등록번호) 버킷 안에서 가맹점명 유사도로 찾습니다.
+    키가 같은 내역이 없는 행은 데이터베이스에서 미리 제외합니다.
+    
+    Args:
+      transaction_date_from: 거래 일자 시작일 (YYYY-MM-DD 형식)
+      transaction_date_to: 거래 일자 종료일 (YYYY-MM-DD 형식)
+      threshold: 가맹점명 최소 유사도 (0~1)
+    
+    Returns:
+      중복 후보 딕셔너리 리스트 (DuplicateCandidate.to_dict 결과)
+    """
+    try:
+      with self.db_initializer.session_scope() as session:
+        rows = CardTransactionRepository(session).list_rows_sharing_purchase_key(
+          transaction_date_from=transaction_date_from,
+          transaction_date_to=transaction_date_to
+        )
+      return [candidate.to_dict() for candidate in find_duplicate_candidates(rows, threshold)]
+    except Exception as e:
+      raise RuntimeError(f"중복 구매 후보 조회 실패: {e}")
+  
+  def get_amount_summary(
+    self,
+    card_company_id: Optional[int] = None,
+    transaction_date_from: Optional[str] = None,
+    transaction_date_to: Optional[str] = None,
+    vat_period: Optional[VatPeriod] = None
+  ) -> Dict[str, int]:
+    """
+    기간 내 금액 합계 조회 (원 단위 정수, 취소 금액 차감)
+    
+    합계는 데이터베이스에서 정수 컬럼으로 계산하므로 행을 불러오지 않고 소수 오차도 없습니다.
+    
+    Args:
+      card_company_id: 카드사 ID
+      transaction_date_from: 거래 일자 시작일 (YYYY-MM-DD 형식)
+      transaction_date_to: 거래 일자 종료일 (YYYY-MM-DD 형식)
+      vat_period: 부가세 신고기간
+    
+    Returns:
+      건수와 금액 합계 딕셔너리 (CardTransactionRepository.summarize_amounts 결과)
+    """
+    try:
+      with self.db_initializer.session_scope() as session:
+        return CardTransactionRepository(session).summarize_amounts(
+          card_company_id=card_company_id,
+          transaction_date_from=transaction_date_from,
+          transaction_date_to=transaction_date_to,
+          vat_period=vat_period
+        )
+    except Exception as e:
+      raise RuntimeError(f"금액 합계 조회 실패: {e}")
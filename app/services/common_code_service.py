@@ -5,7 +5,7 @@
 """
 
 from typing import Optional, Dict, Any, List
-from app.repositories.database import DatabaseInitializer
+from app.repositories.database import DatabaseInitializer, get_database
 from app.repositories.common_code_repository import CommonCodeRepository
 from app.repositories.schema import CommonCode
 from app.config.settings import settings
@@ -27,24 +27,22 @@ class CommonCodeService:
         """
         if database_path is None:
             database_path = settings.get_database_path()
-        self.db_initializer = DatabaseInitializer(database_path)
-        self.repository: Optional[CommonCodeRepository] = None
-        self._initialize_repository()
+        self.db_initializer: DatabaseInitializer = self._initialize_database(database_path)
     
-    def _initialize_repository(self) -> None:
+    def _initialize_database(self, database_path: str) -> DatabaseInitializer:
         """
-        Repository 초기화
+        데이터베이스 초기화
         
-        데이터베이스가 초기화되지 않은 경우 초기화하고 Repository를 생성합니다.
+        경로별 공유 엔진을 가져옵니다. 세션과 Repository는 작업 단위로 생성합니다.
+        
+        Args:
+            database_path: 데이터베이스 파일 경로
+        
+        Returns:
+            초기화된 DatabaseInitializer 인스턴스
         """
         try:
-            # 데이터베이스 초기화 (이미 초기화된 경우 무시됨)
-            self.db_initializer.initialize_database()
-            
-            # 세션 생성
-            session = self.db_initializer.get_session()
-            self.repository = CommonCodeRepository(session)
-            
+            return get_database(database_path)
         except Exception as e:
             raise RuntimeError(f"데이터베이스 초기화 실패: {e}")
     
@@ -61,9 +59,6 @@ class CommonCodeService:
         Raises:
             ValueError: 필수 필드가 누락된 경우
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         # 필수 필드 검사
         required_fields = ['code_group', 'code', 'code_name', 'code_abbr']
         for field in required_fields:
@@ -71,7 +66,8 @@ class CommonCodeService:
                 raise ValueError(f"{field}은(는) 필수 입력 항목입니다.")
         
         try:
-            return self.repository.create(data)
+            with self.db_initializer.session_scope() as session:
+                return CommonCodeRepository(session).create(data)
         except ValueError as e:
             # 제약조건 위반 등의 ValueError는 그대로 전달
             raise e
@@ -89,11 +85,9 @@ class CommonCodeService:
         Returns:
             공통코드 딕셔너리 또는 None
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
-        common_code = self.repository.get(code_group, code)
-        return common_code.to_dict() if common_code else None
+        with self.db_initializer.session_scope() as session:
+            common_code = CommonCodeRepository(session).get(code_group, code)
+            return common_code.to_dict() if common_code else None
     
     def update_common_code(
         self, 
@@ -112,12 +106,10 @@ class CommonCodeService:
         Returns:
             수정된 공통코드 딕셔너리 또는 None
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         try:
-            updated_common_code = self.repository.update(code_group, code, update_data)
-            return updated_common_code.to_dict() if updated_common_code else None
+            with self.db_initializer.session_scope() as session:
+                updated_common_code = CommonCodeRepository(session).update(code_group, code, update_data)
+                return updated_common_code.to_dict() if updated_common_code else None
         except Exception as e:
             raise RuntimeError(f"공통 코드 수정 실패: {e}")
     
@@ -132,11 +124,9 @@ class CommonCodeService:
         Returns:
             삭제 성공 여부
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         try:
-            return self.repository.delete(code_group, code)
+            with self.db_initializer.session_scope() as session:
+                return CommonCodeRepository(session).delete(code_group, code)
         except Exception as e:
             raise RuntimeError(f"공통 코드 삭제 실패: {e}")
     
@@ -147,16 +137,13 @@ class CommonCodeService:
         Returns:
             공통코드 리스트
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         try:
             from app.repositories.schema import CommonCode
-            session = self.db_initializer.get_session()
-            results = session.query(CommonCode).order_by(
-                CommonCode.code_group, CommonCode.sort_order
-            ).all()
-            return [common_code.to_dict() for common_code in results]
+            with self.db_initializer.session_scope() as session:
+                results = session.query(CommonCode).order_by(
+                    CommonCode.code_group, CommonCode.sort_order
+                ).all()
+                return [common_code.to_dict() for common_code in results]
         except Exception as e:
             raise RuntimeError(f"공통 코드 조회 실패: {e}")
     
@@ -170,12 +157,10 @@ class CommonCodeService:
         Returns:
             공통코드 리스트
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         try:
-            codes = self.repository.get_by_group(code_group)
-            return [common_code.to_dict() for common_code in codes]
+            with self.db_initializer.session_scope() as session:
+                codes = CommonCodeRepository(session).get_by_group(code_group)
+                return [common_code.to_dict() for common_code in codes]
         except Exception as e:
             raise RuntimeError(f"공통 코드 조회 실패: {e}")
     
@@ -200,39 +185,36 @@ class CommonCodeService:
         Returns:
             검색된 공통코드 리스트
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         try:
             from sqlalchemy import or_
             from app.repositories.schema import CommonCode
             
-            session = self.db_initializer.get_session()
-            query = session.query(CommonCode)
-            
-            # 코드 그룹으로 검색 (부분 일치)
-            if code_group:
-                query = query.filter(CommonCode.code_group.like(f"%{code_group}%"))
-            
-            # 코드로 검색 (부분 일치)
-            if code:
-                query = query.filter(CommonCode.code.like(f"%{code}%"))
-            
-            # 코드명으로 검색 (부분 일치)
-            if code_name:
-                query = query.filter(CommonCode.code_name.like(f"%{code_name}%"))
-            
-            # 코드약어명으로 검색 (부분 일치)
-            if code_abbr:
-                query = query.filter(CommonCode.code_abbr.like(f"%{code_abbr}%"))
-            
-            # 사용 여부로 필터링
-            if is_active is not None:
-                query = query.filter(CommonCode.is_active == is_active)
-            
-            # 정렬: 코드 그룹, 정렬 순서
-            results = query.order_by(CommonCode.code_group, CommonCode.sort_order).all()
-            return [common_code.to_dict() for common_code in results]
+            with self.db_initializer.session_scope() as session:
+                query = session.query(CommonCode)
+                
+                # 코드 그룹으로 검색 (부분 일치)
+                if code_group:
+                    query = query.filter(CommonCode.code_group.like(f"%{code_group}%"))
+                
+                # 코드로 검색 (부분 일치)
+                if code:
+                    query = query.filter(CommonCode.code.like(f"%{code}%"))
+                
+                # 코드명으로 검색 (부분 일치)
+                if code_name:
+                    query = query.filter(CommonCode.code_name.like(f"%{code_name}%"))
+                
+                # 코드약어명으로 검색 (부분 일치)
+                if code_abbr:
+                    query = query.filter(CommonCode.code_abbr.like(f"%{code_abbr}%"))
+                
+                # 사용 여부로 필터링
+                if is_active is not None:
+                    query = query.filter(CommonCode.is_active == is_active)
+                
+                # 정렬: 코드 그룹, 정렬 순서
+                results = query.order_by(CommonCode.code_group, CommonCode.sort_order).all()
+                return [common_code.to_dict() for common_code in results]
         except Exception as e:
             raise RuntimeError(f"공통 코드 검색 실패: {e}")
 
@@ -0,0 +1,666 @@
+"""
+카드사용내역 가져오기 서비스
+
+엑셀에서 읽은 카드사용내역을 가져오기 배치 단위로 등록하고 되돌립니다.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+from sqlalchemy.orm import Session
+from app.repositories.database import DatabaseInitializer, get_database
+from app.repositories.card_repository import CardRepository
+from app.repositories.card_transaction_repository import CardTransactionRepository
+from app.repositories.card_transaction_staging_repository import (
+    CardTransactionStagingRepository,
+    DIFF_STATUS_NEW,
+    DIFF_STATUS_EXISTING,
+    DIFF_STATUS_CONFLICT,
+    DIFF_STATUS_INVALID
+)
+from app.repositories.card_transaction_rollup_repository import CardTransactionRollupRepository
+from app.repositories.projections import CardTransactionRow
+from app.repositories.column_mapping_profile_repository import ColumnMappingProfileRepository
+from app.repositories.import_batch_repository import (
+    ImportBatchRepository,
+    IMPORT_STATUS_RUNNING,
+    IMPORT_STATUS_COMPLETED,
+    IMPORT_STATUS_FAILED
+)
+from app.utils.excel_reader import (
+    REQUIRED_COLUMNS,
+    read_card_transaction_excel,
+    read_excel_headers,
+    detect_header_row,
+    estimate_row_count,
+    compute_header_signature,
+    describe_column_mapping,
+    match_columns,
+    COLUMN_VOCABULARIES
+)
+from app.utils.card_number import CardNumberIndex, CardMatchReport
+from app.utils.amount import to_won
+from app.utils.exclusion_rules import DEFAULT_EXCLUSION_RULES
+from app.config.settings import settings
+
+
+# 파일 해시 계산 시 한 번에 읽을 크기 (바이트)
+FILE_HASH_CHUNK_SIZE = 1024 * 1024
+
+# 미리보기로 읽을 데이터 행 수
+PREVIEW_ROWS = 200
+
+
+def compute_file_hash(file_path: str) -> str:
+    """
+    파일 SHA-256 해시 계산
+    
+    파일 전체를 메모리에 올리지 않고 청크 단위로 읽어 계산합니다.
+    
+    Args:
+        file_path: 파일 경로
+    
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(FILE_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImportService:
+    """
+    카드사용내역 가져오기 서비스 클래스
+    
+    가져오기 배치 기록(원본 파일, 해시, 건수, 소요 시간)과 일괄 등록/되돌리기,
+    카드사별 엑셀 컬럼 매핑 프로파일 관리를 담당합니다.
+    """
+    
+    def __init__(self, database_path: Optional[str] = None):
+        """
+        서비스 초기화
+        
+        Args:
+            database_path: 데이터베이스 파일 경로 (None인 경우 설정에서 가져옴)
+        """
+        if database_path is None:
+            database_path = settings.get_database_path()
+        self.db_initializer: DatabaseInitializer = self._initialize_database(database_path)
+        # (카드사 ID, 헤더 서명) -> 컬럼 매핑
+        self._mapping_cache: Dict[Tuple[int, str], Dict[str, str]] = {}
+    
+    def _initialize_database(self, database_path: str) -> DatabaseInitializer:
+        """
+        데이터베이스 초기화
+        
+        경로별 공유 엔진을 가져옵니다. 세션과 Repository는 작업 단위로 생성합니다.
+        
+        Args:
+            database_path: 데이터베이스 파일 경로
+        
+        Returns:
+            초기화된 DatabaseInitializer 인스턴스
+        """
+        try:
+            return get_database(database_path)
+        except Exception as e:
+            raise RuntimeError(f"데이터베이스 초기화 실패: {e}")
+    
+    def find_column_mapping(
+        self,
+        file_path: str,
+        card_company_id: int,
+        header_row: Optional[int] = None,
+        sheet_name: Any = 0,
+        column_overrides: Optional[Dict[str, str]] = None
+    ) -> Tuple[Dict[str, str], bool]:
+        """
+        엑셀 파일의 컬럼 매핑 조회 (저장하지 않음)
+        
+        헤더만 읽어 서명을 계산한 뒤 (카드사 ID, 헤더 서명)으로 메모리 캐시 -> 매핑 프로파일 순으로 찾습니다.
+        처음 보는 양식이면 컬럼명 점수로 추측한 매핑을 돌려주며, 사용자가 확인하기 전에는 저장하지 않습니다.
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            card_company_id: 카드사 ID
+            header_row: 헤더 행 인덱스 (None인 경우 자동으로 찾음)
+            sheet_name: 시트 이름 또는 인덱스 (기본값: 0)
+            column_overrides: 사용자가 지정한 매핑 {내부컬럼명: 엑셀컬럼명} (저장된 프로파일보다 우선)
+        
+        Returns:
+            (컬럼 매핑 {내부컬럼명: 엑셀컬럼명}, 저장된 프로파일의 매핑인지 여부)
+        
+        Raises:
+            ValueError: 필수 컬럼을 찾을 수 없거나 후보가 여러 개인 경우, 지정한 컬럼이 없는 경우
+        """
+        _, mapping, confirmed = self._find_column_mapping(
+            file_path, card_company_id, header_row, sheet_name, column_overrides
+        )
+        return mapping, confirmed
+    
+    def resolve_column_mapping(
+        self,
+        file_path: str,
+        card_company_id: int,
+        header_row: Optional[int] = None,
+        sheet_name: Any = 0,
+        confirm: bool = False,
+        column_overrides: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """
+        가져오기에 사용할 엑셀 파일의 컬럼 매핑 조회
+        
+        저장된 매핑 프로파일이 있으면 그대로 사용합니다. 처음 보는 양식(또는 사용자가 매핑을 지정한 경우)은
+        confirm이 True일 때만 매핑을 프로파일로 저장하여 사용하고, 아니면 확인을 요청하는 ValueError를 발생시킵니다.
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            card_company_id: 카드사 ID
+            header_row: 헤더 행 인덱스 (None인 경우 자동으로 찾음)
+            sheet_name: 시트 이름 또는 인덱스 (기본값: 0)
+            confirm: 사용자가 확인한 매핑으로 저장할지 여부
+            column_overrides: 사용자가 지정한 매핑 {내부컬럼명: 엑셀컬럼명}
+        
+        Returns:
+            컬럼 매핑 {내부컬럼명: 엑셀컬럼명}
+        
+        Raises:
+            ValueError: 필수 컬럼을 찾을 수 없거나 모호한 경우, 확인되지 않은 새 양식인 경우
+        """
+        headers, mapping, confirmed = self._find_column_mapping(
+            file_path, card_company_id, header_row, sheet_name, column_overrides
+        )
+        if confirmed:
+            return mapping
+        
+        if not confirm:
+            raise ValueError(f"새 엑셀 양식의 컬럼 매핑을 확인해야 합니다: {describe_column_mapping(mapping)}")
+        mapping = self.save_column_mapping(card_company_id, headers, mapping)
+        print(f"확인된 엑셀 양식의 컬럼 매핑을 저장했습니다 (카드사 ID: {card_company_id}): {mapping}")
+        return mapping
+    
+    def _find_column_mapping(
+        self,
+        file_path: str,
+        card_company_id: int,
+        header_row: Optional[int],
+        sheet_name: Any,
+        column_overrides: Optional[Dict[str, str]]
+    ) -> Tuple[List[str], Dict[str, str], bool]:
+        """
+        컬럼 매핑 조회 (find_column_mapping, resolve_column_mapping 공통)
+        
+        Returns:
+            (정규화된 헤더 목록, 컬럼 매핑, 저장된 프로파일의 매핑인지 여부)
+        """
+        headers = read_excel_headers(file_path, sheet_name, header_row)
+        key = (card_company_id, compute_header_signature(headers))
+        
+        mapping = self._mapping_cache.get(key)
+        if mapping is None:
+            with self.db_initializer.session_scope() as session:
+                repository = ColumnMappingProfileRepository(session)
+                profile = repository.get_by_signature(*key)
+                if profile:
+                    repository.touch(profile.id)
+                    mapping = profile.to_dict()['column_mapping']
+                    self._mapping_cache[key] = mapping
+        
+        overrides = self._normalize_overrides(headers, column_overrides)
+        if mapping is not None:
+            if not overrides or all(mapping.get(field) == col for field, col in overrides.items()):
+                return headers, mapping, True
+            # 저장된 매핑을 사용자가 고친 경우: 지정한 컬럼을 다른 내부 컬럼에서 빼고 다시 확인
+            fixed = {field: col for field, col in mapping.items() if col not in overrides.values()}
+            fixed.update(overrides)
+            return headers, fixed, False
+        
+        mapping, ambiguous = match_columns(headers, fixed=overrides)
+        ambiguous_required = [col for col in REQUIRED_COLUMNS if col in ambiguous]
+        if ambiguous_required:
+            raise ValueError(
+                f"필수 컬럼의 후보가 여러 개입니다. 컬럼을 지정하세요: {describe_column_mapping(mapping, ambiguous)}"
+            )
+        missing = [col for col in REQUIRED_COLUMNS if col not in mapping]
+        if missing:
+            raise ValueError(f"필수 컬럼을 찾을 수 없습니다: {', '.join(missing)}")
+        if ambiguous:
+            print(f"후보가 여러 개인 컬럼은 매핑하지 않았습니다: {describe_column_mapping({}, ambiguous)}")
+        return headers, mapping, False
+    
+    def _normalize_overrides(
+        self,
+        headers: List[str],
+        column_overrides: Optional[Dict[str, str]]
+    ) -> Dict[str, str]:
+        """
+        사용자 지정 매핑 검증 및 정규화 (엑셀 컬럼명은 헤더와 같은 방식으로 정규화)
+        
+        Raises:
+            ValueError: 알 수 없는 내부 컬럼명이거나 헤더에 없는 엑셀 컬럼인 경우
+        """
+        overrides = {}
+        for field, column in (column_overrides or {}).items():
+            if field not in COLUMN_VOCABULARIES:
+                raise ValueError(f"알 수 없는 컬럼입니다: {field} (사용 가능: {', '.join(COLUMN_VOCABULARIES)})")
+            column = str(column).strip().lower()
+            if column not in headers:
+                raise ValueError(f"엑셀 파일에 없는 컬럼입니다: {column}")
+            overrides[field] = column
+        return overrides
+    
+    def save_column_mapping(
+        self,
+        card_company_id: int,
+        headers: List[str],
+        column_mapping: Dict[str, str]
+    ) -> Dict[str, str]:
+        """
+        컬럼 매핑 프로파일 저장 (사용자가 확인/수정한 매핑 포함)
+        
+        Args:
+            card_company_id: 카드사 ID
+            headers: 정규화된 헤더 목록 (read_excel_headers 결과)
+            column_mapping: 컬럼 매핑 {내부컬럼명: 엑셀컬럼명}
+        
+        Returns:
+            저장된 컬럼 매핑
+        
+        Raises:
+            ValueError: 매핑된 엑셀 컬럼이 헤더에 없는 경우
+        """
+        unknown = [col for col in column_mapping.values() if col not in headers]
+        if unknown:
+            raise ValueError(f"엑셀 파일에 없는 컬럼입니다: {', '.join(unknown)}")
+        
+        header_signature = compute_header_signature(headers)
+        with self.db_initializer.session_scope() as session:
+            profile = ColumnMappingProfileRepository(session).save(
+                card_company_id, header_signature, headers, column_mapping
+            )
+            mapping = profile.to_dict()['column_mapping']
+        self._mapping_cache[(card_company_id, header_signature)] = mapping
+        return mapping
+    
+    def read_transactions(
+        self,
+        file_path: str,
+        card_company_id: int,
+        confirm_mapping: bool = False,
+        column_overrides: Optional[Dict[str, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        매핑 프로파일을 적용하여 카드사용내역 엑셀 파일 읽기
+        
+        헤더 행은 한 번만 찾아 매핑 조회와 데이터 읽기에 함께 사용합니다.
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            card_company_id: 카드사 ID
+            confirm_mapping: 처음 보는 양식의 추측 매핑(또는 지정 매핑)을 확인된 것으로 저장할지 여부
+            column_overrides: 사용자가 지정한 매핑 {내부컬럼명: 엑셀컬럼명}
+        
+        Returns:
+            카드사용내역 데이터 리스트
+        
+        Raises:
+            ValueError: 컬럼 매핑을 정할 수 없거나 확인되지 않은 새 양식인 경우
+        """
+        header_row = detect_header_row(file_path)
+        column_mapping = self.resolve_column_mapping(
+            file_path, card_company_id, header_row,
+            confirm=confirm_mapping, column_overrides=column_overrides
+        )
+        return read_card_transaction_excel(
+            file_path,
+            card_company_id,
+            column_mapping=column_mapping,
+            header_row=header_row
+        )
+    
+    def preview_transactions(
+        self,
+        file_path: str,
+        card_company_id: int,
+        nrows: Optional[int] = PREVIEW_ROWS,
+        column_overrides: Optional[Dict[str, str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        카드사용내역 엑셀 파일 미리보기
+        
+        앞의 nrows개 행만 파싱하고 전체 행 수는 시트 사용 범위로 추정하므로
+        파일 크기와 관계없이 빠르게 표시할 수 있습니다. 처음 보는 양식은 추측한 매핑으로 보여주기만 하고
+        저장하지 않습니다 (등록할 때 resolve_column_mapping(confirm=True)로 저장).
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            card_company_id: 카드사 ID
+            nrows: 읽을 데이터 행 수 (None인 경우 전체, 등록 없이 비교할 때)
+            column_overrides: 사용자가 지정한 매핑 {내부컬럼명: 엑셀컬럼명}
+        
+        Returns:
+            (미리보기 카드사용내역 리스트, 추정 전체 행 수 또는 None)
+        """
+        header_row = detect_header_row(file_path)
+        column_mapping, _ = self.find_column_mapping(
+            file_path, card_company_id, header_row, column_overrides=column_overrides
+        )
+        transactions = read_card_transaction_excel(
+            file_path,
+            card_company_id,
+            column_mapping=column_mapping,
+            header_row=header_row,
+            nrows=nrows
+        )
+        return transactions, estimate_row_count(file_path, header_row=header_row)
+    
+    def import_file(
+        self,
+        file_path: str,
+        card_company_id: int,
+        file_hash: Optional[str] = None,
+        confirm_mapping: bool = False
+    ) -> Dict[str, Any]:
+        """
+        카드사용내역 엑셀 파일 전체를 읽어 등록
+        
+        미리보기 후 전체 등록을 확정했을 때 사용합니다. 화면과 다른 스레드에서 호출할 수 있습니다.
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            card_company_id: 카드사 ID
+            file_hash: 원본 파일 해시 (None인 경우 계산)
+            confirm_mapping: 처음 보는 양식의 매핑을 확인된 것으로 저장할지 여부 (미리보기에서 확인한 경우)
+        
+        Returns:
+            가져오기 배치 딕셔너리 (import_transactions 결과)
+        """
+        transactions = self.read_transactions(file_path, card_company_id, confirm_mapping=confirm_mapping)
+        return self.import_transactions(
+            transactions,
+            card_company_id,
+            source_file=file_path,
+            file_hash=file_hash
+        )
+    
+    def diff_transactions(
+        self,
+        transactions: List[Dict[str, Any]],
+        card_company_id: int
+    ) -> Dict[str, Any]:
+        """
+        등록 전 카드사용내역을 기존 내역과 비교
+        
+        행을 스테이징 임시 테이블에 한 번에 적재하고 card_transaction과의 조인으로
+        신규(new), 기존(existing), 충돌(conflict: 같은 승인번호, 다른 금액),
+        필수 항목 누락(invalid)을 계산합니다. 데이터는 변경하지 않습니다.
+        
+        Args:
+            transactions: 카드사용내역 리스트 (read_card_transaction_excel 결과)
+            card_company_id: 카드사 ID
+        
+        Returns:
+            비교 결과 딕셔너리
+            - statuses: transactions와 같은 순서의 상태 리스트
+            - conflicts: {행 인덱스: 기존 내역 금액}
+            - counts: {상태: 건수}
+        """
+        rows = self._to_staging_rows(transactions, card_company_id)
+        
+        try:
+            with self.db_initializer.session_scope() as session:
+                staging = CardTransactionStagingRepository(session)
+                staging.create()
+                staging.load(rows)
+                statuses, conflicts = staging.classify_rows()
+                staging.drop()
+        except Exception as e:
+            raise RuntimeError(f"기존 카드사용내역 비교 실패: {e}")
+        
+        # row_no는 1부터 시작하는 원본 순서
+        status_list = [statuses[row['row_no']] for row in rows]
+        counts = {
+            status: status_list.count(status)
+            for status in (DIFF_STATUS_NEW, DIFF_STATUS_EXISTING, DIFF_STATUS_CONFLICT, DIFF_STATUS_INVALID)
+        }
+        return {
+            'statuses': status_list,
+            'conflicts': {row_no - 1: amount for row_no, amount in conflicts.items()},
+            'counts': counts,
+        }
+    
+    def import_transactions(
+        self,
+        transactions: List[Dict[str, Any]],
+        card_company_id: int,
+        source_file: Optional[str] = None,
+        file_hash: Optional[str] = None,
+        register_vendors: bool = True
+    ) -> Dict[str, Any]:
+        """
+        카드사용내역 일괄 등록
+        
+        가져오기 배치를 먼저 기록하고, 마스킹 카드번호로 card_id를 일괄 매칭한 뒤
+        행을 스테이징 임시 테이블에 적재하여 거래처 자동 등록과 매칭, 검증, 중복 제외,
+        등록, 부가세 공제 제외 규칙(DEFAULT_EXCLUSION_RULES) 판정과 집계 반영을 하나의 트랜잭션에서
+        SQL로 처리합니다. 등록 후 취소 거래를 원거래와 연결합니다.
+        필수 항목이 없는 행은 실패 건수로 기록하고, 이미 등록된 내역과 같은 행은 건너뜁니다
+        (대상 건수 - 등록 건수 - 실패 건수 = 중복 건수).
+        
+        Args:
+            transactions: 카드사용내역 리스트 (read_card_transaction_excel 결과)
+            card_company_id: 카드사 ID
+            source_file: 원본 파일 경로
+            file_hash: 원본 파일 해시 (None이고 source_file이 있으면 계산)
+            register_vendors: 거래처정보에 없는 사업자등록번호를 거래처로 등록할지 여부
+        
+        Returns:
+            가져오기 배치 딕셔너리 (건수, 소요 시간, 처리량, 카드 매칭 결과 card_match,
+            새로 등록된 거래처 수 registered_vendors, 원거래와 연결된 취소 거래 수
+            paired_cancellations 포함)
+        
+        Raises:
+            RuntimeError: 등록 실패 (배치는 failed 상태로 기록됨)
+        """
+        if file_hash is None and source_file:
+            file_hash = compute_file_hash(source_file)
+        
+        with self.db_initializer.session_scope() as session:
+            batch = ImportBatchRepository(session).create({
+                'card_company_id': card_company_id,
+                'source_file': source_file,
+                'file_hash': file_hash,
+                'status': IMPORT_STATUS_RUNNING,
+                'total_rows': len(transactions),
+                'started_at': datetime.now(),
+            })
+            batch_id = batch.id
+        
+        rows = self._to_staging_rows(transactions, card_company_id)
+        
+        try:
+            with self.db_initializer.session_scope() as session:
+                card_match = self._resolve_card_ids(session, rows, card_company_id)
+                
+                staging = CardTransactionStagingRepository(session)
+                staging.create()
+                staging.load(rows)
+                registered_vendors = staging.register_vendors() if register_vendors else 0
+                staging.resolve_vendor_ids()
+                failed_rows = staging.count_invalid()
+                inserted_rows = staging.insert_transactions(batch_id)
+                staging.drop()
+                # 집계의 제외 건수/금액이 처음부터 맞도록 집계 반영 전에 판정
+                CardTransactionRepository(session).apply_exclusion_rules(
+                    DEFAULT_EXCLUSION_RULES, import_batch_id=batch_id
+                )
+                CardTransactionRollupRepository(session).add_import_batch(batch_id)
+                
+                # 배치 상태 변경과 함께 커밋 (등록과 배치 기록이 한 트랜잭션)
+                batch = ImportBatchRepository(session).update(batch_id, {
+                    'status': IMPORT_STATUS_COMPLETED,
+                    'inserted_rows': inserted_rows,
+                    'failed_rows': failed_rows,
+                    'finished_at': datetime.now(),
+                })
+                result = batch.to_dict()
+                result['card_match'] = card_match.to_dict()
+                result['registered_vendors'] = registered_vendors
+        except Exception as e:
+            with self.db_initializer.session_scope() as session:
+                ImportBatchRepository(session).update(batch_id, {
+                    'status': IMPORT_STATUS_FAILED,
+                    'failed_rows': len(transactions),
+                    'finished_at': datetime.now(),
+                })
+            raise RuntimeError(f"카드사용내역 가져오기 실패: {e}")
+        
+        # 새 취소 거래와, 이번에 등록된 원거래를 기다리던 이전 취소 거래를 연결
+        # (연결 실패는 등록 결과에 영향을 주지 않으며 다음 가져오기나 명령줄 도구에서 다시 연결)
+        try:
+            with self.db_initializer.session_scope() as session:
+                result['paired_cancellations'] = CardTransactionRepository(session).pair_cancellations()
+        except RuntimeError as e:
+            print(f"취소 거래 연결 실패: {e}")
+            result['paired_cancellations'] = 0
+        return result
+    
+    def _resolve_card_ids(
+        self,
+        session: Session,
+        rows: List[Dict[str, Any]],
+        card_company_id: int
+    ) -> CardMatchReport:
+        """
+        마스킹 카드번호로 card_id 일괄 매칭
+        
+        카드사의 카드 마스킹 번호로 인덱스를 한 번 만들고, 배치의 서로 다른 카드번호만
+        비교한 뒤 결과를 모든 행에 적용합니다. 여러 카드와 일치하는 번호는 매칭하지 않고
+        결과에 보고합니다.
+        
+        Args:
+            session: 데이터베이스 세션
+            rows: 스테이징 행 리스트 (card_id가 채워짐)
+            card_company_id: 카드사 ID
+        
+        Returns:
+            CardMatchReport 객체
+        """
+        index = CardNumberIndex(CardRepository(session).get_masked_card_numbers(card_company_id))
+        report = index.resolve(
+            (row['card_company_id'], row['masked_card_number'])
+            for row in rows if row['card_id'] is None
+        )
+        for row in rows:
+            if row['card_id'] is None:
+                row['card_id'] = report.matched.get((row['card_company_id'], row['masked_card_number']))
+        
+        if report.ambiguous:
+            print(f"여러 카드와 일치하는 카드번호가 있어 매칭하지 않았습니다: {report.to_dict()['ambiguous']}")
+        return report
+    
+    def _to_staging_rows(
+        self,
+        transactions: List[Dict[str, Any]],
+        card_company_id: int
+    ) -> List[Dict[str, Any]]:
+        """
+        스테이징 적재용 행 생성
+        
+        값 변환만 하고 검증, 매칭, 중복 제외는 스테이징 테이블에서 SQL로 처리합니다.
+        
+        Args:
+            transactions: 카드사용내역 리스트
+            card_company_id: 카드사 ID
+        
+        Returns:
+            스테이징 행 리스트 (row_no는 원본 순서)
+        """
+        rows = []
+        for row_no, transaction in enumerate(transactions, start=1):
+            transaction_date = transaction.get('transaction_date')
+            
+            # 거래 일자는 ISO 문자열로 전달되므로 datetime으로 변환
+            if isinstance(transaction_date, str):
+                try:
+                    transaction_date = datetime.fromisoformat(transaction_date.replace('Z', '+00:00'))
+                except ValueError:
+                    transaction_date = None
+            
+            rows.append({
+                'row_no': row_no,
+                'card_company_id': transaction.get('card_company_id') or card_company_id,
+                'transaction_date': transaction_date,
+                'masked_card_number': transaction.get('masked_card_number'),
+                'is_cancel': bool(transaction.get('is_cancel', False)),
+                'amount': to_won(transaction.get('amount')),
+                'vendor_name': transaction.get('vendor_name'),
+                'business_number': transaction.get('business_number'),
+                'approval_number': transaction.get('approval_number'),
+                'card_id': transaction.get('card_id'),
+                'vendor_id': transaction.get('vendor_id'),
+            })
+        return rows
+    
+    def find_completed_import(self, file_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        같은 파일의 완료된 가져오기 이력 조회
+        
+        파일을 다시 선택했을 때 파싱 없이 이전 결과를 보여주기 위해 사용합니다.
+        
+        Args:
+            file_hash: 원본 파일 SHA-256 해시 (compute_file_hash 결과)
+        
+        Returns:
+            가져오기 배치 딕셔너리 또는 None
+        """
+        with self.db_initializer.session_scope() as session:
+            batch = ImportBatchRepository(session).get_completed_by_hash(file_hash)
+            return batch.to_dict() if batch else None
+    
+    def get_batch_transaction_rows(self, batch_id: int) -> List[CardTransactionRow]:
+        """
+        가져오기 배치로 등록된 카드사용내역 조회
+        
+        Args:
+            batch_id: 가져오기 배치 ID
+        
+        Returns:
+            CardTransactionRow 리스트
+        """
+        with self.db_initializer.session_scope() as session:
+            return CardTransactionRepository(session).list_rows(import_batch_id=batch_id)
+    
+    def undo_import(self, batch_id: int) -> int:
+        """
+        가져오기 되돌리기
+        
+        Args:
+            batch_id: 가져오기 배치 ID
+        
+        Returns:
+            삭제된 카드사용내역 건수
+        
+        Raises:
+            ValueError: 배치가 존재하지 않는 경우
+        """
+        with self.db_initializer.session_scope() as session:
+            repository = ImportBatchRepository(session)
+            if not repository.get(batch_id):
+                raise ValueError("존재하지 않는 가져오기 배치입니다.")
+            return repository.undo(batch_id)
+    
+    def get_import_batches(self) -> List[Dict[str, Any]]:
+        """
+        가져오기 배치 목록 조회
+        
+        Returns:
+            가져오기 배치 리스트 (최신순, 소요 시간/처리량 포함)
+        """
+        try:
+            with self.db_initializer.session_scope() as session:
+                return [batch.to_dict() for batch in ImportBatchRepository(session).get_all()]
+        except Exception as e:
+            raise RuntimeError(f"가져오기 배치 조회 실패: {e}")
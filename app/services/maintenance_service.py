@@ -0,0 +1,174 @@
+"""
+데이터베이스 유지보수 서비스
+
+대량 등록/삭제 이후 SQLite 통계 갱신과 빈 페이지 반환을 처리합니다.
+"""
+
+import os
+import time
+from typing import Callable, Optional
+from app.repositories.database import DatabaseInitializer, get_database
+from app.config.settings import settings
+
+
+# 이 건수 이상 등록되면 ANALYZE로 플래너 통계 갱신
+ANALYZE_ROW_THRESHOLD = 1000
+
+# 유휴 시간 1회당 반환할 최대 페이지 수 (긴 잠금 방지)
+INCREMENTAL_VACUUM_PAGES = 2000
+
+# PRAGMA auto_vacuum 값 (0: NONE, 1: FULL, 2: INCREMENTAL)
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+class MaintenanceService:
+    """
+    데이터베이스 유지보수 서비스 클래스
+
+    ANALYZE, PRAGMA optimize, PRAGMA incremental_vacuum을 실행하고
+    작업 전후의 소요 시간과 파일 크기를 기록합니다.
+    """
+
+    def __init__(self, database_path: Optional[str] = None):
+        """
+        서비스 초기화
+
+        Args:
+            database_path: 데이터베이스 파일 경로 (None인 경우 설정에서 가져옴)
+        """
+        if database_path is None:
+            database_path = settings.get_database_path()
+        self.db_initializer: DatabaseInitializer = self._initialize_database(database_path)
+
+    def _initialize_database(self, database_path: str) -> DatabaseInitializer:
+        """
+        데이터베이스 초기화
+
+        경로별 공유 엔진을 가져옵니다.
+
+        Args:
+            database_path: 데이터베이스 파일 경로
+
+        Returns:
+            초기화된 DatabaseInitializer 인스턴스
+        """
+        try:
+            return get_database(database_path)
+        except Exception as e:
+            raise RuntimeError(f"데이터베이스 초기화 실패: {e}")
+
+    def get_database_size(self) -> int:
+        """
+        데이터베이스 파일 크기 반환 (WAL 파일 포함)
+
+        Returns:
+            바이트 단위 파일 크기
+        """
+        size = 0
+        for path in (self.db_initializer.database_path, f"{self.db_initializer.database_path}-wal"):
+            if os.path.exists(path):
+                size += os.path.getsize(path)
+        return size
+
+    def _run(self, label: str, operation: Callable) -> None:
+        """
+        유지보수 작업 실행 및 소요 시간/파일 크기 기록
+
+        Args:
+            label: 작업 이름
+            operation: raw DBAPI 커서를 받아 작업을 수행하는 함수
+        """
+        size_before = self.get_database_size()
+        started = time.perf_counter()
+
+        connection = self.db_initializer.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            operation(cursor)
+            connection.commit()
+        except Exception as e:
+            connection.rollback()
+            raise RuntimeError(f"{label} 실패: {e}")
+        finally:
+            connection.close()
+
+        elapsed = time.perf_counter() - started
+        size_after = self.get_database_size()
+        print(
+            f"[DB 유지보수] {label} 완료: {elapsed:.3f}초, "
+            f"파일 크기 {size_before / 1024:,.0f}KB -> {size_after / 1024:,.0f}KB"
+        )
+
+    def analyze(self) -> None:
+        """
+        ANALYZE 실행 (전체 테이블 통계 갱신)
+        """
+        self._run("ANALYZE", lambda cursor: cursor.execute("ANALYZE"))
+
+    def analyze_if_needed(self, row_count: int) -> bool:
+        """
+        대량 등록 이후 ANALYZE 실행
+
+        Args:
+            row_count: 방금 등록/삭제된 행 수
+
+        Returns:
+            ANALYZE 실행 여부
+        """
+        if row_count < ANALYZE_ROW_THRESHOLD:
+            return False
+        self.analyze()
+        return True
+
+    def reindex(self) -> None:
+        """
+        REINDEX 후 ANALYZE 실행 (전체 인덱스 재구성 및 통계 갱신)
+        """
+        self._run("REINDEX", lambda cursor: cursor.execute("REINDEX"))
+        self.analyze()
+
+    def optimize(self) -> None:
+        """
+        PRAGMA optimize 실행
+
+        최근 쿼리에서 통계가 필요했던 테이블만 SQLite가 골라 ANALYZE합니다.
+        """
+        self._run("PRAGMA optimize", lambda cursor: cursor.execute("PRAGMA optimize"))
+
+    def incremental_vacuum(self, max_pages: int = INCREMENTAL_VACUUM_PAGES) -> int:
+        """
+        빈 페이지를 파일 시스템에 반환 (유휴 시간용)
+
+        auto_vacuum = INCREMENTAL이 아니거나 빈 페이지가 없으면 실행하지 않습니다.
+
+        Args:
+            max_pages: 한 번에 반환할 최대 페이지 수
+
+        Returns:
+            반환한 페이지 수
+        """
+        with self.db_initializer.engine.connect() as connection:
+            auto_vacuum = connection.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+            freelist_count = connection.exec_driver_sql("PRAGMA freelist_count").scalar()
+
+        if auto_vacuum != AUTO_VACUUM_INCREMENTAL or not freelist_count:
+            return 0
+
+        pages = min(freelist_count, max_pages)
+        # 결과를 끝까지 읽어야 모든 페이지가 반환됨
+        self._run(
+            f"PRAGMA incremental_vacuum({pages})",
+            lambda cursor: cursor.execute(f"PRAGMA incremental_vacuum({pages})").fetchall()
+        )
+        return pages
+
+    def close(self) -> None:
+        """
+        애플리케이션 종료 시 유지보수
+
+        PRAGMA optimize로 통계를 갱신합니다. 실패해도 종료를 막지 않습니다.
+        """
+        try:
+            self.optimize()
+        except Exception as e:
+            print(f"[DB 유지보수] 종료 시 최적화 실패: {e}")
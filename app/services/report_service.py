@@ -0,0 +1,141 @@
+"""
+부가세 보고서 서비스
+
+카드사용내역 집계 테이블(card_transaction_rollup)에서 월/분기/신고기간별 합계와
+신고기간의 거래처/카드별 합계를 조회합니다. card_transaction을 다시 읽지 않습니다.
+"""
+
+from typing import Optional, Dict, Any, List
+from app.repositories.database import DatabaseInitializer, get_database
+from app.repositories.card_transaction_rollup_repository import CardTransactionRollupRepository
+from app.utils.vat_period import VatPeriod
+from app.config.settings import settings
+
+
+class ReportService:
+    """
+    부가세 보고서 서비스 클래스
+    
+    금액은 원 단위 정수이며 취소 금액을 차감한 합계입니다.
+    """
+    
+    def __init__(self, database_path: Optional[str] = None):
+        """
+        서비스 초기화
+        
+        Args:
+            database_path: 데이터베이스 파일 경로 (None인 경우 설정에서 가져옴)
+        """
+        if database_path is None:
+            database_path = settings.get_database_path()
+        self.db_initializer: DatabaseInitializer = self._initialize_database(database_path)
+    
+    def _initialize_database(self, database_path: str) -> DatabaseInitializer:
+        """
+        데이터베이스 초기화
+        
+        경로별 공유 엔진을 가져옵니다. 세션과 Repository는 작업 단위로 생성합니다.
+        
+        Args:
+            database_path: 데이터베이스 파일 경로
+        
+        Returns:
+            초기화된 DatabaseInitializer 인스턴스
+        """
+        try:
+            return get_database(database_path)
+        except Exception as e:
+            raise RuntimeError(f"데이터베이스 초기화 실패: {e}")
+    
+    def _summarize(self, vat_period_from: int, vat_period_to: int, *group_by: str) -> List[Dict[str, Any]]:
+        """
+        집계 테이블 조회
+        
+        Args:
+            vat_period_from: 시작 신고기간 코드 (포함)
+            vat_period_to: 종료 신고기간 코드 (포함)
+            group_by: 집계 기준 컬럼
+        
+        Returns:
+            집계 딕셔너리 리스트
+        """
+        try:
+            with self.db_initializer.session_scope() as session:
+                return CardTransactionRollupRepository(session).summarize(vat_period_from, vat_period_to, group_by)
+        except Exception as e:
+            raise RuntimeError(f"카드사용내역 집계 조회 실패: {e}")
+    
+    def get_monthly_summary(self, year: int) -> List[Dict[str, Any]]:
+        """
+        연도의 월별 합계
+        
+        Args:
+            year: 연도
+        
+        Returns:
+            월별 집계 리스트 (transaction_month: yyyymm)
+        """
+        return self._summarize(year * 10 + 1, year * 10 + 4, 'transaction_month')
+    
+    def get_quarterly_summary(self, year: int) -> List[Dict[str, Any]]:
+        """
+        연도의 분기(신고기간)별 합계
+        
+        Args:
+            year: 연도
+        
+        Returns:
+            분기별 집계 리스트 (vat_period: 연도 * 10 + 분기)
+        """
+        return self._summarize(year * 10 + 1, year * 10 + 4, 'vat_period')
+    
+    def get_vat_period_summary(self, vat_period: VatPeriod) -> Dict[str, Any]:
+        """
+        신고기간 합계
+        
+        Args:
+            vat_period: 부가세 신고기간
+        
+        Returns:
+            합계 딕셔너리 (transaction_count, cancel_count, gross_amount_won,
+            supply_amount_won, vat_amount_won, 공제 제외분 excluded_count,
+            excluded_supply_amount_won, excluded_vat_amount_won)
+        """
+        return self._summarize(*vat_period.code_range)[0]
+    
+    def get_vendor_summary(self, vat_period: VatPeriod) -> List[Dict[str, Any]]:
+        """
+        신고기간의 사업자등록번호(거래처)별 합계 (신용카드매출전표등 수령명세서 작성용)
+        
+        Args:
+            vat_period: 부가세 신고기간
+        
+        Returns:
+            business_number, vendor_id별 집계 리스트
+        """
+        return self._summarize(*vat_period.code_range, 'business_number', 'vendor_id')
+    
+    def get_card_summary(self, vat_period: VatPeriod) -> List[Dict[str, Any]]:
+        """
+        신고기간의 카드별 합계
+        
+        Args:
+            vat_period: 부가세 신고기간
+        
+        Returns:
+            card_id별 집계 리스트 (0: 카드 미매칭)
+        """
+        return self._summarize(*vat_period.code_range, 'card_id')
+    
+    def rebuild_rollup(self) -> int:
+        """
+        집계 테이블 전체 다시 계산
+        
+        Returns:
+            집계 행 수
+        """
+        try:
+            with self.db_initializer.session_scope() as session:
+                return CardTransactionRollupRepository(session).rebuild()
+        except Exception as e:
+            raise RuntimeError(f"카드사용내역 집계 재계산 실패: {e}")
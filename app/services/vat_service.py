@@ -0,0 +1,207 @@
+"""
+부가세 신고 서비스
+
+부가세 공제 제외 대상을 판정하고 신용카드매출전표등 수령명세서 전산매체 파일을 작성합니다.
+제외 규칙(app/utils/exclusion_rules.py)은 SQL 식 하나로 변환되어 카드사용내역 전체에 일괄 적용되고,
+거래처가 등록되거나 정보가 바뀐 뒤에는 해당 거래처(vendor_exclusion_queue)의 내역만 다시 판정할 수 있습니다.
+카드/가맹점별 합계는 카드사용내역 집계 테이블(card_transaction_rollup)에서 커서로 읽어
+파일에 바로 기록하므로 메모리 사용량이 레코드 수와 무관합니다.
+"""
+
+from typing import Optional, Dict, Any, Iterator, Sequence, Tuple
+from dataclasses import asdict
+from app.repositories.database import DatabaseInitializer, get_database
+from app.repositories.business_info_repository import BusinessInfoRepository
+from app.repositories.card_transaction_repository import CardTransactionRepository
+from app.repositories.card_transaction_rollup_repository import CardTransactionRollupRepository
+from app.repositories.schema import BusinessInfo
+from app.utils.crypto import decrypt_card_number, clean_card_number
+from app.utils.exclusion_rules import ExclusionRule, DEFAULT_EXCLUSION_RULES
+from app.utils.filing_writer import write_filing_file
+from app.utils.vat_period import VatPeriod
+from app.config.settings import settings
+
+
+class VatService:
+    """
+    부가세 신고 서비스 클래스
+    
+    금액은 원 단위 정수이며 취소 금액을 차감한 합계입니다.
+    """
+    
+    def __init__(self, database_path: Optional[str] = None):
+        """
+        서비스 초기화
+        
+        Args:
+            database_path: 데이터베이스 파일 경로 (None인 경우 설정에서 가져옴)
+        """
+        if database_path is None:
+            database_path = settings.get_database_path()
+        self.db_initializer: DatabaseInitializer = self._initialize_database(database_path)
+    
+    def _initialize_database(self, database_path: str) -> DatabaseInitializer:
+        """
+        데이터베이스 초기화
+        
+        경로별 공유 엔진을 가져옵니다. 세션과 Repository는 작업 단위로 생성합니다.
+        
+        Args:
+            database_path: 데이터베이스 파일 경로
+        
+        Returns:
+            초기화된 DatabaseInitializer 인스턴스
+        """
+        try:
+            return get_database(database_path)
+        except Exception as e:
+            raise RuntimeError(f"데이터베이스 초기화 실패: {e}")
+    
+    def identify_exclusion_targets(
+        self,
+        vat_period: Optional[VatPeriod] = None,
+        rules: Optional[Sequence[ExclusionRule]] = None,
+        dirty_vendors_only: bool = False
+    ) -> Dict[str, Any]:
+        """
+        부가세 공제 제외 대상 판정 (제외 규칙 일괄 적용)
+        
+        다시 실행하면 판정이 바뀐 내역만 갱신합니다. 거래처가 등록되거나 정보가 바뀐 뒤에는 dirty_vendors_only로
+        해당 거래처(재판정 대기열)의 내역만 다시 판정할 수 있습니다.
+        
+        Args:
+            vat_period: 부가세 신고기간 (None인 경우 전체 기간)
+            rules: 제외 규칙 (None인 경우 DEFAULT_EXCLUSION_RULES)
+            dirty_vendors_only: 재판정 대기 거래처의 내역만 판정할지 여부
+        
+        Returns:
+            판정 결과 딕셔너리 (updated: 제외 사유가 바뀐 건수,
+            dirty_vendors_only인 경우 vendors: 재판정한 거래처 수, 아닌 경우 reasons: 제외 사유별 건수)
+        
+        Raises:
+            RuntimeError: 규칙 적용 실패 시
+        """
+        if rules is None:
+            rules = DEFAULT_EXCLUSION_RULES
+        
+        try:
+            with self.db_initializer.session_scope() as session:
+                repo = CardTransactionRepository(session)
+                if dirty_vendors_only:
+                    vendors = repo.count_dirty_vendors()
+                    updated = repo.apply_exclusion_rules(rules, vat_period=vat_period, dirty_vendors_only=True) if vendors else 0
+                    return {'updated': updated, 'vendors': vendors}
+                
+                updated = repo.apply_exclusion_rules(rules, vat_period=vat_period)
+                return {'updated': updated, 'reasons': repo.count_exclusions(vat_period=vat_period)}
+        except Exception as e:
+            raise RuntimeError(f"부가세 공제 제외 대상 판정 실패: {e}")
+    
+    def generate_electronic_file(
+        self,
+        output_path: str,
+        vat_period: VatPeriod,
+        business_number: Optional[str] = None,
+        rules: Optional[Sequence[ExclusionRule]] = None
+    ) -> Dict[str, Any]:
+        """
+        신용카드매출전표등 수령명세서 전산매체 파일 작성
+        
+        작성 전에 신고기간의 내역에 제외 규칙을 다시 적용하므로 판정되지 않은 내역이나
+        판정 후 거래처 정보가 바뀐 내역도 현재 규칙과 거래처 정보로 판정됩니다 (바뀐 내역만 갱신).
+        공제 제외 대상과 카드 미매칭 거래, 가맹점 사업자등록번호가 없는 거래는
+        명세서에 기재하지 않으며, 기재하지 않은 금액은 결과의 excluded_* 항목으로 알려줍니다.
+        
+        Args:
+            output_path: 출력 파일 경로
+            vat_period: 부가세 신고기간
+            business_number: 제출자 사업자등록번호 (None인 경우 등록된 사업자가 하나일 때 그 사업자)
+            rules: 제외 규칙 (None인 경우 DEFAULT_EXCLUSION_RULES)
+        
+        Returns:
+            작성 결과 딕셔너리 (output_path, data_count, transaction_count, supply_amount,
+            vat_amount, checksum, file_size, excluded_supply_amount, excluded_vat_amount,
+            작성 전 판정에서 제외 사유가 바뀐 건수 exclusion_updates)
+        
+        Raises:
+            ValueError: 제출자 사업자를 정할 수 없거나 카드번호를 복호화할 수 없는 경우
+            RuntimeError: 파일 작성 실패 시
+        """
+        if rules is None:
+            rules = DEFAULT_EXCLUSION_RULES
+        
+        try:
+            with self.db_initializer.session_scope() as session:
+                business = self._get_submitter(session, business_number)
+                exclusion_updates = CardTransactionRepository(session).apply_exclusion_rules(rules, vat_period=vat_period)
+                rollup_repo = CardTransactionRollupRepository(session)
+                
+                result = write_filing_file(
+                    output_path,
+                    business.business_number,
+                    business.business_name,
+                    business.owner_name,
+                    vat_period,
+                    self._filing_records(rollup_repo.iter_card_vendor_totals(*vat_period.code_range))
+                )
+                
+                # 전체 합계와의 차이 = 명세서에서 제외된 금액
+                total = rollup_repo.summarize(*vat_period.code_range)[0]
+                summary = asdict(result)
+                summary['excluded_supply_amount'] = total['supply_amount_won'] - result.supply_amount
+                summary['excluded_vat_amount'] = total['vat_amount_won'] - result.vat_amount
+                summary['exclusion_updates'] = exclusion_updates
+                return summary
+        except ValueError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"전산매체 파일 작성 실패: {e}")
+    
+    def _get_submitter(self, session, business_number: Optional[str]) -> BusinessInfo:
+        """
+        제출자 사업자 조회
+        
+        Args:
+            session: 데이터베이스 세션
+            business_number: 사업자등록번호 (None인 경우 등록된 유일한 사업자)
+        
+        Returns:
+            BusinessInfo
+        
+        Raises:
+            ValueError: 사업자가 없거나 여러 개인데 지정하지 않은 경우
+        """
+        repo = BusinessInfoRepository(session)
+        if business_number:
+            business = repo.get_by_registration_number(business_number.replace('-', ''))
+            if business is None:
+                raise ValueError(f"등록되지 않은 사업자등록번호입니다: {business_number}")
+            return business
+        
+        businesses = repo.get_all(limit=2)
+        if len(businesses) != 1:
+            raise ValueError("제출자 사업자등록번호를 지정하세요. (등록된 사업자가 없거나 여러 개입니다)")
+        return businesses[0]
+    
+    def _filing_records(
+        self,
+        totals: Iterator[Tuple[int, str, str, int, int, int]]
+    ) -> Iterator[Tuple[str, str, int, int, int]]:
+        """
+        카드/가맹점별 합계를 전산매체 데이터 레코드 값으로 변환
+        
+        카드번호 복호화는 카드마다 한 번만 합니다 (합계가 카드 순으로 정렬되어 있음).
+        
+        Args:
+            totals: (card_id, 암호화된 카드번호, 사업자등록번호, 건수, 공급가액, 세액) 이터레이터
+        
+        Returns:
+            (카드번호, 가맹점 사업자등록번호, 건수, 공급가액, 세액) 이터레이터
+        """
+        current_card_id = None
+        card_number = ''
+        for card_id, encrypted_card_number, business_number, count, supply_amount, vat_amount in totals:
+            if card_id != current_card_id:
+                current_card_id = card_id
+                card_number = clean_card_number(decrypt_card_number(encrypted_card_number))
+            yield card_number, business_number, count, supply_amount, vat_amount
@@ -5,9 +5,12 @@
 """
 
 from typing import Optional, Dict, Any, List
-from app.repositories.database import DatabaseInitializer
+from app.repositories.database import DatabaseInitializer, get_database
+from sqlalchemy.orm import Session
 from app.repositories.vendor_repository import VendorRepository
+from app.repositories.common_code_repository import CommonCodeRepository
 from app.repositories.schema import VendorInfo
+from app.repositories.projections import VendorRow
 from app.config.settings import settings
 
 
@@ -27,32 +30,31 @@ class VendorService:
         """
         if database_path is None:
             database_path = settings.get_database_path()
-        self.db_initializer = DatabaseInitializer(database_path)
-        self.repository: Optional[VendorRepository] = None
-        self._initialize_repository()
+        self.db_initializer: DatabaseInitializer = self._initialize_database(database_path)
     
-    def _initialize_repository(self) -> None:
+    def _initialize_database(self, database_path: str) -> DatabaseInitializer:
         """
-        Repository 초기화
+        데이터베이스 초기화
         
-        데이터베이스가 초기화되지 않은 경우 초기화하고 Repository를 생성합니다.
+        경로별 공유 엔진을 가져옵니다. 세션과 Repository는 작업 단위로 생성합니다.
+        
+        Args:
+            database_path: 데이터베이스 파일 경로
+        
+        Returns:
+            초기화된 DatabaseInitializer 인스턴스
         """
         try:
-            # 데이터베이스 초기화 (이미 초기화된 경우 무시됨)
-            self.db_initializer.initialize_database()
-            
-            # 세션 생성
-            session = self.db_initializer.get_session()
-            self.repository = VendorRepository(session)
-            
+            return get_database(database_path)
         except Exception as e:
             raise RuntimeError(f"데이터베이스 초기화 실패: {e}")
     
-    def _get_code_name(self, code_group: str, code: Optional[str]) -> Optional[str]:
+    def _get_code_name(self, session: Session, code_group: str, code: Optional[str]) -> Optional[str]:
         """
         공통코드에서 코드명 가져오기
         
         Args:
+            session: 현재 작업 단위의 세션
             code_group: 코드 그룹명
             code: 코드 값
         
@@ -63,11 +65,9 @@ class VendorService:
             return None
         
         try:
-            from app.services.common_code_service import CommonCodeService
-            common_code_service = CommonCodeService()
             # code_group을 소문자로 변환하여 조회
-            common_code = common_code_service.get_common_code(code_group.lower(), code)
-            return common_code.get('code_name') if common_code else None
+            common_code = CommonCodeRepository(session).get(code_group.lower(), code)
+            return common_code.code_name if common_code else None
         except:
             return None
     
@@ -84,9 +84,6 @@ class VendorService:
         Raises:
             ValueError: 필수 필드가 누락된 경우
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         # 필수 필드 검사
         required_fields = ['business_number', 'vendor_name']
         for field in required_fields:
@@ -94,7 +91,8 @@ class VendorService:
                 raise ValueError(f"{field}은(는) 필수 입력 항목입니다.")
         
         try:
-            return self.repository.create(data)
+            with self.db_initializer.session_scope() as session:
+                return VendorRepository(session).create(data)
         except ValueError as e:
             # 제약조건 위반 등의 ValueError는 그대로 전달
             raise e
@@ -111,18 +109,16 @@ class VendorService:
         Returns:
             거래처 정보 딕셔너리 또는 None (tax_type_name, business_status_name 포함)
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
-        vendor = self.repository.get(vendor_id)
-        if not vendor:
-            return None
-        
-        vendor_dict = vendor.to_dict()
-        
-        # 코드명 추가 (code_group을 소문자로 변환)
-        vendor_dict['tax_type_name'] = self._get_code_name('tax_type', vendor.tax_type)
-        vendor_dict['business_status_name'] = self._get_code_name('business_status', vendor.business_status)
+        with self.db_initializer.session_scope() as session:
+            vendor = VendorRepository(session).get(vendor_id)
+            if not vendor:
+                return None
+            
+            vendor_dict = vendor.to_dict()
+            
+            # 코드명 추가 (code_group을 소문자로 변환)
+            vendor_dict['tax_type_name'] = self._get_code_name(session, 'tax_type', vendor.tax_type)
+            vendor_dict['business_status_name'] = self._get_code_name(session, 'business_status', vendor.business_status)
         
         return vendor_dict
     
@@ -137,19 +133,17 @@ class VendorService:
         Returns:
             수정된 거래처 정보 딕셔너리 또는 None (tax_type_name, business_status_name 포함)
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         try:
-            updated_vendor = self.repository.update(vendor_id, update_data)
-            if not updated_vendor:
-                return None
-            
-            vendor_dict = updated_vendor.to_dict()
-            
-            # 코드명 추가 (code_group을 소문자로 변환)
-            vendor_dict['tax_type_name'] = self._get_code_name('tax_type', updated_vendor.tax_type)
-            vendor_dict['business_status_name'] = self._get_code_name('business_status', updated_vendor.business_status)
+            with self.db_initializer.session_scope() as session:
+                updated_vendor = VendorRepository(session).update(vendor_id, update_data)
+                if not updated_vendor:
+                    return None
+                
+                vendor_dict = updated_vendor.to_dict()
+                
+                # 코드명 추가 (code_group을 소문자로 변환)
+                vendor_dict['tax_type_name'] = self._get_code_name(session, 'tax_type', updated_vendor.tax_type)
+                vendor_dict['business_status_name'] = self._get_code_name(session, 'business_status', updated_vendor.business_status)
             
             return vendor_dict
         except Exception as e:
@@ -165,11 +159,9 @@ class VendorService:
         Returns:
             삭제 성공 여부
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         try:
-            return self.repository.delete(vendor_id)
+            with self.db_initializer.session_scope() as session:
+                return VendorRepository(session).delete(vendor_id)
         except Exception as e:
             raise RuntimeError(f"거래처 정보 삭제 실패: {e}")
     
@@ -180,23 +172,8 @@ class VendorService:
         Returns:
             거래처 정보 리스트 (tax_type_name, business_status_name 포함)
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         try:
-            from app.repositories.schema import VendorInfo
-            session = self.db_initializer.get_session()
-            results = session.query(VendorInfo).all()
-            
-            vendors = []
-            for vendor in results:
-                vendor_dict = vendor.to_dict()
-                # 코드명 추가 (code_group을 소문자로 변환)
-                vendor_dict['tax_type_name'] = self._get_code_name('tax_type', vendor.tax_type)
-                vendor_dict['business_status_name'] = self._get_code_name('business_status', vendor.business_status)
-                vendors.append(vendor_dict)
-            
-            return vendors
+            return [row.to_dict() for row in self.search_vendor_rows()]
         except Exception as e:
             raise RuntimeError(f"거래처 정보 조회 실패: {e}")
     
@@ -219,42 +196,46 @@ class VendorService:
         Returns:
             검색된 거래처 정보 리스트 (tax_type_name, business_status_name 포함)
         """
-        if not self.repository:
-            raise RuntimeError("Repository가 초기화되지 않았습니다.")
-        
         try:
-            from app.repositories.schema import VendorInfo
-            
-            session = self.db_initializer.get_session()
-            query = session.query(VendorInfo)
-            
-            # 사업자등록번호로 검색 (부분 일치)
-            if business_number:
-                query = query.filter(VendorInfo.business_number.like(f"%{business_number}%"))
-            
-            # 거래처명으로 검색 (부분 일치)
-            if vendor_name:
-                query = query.filter(VendorInfo.vendor_name.like(f"%{vendor_name}%"))
-            
-            # 과세유형으로 필터링
-            if tax_type:
-                query = query.filter(VendorInfo.tax_type == tax_type)
-            
-            # 사업자 상태로 필터링
-            if business_status:
-                query = query.filter(VendorInfo.business_status == business_status)
-            
-            results = query.all()
-            
-            vendors = []
-            for vendor in results:
-                vendor_dict = vendor.to_dict()
-                # 코드명 추가 (code_group을 소문자로 변환)
-                vendor_dict['tax_type_name'] = self._get_code_name('tax_type', vendor.tax_type)
-                vendor_dict['business_status_name'] = self._get_code_name('business_status', vendor.business_status)
-                vendors.append(vendor_dict)
-            
-            return vendors
+            results = self.search_vendor_rows(
+                business_number=business_number,
+                vendor_name=vendor_name,
+                tax_type=tax_type,
+                business_status=business_status
+            )
+            return [row.to_dict() for row in results]
         except Exception as e:
             raise RuntimeError(f"거래처 정보 검색 실패: {e}")
-
+    
+    def search_vendor_rows(
+        self,
+        business_number: Optional[str] = None,
+        vendor_name: Optional[str] = None,
+        tax_type: Optional[str] = None,
+        business_status: Optional[str] = None
+    ) -> List[VendorRow]:
+        """
+        거래처 정보 목록 조회 (조회 전용)
+        
+        코드명을 포함한 VendorRow를 한 번의 쿼리로 가져옵니다.
+        테이블 모델은 반환된 행을 그대로 사용할 수 있습니다.
+        
+        Args:
+            business_number: 사업자등록번호 (선택, 부분 일치)
+            vendor_name: 거래처명 (선택, 부분 일치)
+            tax_type: 과세유형 (선택)
+            business_status: 사업자 상태 (선택)
+        
+        Returns:
+            VendorRow 리스트
+        """
+        try:
+            with self.db_initializer.session_scope() as session:
+                return VendorRepository(session).list_rows(
+                    business_number=business_number,
+                    vendor_name=vendor_name,
+                    tax_type=tax_type,
+                    business_status=business_status
+                )
+        except Exception as e:
+            raise RuntimeError(f"거래처 정보 조회 실패: {e}")
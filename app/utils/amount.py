@@ -0,0 +1,54 @@
+"""
+금액 유틸리티
+
+카드사용내역 금액을 원 단위 정수로 변환하고, 부가세 포함 금액을 공급가액과 부가세로 나눕니다.
+SQL에서 같은 규칙으로 계산하는 곳(가져오기 스테이징, 마이그레이션)과 결과가 같아야 합니다.
+"""
+
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Any, Optional, Tuple
+
+
+# 부가세 포함 금액에서 부가세를 구할 때 나누는 값 (세율 10%: 합계 / 11)
+VAT_DIVISOR = 11
+
+
+def to_won(value: Any) -> Optional[int]:
+    """
+    금액을 원 단위 정수로 변환
+    
+    원 미만은 반올림합니다 (0.5는 0에서 먼 쪽, SQLite ROUND()와 같음).
+    
+    Args:
+        value: 금액 (int, float, Decimal 또는 숫자 문자열)
+    
+    Returns:
+        원 단위 정수 또는 None (값이 없거나 숫자가 아닌 경우)
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    try:
+        return int(Decimal(str(value)).quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+    except (InvalidOperation, ValueError, OverflowError):
+        return None
+
+
+def split_vat(amount_won: int) -> Tuple[int, int]:
+    """
+    부가세 포함 금액을 공급가액과 부가세로 분리
+    
+    부가세는 합계 금액 / 11에서 원 미만을 절사하고(0 방향, SQLite 정수 나눗셈과 같음),
+    공급가액은 합계 금액에서 부가세를 뺀 값입니다. 취소(음수) 금액도 같은 규칙입니다.
+    
+    Args:
+        amount_won: 부가세 포함 금액 (원)
+    
+    Returns:
+        (공급가액, 부가세)
+    """
+    vat = abs(amount_won) // VAT_DIVISOR
+    if amount_won < 0:
+        vat = -vat
+    return amount_won - vat, vat
@@ -0,0 +1,181 @@
+"""
+마스킹 카드번호 매칭 유틸리티
+
+카드사 엑셀의 마스킹 카드번호(예: 1234-56**-****-7890, ****-****-****-7890)를
+등록된 카드정보의 마스킹 카드번호와 비교하여 카드 ID를 찾는 기능을 제공합니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# 마스킹 문자로 취급할 문자
+MASK_CHARACTERS = '*xX#•●'
+
+# 매칭으로 인정할 최소 일치 숫자 수 (앞자리 + 뒷자리)
+MIN_MATCHING_DIGITS = 4
+
+# 인덱스 버킷 키 길이 (앞 4자리, 뒤 4자리)
+BUCKET_DIGITS = 4
+
+
+def normalize_masked_card_number(value: Optional[str]) -> str:
+    """
+    마스킹 카드번호 정규화
+    
+    구분자(하이픈, 공백 등)를 제거하고 마스킹 문자는 '*'로 통일합니다.
+    
+    Args:
+        value: 마스킹 카드번호
+    
+    Returns:
+        숫자와 '*'로만 이루어진 문자열
+    """
+    if not value:
+        return ''
+    return ''.join(
+        '*' if char in MASK_CHARACTERS else char
+        for char in str(value)
+        if char.isdigit() or char in MASK_CHARACTERS
+    )
+
+
+def visible_digits(value: Optional[str]) -> Tuple[str, str]:
+    """
+    마스킹 카드번호의 보이는 앞자리/뒷자리 숫자 추출
+    
+    Args:
+        value: 마스킹 카드번호
+    
+    Returns:
+        (앞자리 숫자, 뒷자리 숫자) - 마스킹이 없으면 둘 다 전체 숫자
+    """
+    normalized = normalize_masked_card_number(value)
+    prefix = normalized.split('*', 1)[0]
+    suffix = normalized.rsplit('*', 1)[-1]
+    return prefix, suffix
+
+
+def _matching_digits(left: Tuple[str, str], right: Tuple[str, str]) -> int:
+    """
+    두 패턴의 일치 숫자 수 (앞자리/뒷자리 중 하나라도 어긋나면 0)
+    
+    Args:
+        left: (앞자리, 뒷자리)
+        right: (앞자리, 뒷자리)
+    
+    Returns:
+        일치하는 숫자 수
+    """
+    (left_prefix, left_suffix), (right_prefix, right_suffix) = left, right
+    prefix_length = min(len(left_prefix), len(right_prefix))
+    suffix_length = min(len(left_suffix), len(right_suffix))
+    if left_prefix[:prefix_length] != right_prefix[:prefix_length]:
+        return 0
+    if suffix_length and left_suffix[-suffix_length:] != right_suffix[-suffix_length:]:
+        return 0
+    return prefix_length + suffix_length
+
+
+@dataclass
+class CardMatchReport:
+    """카드 매칭 결과"""
+    
+    # {(카드사 ID, 마스킹 카드번호): 카드 ID}
+    matched: Dict[Tuple[int, str], int] = field(default_factory=dict)
+    # {(카드사 ID, 마스킹 카드번호): 후보 카드 ID 리스트} - 둘 이상의 카드와 일치
+    ambiguous: Dict[Tuple[int, str], List[int]] = field(default_factory=dict)
+    # 일치하는 카드가 없는 (카드사 ID, 마스킹 카드번호)
+    unmatched: List[Tuple[int, str]] = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        """결과를 딕셔너리로 변환 (마스킹 카드번호 기준)"""
+        return {
+            'matched': {masked: card_id for (_, masked), card_id in self.matched.items()},
+            'ambiguous': {masked: card_ids for (_, masked), card_ids in self.ambiguous.items()},
+            'unmatched': [masked for _, masked in self.unmatched],
+        }
+
+
+class CardNumberIndex:
+    """
+    마스킹 카드번호 인덱스
+    
+    카드정보의 마스킹 카드번호를 (카드사 ID, 앞 4자리)와 (카드사 ID, 뒤 4자리) 버킷으로
+    한 번만 색인하고, 가져오기 배치의 서로 다른 카드번호마다 한 번씩만 비교합니다.
+    """
+    
+    def __init__(self, cards: Iterable[Tuple[int, int, Optional[str]]]):
+        """
+        인덱스 생성
+        
+        Args:
+            cards: (카드 ID, 카드사 ID, 마스킹 카드번호) 목록
+        """
+        self._prefix_buckets: Dict[Tuple[int, str], List[Tuple[int, Tuple[str, str]]]] = {}
+        self._suffix_buckets: Dict[Tuple[int, str], List[Tuple[int, Tuple[str, str]]]] = {}
+        for card_id, card_company_id, masked_card_number in cards:
+            pattern = visible_digits(masked_card_number)
+            prefix, suffix = pattern
+            if len(prefix) >= BUCKET_DIGITS:
+                self._prefix_buckets.setdefault(
+                    (card_company_id, prefix[:BUCKET_DIGITS]), []
+                ).append((card_id, pattern))
+            if len(suffix) >= BUCKET_DIGITS:
+                self._suffix_buckets.setdefault(
+                    (card_company_id, suffix[-BUCKET_DIGITS:]), []
+                ).append((card_id, pattern))
+    
+    def candidates(self, card_company_id: int, masked_card_number: Optional[str]) -> List[int]:
+        """
+        마스킹 카드번호와 일치하는 카드 ID 목록
+        
+        Args:
+            card_company_id: 카드사 ID
+            masked_card_number: 마스킹 카드번호
+        
+        Returns:
+            일치하는 카드 ID 리스트 (일치 숫자 수가 가장 많은 카드만)
+        """
+        pattern = visible_digits(masked_card_number)
+        prefix, suffix = pattern
+        if len(suffix) >= BUCKET_DIGITS:
+            bucket = self._suffix_buckets.get((card_company_id, suffix[-BUCKET_DIGITS:]), [])
+        elif len(prefix) >= BUCKET_DIGITS:
+            bucket = self._prefix_buckets.get((card_company_id, prefix[:BUCKET_DIGITS]), [])
+        else:
+            return []
+        
+        best_score = MIN_MATCHING_DIGITS
+        best_card_ids: List[int] = []
+        for card_id, card_pattern in bucket:
+            score = _matching_digits(pattern, card_pattern)
+            if score > best_score:
+                best_score = score
+                best_card_ids = [card_id]
+            elif score == best_score and card_id not in best_card_ids:
+                best_card_ids.append(card_id)
+        return best_card_ids
+    
+    def resolve(self, keys: Iterable[Tuple[int, Optional[str]]]) -> CardMatchReport:
+        """
+        (카드사 ID, 마스킹 카드번호) 목록을 한 번에 매칭
+        
+        같은 카드번호는 한 번만 비교합니다.
+        
+        Args:
+            keys: (카드사 ID, 마스킹 카드번호) 목록
+        
+        Returns:
+            CardMatchReport 객체
+        """
+        report = CardMatchReport()
+        for key in dict.fromkeys(key for key in keys if key[1]):
+            card_ids = self.candidates(*key)
+            if len(card_ids) == 1:
+                report.matched[key] = card_ids[0]
+            elif card_ids:
+                report.ambiguous[key] = card_ids
+            else:
+                report.unmatched.append(key)
+        return report
@@ -0,0 +1,165 @@
+"""
+중복 구매 후보 탐지 유틸리티
+
+카드사 명세서와 법인카드 포털 내보내기처럼 서로 다른 가져오기에 같은 구매가
+가맹점명만 조금 다르게 들어온 경우를 찾습니다.
+(거래 일자, 금액, 사업자등록번호, 취소 여부)로 버킷을 만들고 같은 버킷 안에서만
+가맹점명을 비교하므로 전체 쌍 비교(O(n²)) 없이 거의 선형 시간에 처리됩니다.
+"""
+
+import re
+from dataclasses import dataclass, asdict
+from datetime import date
+from difflib import SequenceMatcher
+from itertools import combinations
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+
+# 중복 후보로 판단할 가맹점명 최소 유사도 (0~1)
+DEFAULT_SIMILARITY_THRESHOLD = 0.8
+
+# 한쪽 가맹점명이 다른 쪽에 포함될 때의 유사도 (예: '스타벅스' / '스타벅스 강남점')
+CONTAINED_NAME_SIMILARITY = 0.9
+
+# 비교 전에 제거할 법인 표기
+_CORPORATE_MARKERS = re.compile(r'\(주\)|㈜|주식회사|\(유\)|유한회사|\(사\)|co\.?,?\s*ltd\.?|inc\.?|corp\.?')
+
+# 비교 전에 제거할 문자 (공백, 괄호, 구두점 등 글자/숫자가 아닌 문자)
+_NON_WORD_CHARACTERS = re.compile(r'[\W_]+')
+
+
+def normalize_vendor_name(value: Optional[str]) -> str:
+    """
+    가맹점명 정규화
+    
+    소문자로 바꾸고 법인 표기와 공백, 구두점을 제거합니다.
+    
+    Args:
+        value: 가맹점명
+    
+    Returns:
+        정규화된 가맹점명
+    """
+    if not value:
+        return ''
+    name = _CORPORATE_MARKERS.sub('', str(value).lower())
+    return _NON_WORD_CHARACTERS.sub('', name)
+
+
+def vendor_name_similarity(left: Optional[str], right: Optional[str]) -> float:
+    """
+    두 가맹점명의 유사도
+    
+    Args:
+        left: 가맹점명
+        right: 가맹점명
+    
+    Returns:
+        0~1 사이의 유사도 (둘 다 비어 있으면 1.0)
+    """
+    left_name, right_name = normalize_vendor_name(left), normalize_vendor_name(right)
+    if left_name == right_name:
+        return 1.0
+    if not left_name or not right_name:
+        return 0.0
+    
+    similarity = SequenceMatcher(None, left_name, right_name).ratio()
+    shorter, longer = sorted((left_name, right_name), key=len)
+    if len(shorter) >= 2 and shorter in longer:
+        similarity = max(similarity, CONTAINED_NAME_SIMILARITY)
+    return similarity
+
+
+@dataclass(frozen=True)
+class DuplicateCandidate:
+    """중복 구매 후보 (검토 대상 카드사용내역 한 쌍)"""
+    
+    transaction_id: int
+    duplicate_transaction_id: int
+    transaction_day: date
+    amount_won: int
+    business_number: str
+    vendor_name: Optional[str]
+    duplicate_vendor_name: Optional[str]
+    similarity: float
+    # 두 내역의 승인번호가 같은지 여부 (승인번호가 없는 경우 False)
+    same_approval_number: bool
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """결과를 딕셔너리로 변환 (날짜는 ISO 문자열)"""
+        result = asdict(self)
+        result['transaction_day'] = self.transaction_day.isoformat()
+        return result
+
+
+def _bucket_key(transaction: Any) -> Optional[Hashable]:
+    """
+    버킷 키 생성 (거래 일자, 금액, 사업자등록번호, 취소 여부)
+    
+    Args:
+        transaction: 카드사용내역 행 (CardTransactionRow 또는 get()을 지원하는 딕셔너리)
+    
+    Returns:
+        버킷 키 또는 None (거래 일자나 사업자등록번호가 없어 비교할 수 없는 경우)
+    """
+    transaction_date = transaction.get('transaction_date')
+    business_number = transaction.get('business_number')
+    if transaction_date is None or not business_number:
+        return None
+    return (
+        transaction_date.date(),
+        transaction.get('amount_won'),
+        business_number,
+        bool(transaction.get('is_cancel')),
+    )
+
+
+def find_duplicate_candidates(
+    transactions: Iterable[Any],
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+) -> List[DuplicateCandidate]:
+    """
+    서로 다른 가져오기에 들어온 중복 구매 후보 찾기
+    
+    같은 가져오기 배치 안의 내역끼리는 비교하지 않습니다
+    (같은 날 같은 가맹점에서 같은 금액을 두 번 결제한 정상 거래일 수 있음).
+    
+    Args:
+        transactions: 카드사용내역 행 목록 (id, import_batch_id 포함)
+        threshold: 가맹점명 최소 유사도
+    
+    Returns:
+        DuplicateCandidate 리스트 (거래 일자, 사업자등록번호 순)
+    """
+    buckets: Dict[Hashable, List[Any]] = {}
+    for transaction in transactions:
+        key = _bucket_key(transaction)
+        if key is not None:
+            buckets.setdefault(key, []).append(transaction)
+    
+    candidates: List[DuplicateCandidate] = []
+    for (transaction_day, amount_won, business_number, _), bucket in buckets.items():
+        if len(bucket) < 2:
+            continue
+        for left, right in combinations(bucket, 2):
+            left_batch, right_batch = left.get('import_batch_id'), right.get('import_batch_id')
+            if left_batch is not None and left_batch == right_batch:
+                continue
+            similarity = vendor_name_similarity(left.get('vendor_name'), right.get('vendor_name'))
+            if similarity < threshold:
+                continue
+            left_approval, right_approval = left.get('approval_number'), right.get('approval_number')
+            candidates.append(DuplicateCandidate(
+                transaction_id=left.get('id'),
+                duplicate_transaction_id=right.get('id'),
+                transaction_day=transaction_day,
+                amount_won=amount_won,
+                business_number=business_number,
+                vendor_name=left.get('vendor_name'),
+                duplicate_vendor_name=right.get('vendor_name'),
+                similarity=round(similarity, 3),
+                same_approval_number=bool(left_approval) and left_approval == right_approval,
+            ))
+    
+    candidates.sort(key=lambda candidate: (candidate.transaction_day, candidate.business_number))
+    return candidates
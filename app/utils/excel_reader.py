@@ -4,16 +4,224 @@
 카드사용내역 엑셀 파일을 읽고 파싱하는 유틸리티 함수를 제공합니다.
 """
 
-from typing import List, Dict, Any, Optional
+import hashlib
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+import openpyxl
 import pandas as pd
+from app.utils.amount import to_won
+
+
+# 헤더 서명 계산 시 헤더 구분자 (헤더명에 나타나지 않는 단위 구분 문자)
+HEADER_SIGNATURE_SEPARATOR = '\x1f'
+
+# 카드사용내역 필수 컬럼
+REQUIRED_COLUMNS = ['transaction_date', 'amount']
+
+# 내부 컬럼별 엑셀 컬럼명 후보 단어 (컬럼명과 같거나 컬럼명에 포함되면 매칭, 앞에 있는 단어일수록 우선)
+COLUMN_VOCABULARIES = {
+    'transaction_date': ['거래일자', '이용일', '거래일', '승인일자', 'transaction_date', 'date'],
+    'masked_card_number': ['카드번호', 'card_number', '카드'],
+    'is_cancel': ['승인취소', '구분', '취소여부', 'status', '거래구분'],
+    'amount': ['이용금액', '금액', '승인금액', '거래금액', 'amount'],
+    'vendor_name': ['가맹점명', '거래처명', '상호', 'vendor', '가맹점'],
+    'business_number': ['사업자번호', '사업자등록번호', 'business_number'],
+    'approval_number': ['승인번호', 'approval_number', '승인'],
+}
+
+# 컬럼명 매칭 점수 (후보 단어와 같으면 EXACT, 포함하면 PARTIAL에서 후보 단어 순서만큼 감점)
+_EXACT_MATCH_SCORE = 100
+_PARTIAL_MATCH_SCORE = 50
+
+# 후보 단어 -> 그 단어를 가진 내부 컬럼 (정확히 일치하는 컬럼명의 소유 판단)
+_EXACT_FIELDS = {word: field for field, vocabulary in COLUMN_VOCABULARIES.items() for word in vocabulary}
+
+# 헤더 행을 찾기 위해 읽을 상단 행 수 (제목, 조회기간, 계좌 정보 등 안내 행 포함)
+HEADER_SCAN_ROWS = 20
+
+# 하단 합계 행 판별 단어
+TOTAL_ROW_KEYWORDS = ['합계', '총계', '소계', 'total']
+
+
+def normalize_headers(columns: List[Any]) -> List[str]:
+    """
+    엑셀 헤더 정규화 (문자열 변환, 앞뒤 공백 제거, 소문자 변환)
+    
+    Args:
+        columns: 엑셀 파일의 컬럼명 리스트
+    
+    Returns:
+        정규화된 컬럼명 리스트
+    """
+    return [str(col).strip().lower() for col in columns]
+
+
+def compute_header_signature(headers: List[str]) -> str:
+    """
+    헤더 서명 계산
+    
+    정규화된 헤더를 순서대로 이어 SHA-256 해시를 계산합니다.
+    같은 카드사의 같은 양식은 항상 같은 서명을 가집니다.
+    
+    Args:
+        headers: 정규화된 컬럼명 리스트 (normalize_headers 결과)
+    
+    Returns:
+        16진수 해시 문자열
+    """
+    return hashlib.sha256(HEADER_SIGNATURE_SEPARATOR.join(headers).encode('utf-8')).hexdigest()
+
+
+def get_sheet_names(file_path: str) -> List[str]:
+    """
+    엑셀 파일의 시트 이름 목록 반환
+    
+    Args:
+        file_path: 엑셀 파일 경로
+    
+    Returns:
+        시트 이름 리스트
+    
+    Raises:
+        FileNotFoundError: 파일이 존재하지 않는 경우
+        ValueError: 파일 형식이 올바르지 않은 경우
+    """
+    if not Path(file_path).exists():
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+    
+    try:
+        with pd.ExcelFile(file_path) as excel_file:
+            return [str(name) for name in excel_file.sheet_names]
+    except Exception as e:
+        raise ValueError(f"엑셀 파일 읽기 실패: {str(e)}")
+
+
+def estimate_row_count(file_path: str, sheet_name: Any = 0, header_row: int = 0) -> Optional[int]:
+    """
+    데이터 행 수 추정
+    
+    xlsx 파일은 시트에 기록된 사용 범위(dimension)만 읽으므로 데이터를 파싱하지 않습니다.
+    하단 합계 행이나 빈 행이 포함될 수 있으므로 실제 건수보다 약간 많을 수 있습니다.
+    
+    Args:
+        file_path: 엑셀 파일 경로
+        sheet_name: 시트 이름 또는 인덱스 (기본값: 0)
+        header_row: 헤더 행 인덱스
+    
+    Returns:
+        추정 데이터 행 수 또는 None (추정할 수 없는 형식인 경우)
+    """
+    if Path(file_path).suffix.lower() not in ('.xlsx', '.xlsm'):
+        return None
+    
+    try:
+        workbook = openpyxl.load_workbook(file_path, read_only=True)
+        try:
+            if isinstance(sheet_name, int):
+                worksheet = workbook.worksheets[sheet_name]
+            else:
+                worksheet = workbook[sheet_name]
+            max_row = worksheet.max_row
+        finally:
+            workbook.close()
+    except Exception:
+        return None
+    
+    if max_row is None:
+        return None
+    return max(max_row - header_row - 1, 0)
+
+
+def detect_header_row(
+    file_path: str,
+    sheet_name: int = 0,
+    scan_rows: int = HEADER_SCAN_ROWS
+) -> int:
+    """
+    헤더 행 위치 찾기
+    
+    카드사 엑셀은 실제 헤더 위에 제목, 조회기간, 계좌 정보 행이 있는 경우가 많습니다.
+    상단 scan_rows개 행만 읽어 각 행이 컬럼명 후보 단어와 몇 개 매칭되는지 점수를 매기고,
+    필수 컬럼을 모두 포함하는 행 중 점수가 가장 높은 첫 번째 행을 헤더로 판단합니다.
+    
+    Args:
+        file_path: 엑셀 파일 경로
+        sheet_name: 시트 이름 또는 인덱스 (기본값: 0)
+        scan_rows: 검사할 상단 행 수
+    
+    Returns:
+        헤더 행 인덱스 (0부터 시작, 찾지 못하면 0)
+    
+    Raises:
+        FileNotFoundError: 파일이 존재하지 않는 경우
+        ValueError: 파일 형식이 올바르지 않은 경우
+    """
+    if not Path(file_path).exists():
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+    
+    try:
+        preview = pd.read_excel(file_path, sheet_name=sheet_name, header=None, nrows=scan_rows)
+    except Exception as e:
+        raise ValueError(f"엑셀 파일 읽기 실패: {str(e)}")
+    
+    best_row = 0
+    best_score = 0
+    for row_index, values in enumerate(preview.itertuples(index=False, name=None)):
+        cells = normalize_headers(value for value in values if not pd.isna(value))
+        # 후보가 여러 개인 컬럼도 헤더 행 판단에는 매칭된 것으로 셈
+        mapping, ambiguous = match_columns(cells)
+        matched = set(mapping) | set(ambiguous)
+        if any(col not in matched for col in REQUIRED_COLUMNS):
+            continue
+        if len(matched) > best_score:
+            best_row = row_index
+            best_score = len(matched)
+    return best_row
+
+
+def read_excel_headers(
+    file_path: str,
+    sheet_name: int = 0,
+    header_row: Optional[int] = None
+) -> List[str]:
+    """
+    엑셀 파일의 헤더만 읽기
+    
+    데이터 행은 읽지 않으므로 매핑 프로파일 조회 전에 빠르게 헤더 서명을 구할 수 있습니다.
+    
+    Args:
+        file_path: 엑셀 파일 경로
+        sheet_name: 시트 이름 또는 인덱스 (기본값: 0)
+        header_row: 헤더 행 인덱스 (None인 경우 detect_header_row로 찾음)
+    
+    Returns:
+        정규화된 컬럼명 리스트
+    
+    Raises:
+        FileNotFoundError: 파일이 존재하지 않는 경우
+        ValueError: 파일 형식이 올바르지 않은 경우
+    """
+    if not Path(file_path).exists():
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+    
+    if header_row is None:
+        header_row = detect_header_row(file_path, sheet_name)
+    
+    try:
+        df = pd.read_excel(file_path, sheet_name=sheet_name, header=header_row, nrows=0)
+    except Exception as e:
+        raise ValueError(f"엑셀 파일 읽기 실패: {str(e)}")
+    return normalize_headers(df.columns.tolist())
 
 
 def read_card_transaction_excel(
     file_path: str, 
     card_company_id: int,
-    sheet_name: int = 0
+    sheet_name: int = 0,
+    column_mapping: Optional[Dict[str, str]] = None,
+    header_row: Optional[int] = None,
+    nrows: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     카드사용내역 엑셀 파일을 읽어서 딕셔너리 리스트로 변환
@@ -31,6 +239,10 @@ def read_card_transaction_excel(
         file_path: 엑셀 파일 경로
         card_company_id: 카드사 ID
         sheet_name: 시트 이름 또는 인덱스 (기본값: 0)
+        column_mapping: 컬럼 매핑 {내부컬럼명: 엑셀컬럼명}
+            (매핑 프로파일에서 찾은 값, None인 경우 컬럼명으로 추측)
+        header_row: 헤더 행 인덱스 (None인 경우 detect_header_row로 찾음)
+        nrows: 읽을 최대 데이터 행 수 (미리보기용, None인 경우 전체)
     
     Returns:
         카드사용내역 데이터 리스트
@@ -43,19 +255,27 @@ def read_card_transaction_excel(
     if not Path(file_path).exists():
         raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
     
+    if header_row is None:
+        header_row = detect_header_row(file_path, sheet_name)
+    
     try:
-        # 엑셀 파일 읽기
-        df = pd.read_excel(file_path, sheet_name=sheet_name)
+        # 엑셀 파일 읽기 (헤더 위 안내 행은 건너뜀)
+        # 셀 값을 그대로 읽어 컬럼 타입을 추측하지 않음 (합계 행의 빈 셀 때문에 사업자번호/승인번호가
+        # float로 바뀌지 않도록 하며, 금액과 일자는 아래에서 행마다 변환)
+        df = pd.read_excel(file_path, sheet_name=sheet_name, header=header_row, nrows=nrows, dtype=object)
+        
+        # 하단 합계 행 제거
+        df = _drop_trailing_total_rows(df)
         
         # 컬럼명을 소문자로 변환하고 공백 제거
-        df.columns = df.columns.str.strip().str.lower()
+        df.columns = normalize_headers(df.columns.tolist())
         
-        # 컬럼 매핑 정의
-        column_mapping = _get_column_mapping(df.columns.tolist())
+        # 컬럼 매핑 정의 (프로파일이 없으면 컬럼명으로 추측)
+        if column_mapping is None:
+            column_mapping = get_column_mapping(df.columns.tolist())
         
         # 필수 컬럼 확인
-        required_columns = ['transaction_date', 'amount']
-        for col in required_columns:
+        for col in REQUIRED_COLUMNS:
             if col not in column_mapping:
                 raise ValueError(f"필수 컬럼을 찾을 수 없습니다: {col}")
         
@@ -90,13 +310,13 @@ def read_card_transaction_excel(
                 )
                 
                 # 카드번호 마스킹 처리
-                masked_card_number = str(row.get(column_mapping.get('masked_card_number', ''))).strip()
+                masked_card_number = _clean_text(row.get(column_mapping.get('masked_card_number', '')))
                 
                 # 거래처명
-                vendor_name = str(row.get(column_mapping.get('vendor_name', ''))).strip()
+                vendor_name = _clean_text(row.get(column_mapping.get('vendor_name', '')))
                 
                 # 승인번호
-                approval_number = str(row.get(column_mapping.get('approval_number', ''))).strip()
+                approval_number = _clean_text(row.get(column_mapping.get('approval_number', '')))
                 
                 # 딕셔너리 생성
                 transaction = {
@@ -113,80 +333,167 @@ def read_card_transaction_excel(
                 }
                 
                 transactions.append(transaction)
-                
+            
             except Exception as e:
                 # 특정 행 파싱 실패 시 스킵
                 print(f"행 파싱 실패: {str(e)}")
                 continue
         
         return transactions
-        
+    
     except Exception as e:
         raise ValueError(f"엑셀 파일 읽기 실패: {str(e)}")
 
 
-def _get_column_mapping(columns: List[str]) -> Dict[str, str]:
+def get_column_mapping(columns: List[str]) -> Dict[str, str]:
     """
     엑셀 컬럼명을 내부 컬럼명으로 매핑
     
+    match_columns()의 매핑 중 후보가 하나로 정해진 컬럼만 반환합니다.
+    
     Args:
         columns: 엑셀 파일의 컬럼명 리스트
     
     Returns:
         매핑 딕셔너리 {내부컬럼명: 엑셀컬럼명}
     """
-    mapping = {}
+    return match_columns(columns)[0]
+
+
+def score_column(field: str, column: str) -> int:
+    """
+    엑셀 컬럼명이 내부 컬럼에 해당할 가능성 점수
     
-    # 거래일자 매핑
-    date_columns = ['거래일자', '이용일', '거래일', '승인일자', 'transaction_date', 'date']
-    for col in columns:
-        if any(dc in col for dc in date_columns):
-            mapping['transaction_date'] = col
-            break
+    Args:
+        field: 내부 컬럼명 (COLUMN_VOCABULARIES 키)
+        column: 정규화된 엑셀 컬럼명
     
-    # 카드번호 매핑
-    card_columns = ['카드번호', 'card_number', '카드']
-    for col in columns:
-        if any(cc in col for cc in card_columns):
-            mapping['masked_card_number'] = col
-            break
+    Returns:
+        점수 (후보 단어와 같으면 _EXACT_MATCH_SCORE, 포함하면 _PARTIAL_MATCH_SCORE 기준,
+        앞에 있는 후보 단어일수록 높음, 매칭되지 않으면 0)
+    """
+    best = 0
+    for rank, word in enumerate(COLUMN_VOCABULARIES[field]):
+        if column == word:
+            best = max(best, _EXACT_MATCH_SCORE - rank)
+        elif word in column:
+            best = max(best, _PARTIAL_MATCH_SCORE - rank)
+    return best
+
+
+def match_columns(
+    columns: List[str],
+    fixed: Optional[Dict[str, str]] = None
+) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """
+    엑셀 컬럼명을 내부 컬럼명으로 매핑 (점수 기반, 동점이면 매핑하지 않음)
     
-    # 거래취소여부 매핑
-    cancel_columns = ['승인취소', '구분', '취소여부', 'status', '거래구분']
-    for col in columns:
-        if any(cc in col for cc in cancel_columns):
-            mapping['is_cancel'] = col
-            break
+    모든 (내부 컬럼, 엑셀 컬럼) 쌍의 점수를 매긴 뒤 점수가 높은 쌍부터 확정하며,
+    엑셀 컬럼 하나는 내부 컬럼 하나에만 매핑합니다. 가장 높은 점수를 가진 엑셀 컬럼이 여럿이거나
+    같은 엑셀 컬럼이 여러 내부 컬럼에서 같은 점수를 받으면 추측하지 않고 모호한 컬럼으로 돌려줍니다.
+    새 양식을 처음 읽을 때만 사용하고, 사용자가 확인한 결과는 매핑 프로파일로 저장해 재사용합니다.
     
-    # 거래금액 매핑
-    amount_columns = ['이용금액', '금액', '승인금액', '거래금액', 'amount']
-    for col in columns:
-        if any(ac in col for ac in amount_columns):
-            mapping['amount'] = col
-            break
+    Args:
+        columns: 엑셀 파일의 컬럼명 리스트
+        fixed: 먼저 정해진 매핑 {내부컬럼명: 엑셀컬럼명} (사용자 지정, 그대로 사용)
     
-    # 거래처명 매핑
-    vendor_columns = ['가맹점명', '거래처명', '상호', 'vendor', '가맹점']
-    for col in columns:
-        if any(vc in col for vc in vendor_columns):
-            mapping['vendor_name'] = col
-            break
+    Returns:
+        (매핑 딕셔너리 {내부컬럼명: 엑셀컬럼명}, 모호한 컬럼 {내부컬럼명: 동점인 엑셀컬럼명 리스트})
+    """
+    mapping = dict(fixed or {})
+    ambiguous: Dict[str, List[str]] = {}
     
-    # 사업자등록번호 매핑
-    business_columns = ['사업자번호', '사업자등록번호', 'business_number']
-    for col in columns:
-        if any(bc in col for bc in business_columns):
-            mapping['business_number'] = col
-            break
+    remaining = [col for col in dict.fromkeys(columns) if col not in mapping.values()]
+    scores: Dict[str, Dict[str, int]] = {}
+    for field in COLUMN_VOCABULARIES:
+        if field in mapping:
+            continue
+        # 다른 내부 컬럼의 후보 단어와 정확히 같은 컬럼은 부분 일치로 가져가지 않음 (예: 승인금액 -> 승인번호)
+        field_scores = {
+            col: score_column(field, col) for col in remaining
+            if col in COLUMN_VOCABULARIES[field] or _EXACT_FIELDS.get(col, field) == field
+        }
+        field_scores = {col: score for col, score in field_scores.items() if score > 0}
+        if field_scores:
+            scores[field] = field_scores
     
-    # 승인번호 매핑
-    approval_columns = ['승인번호', 'approval_number', '승인']
-    for col in columns:
-        if any(ac in col for ac in approval_columns):
-            mapping['approval_number'] = col
-            break
+    while scores:
+        best = max(max(field_scores.values()) for field_scores in scores.values())
+        field = next(field for field, field_scores in scores.items() if max(field_scores.values()) == best)
+        tied_columns = [col for col, score in scores[field].items() if score == best]
+        column = tied_columns[0]
+        tied_fields = [other for other, field_scores in scores.items() if field_scores.get(column) == best]
+        
+        if len(tied_columns) > 1:
+            ambiguous[field] = tied_columns
+            del scores[field]
+            continue
+        
+        if len(tied_fields) > 1:
+            for other in tied_fields:
+                ambiguous[other] = [column]
+                del scores[other]
+        else:
+            mapping[field] = column
+            del scores[field]
+        
+        # 매핑했거나 모호한 엑셀 컬럼은 다른 내부 컬럼 후보에서 제외
+        for field_scores in scores.values():
+            field_scores.pop(column, None)
+        scores = {other: field_scores for other, field_scores in scores.items() if field_scores}
+    
+    return mapping, ambiguous
+
+
+def describe_column_mapping(
+    column_mapping: Dict[str, str],
+    ambiguous: Optional[Dict[str, List[str]]] = None
+) -> str:
+    """
+    컬럼 매핑 설명 문자열 (사용자 확인용)
+    
+    Args:
+        column_mapping: 컬럼 매핑 {내부컬럼명: 엑셀컬럼명}
+        ambiguous: 모호한 컬럼 {내부컬럼명: 동점인 엑셀컬럼명 리스트}
+    
+    Returns:
+        예: "transaction_date='이용일', amount='이용금액' (모호: approval_number='승인일시'/'승인구분')"
+    """
+    text = ', '.join(
+        f"{field}='{column_mapping[field]}'" for field in COLUMN_VOCABULARIES if field in column_mapping
+    )
+    if ambiguous:
+        candidates = ', '.join(
+            f"{field}=" + '/'.join(f"'{col}'" for col in columns) for field, columns in ambiguous.items()
+        )
+        text = f"{text} (모호: {candidates})" if text else f"모호: {candidates}"
+    return text
+
+
+def _drop_trailing_total_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    하단의 빈 행과 합계 행 제거
+    
+    아래에서부터 모든 값이 비어 있거나 합계 단어가 들어 있는 행을 제거하고,
+    거래 행을 만나면 멈춥니다.
     
-    return mapping
+    Args:
+        df: 엑셀 데이터프레임
+    
+    Returns:
+        합계 행이 제거된 데이터프레임
+    """
+    end = len(df)
+    while end > 0:
+        values = [value for value in df.iloc[end - 1].tolist() if not pd.isna(value)]
+        is_total_row = any(
+            isinstance(value, str) and any(keyword in value.lower() for keyword in TOTAL_ROW_KEYWORDS)
+            for value in values
+        )
+        if values and not is_total_row:
+            break
+        end -= 1
+    return df.iloc[:end]
 
 
 def _parse_transaction_date(value: Any) -> Optional[str]:
@@ -233,46 +540,36 @@ def _parse_transaction_date(value: Any) -> Optional[str]:
         dt = pd.to_datetime(value)
         if not pd.isna(dt):
             return dt.isoformat()
-        
+    
     except:
         pass
     
     return None
 
 
-def _parse_amount(value: Any) -> Optional[float]:
+def _parse_amount(value: Any) -> Optional[int]:
     """
-    거래 금액을 float으로 변환
+    거래 금액을 원 단위 정수로 변환
     
     Args:
         value: 거래 금액 값
     
     Returns:
-        float 값 또는 None
+        원 단위 정수 또는 None
     """
     if pd.isna(value):
         return None
     
-    try:
-        # 이미 숫자인 경우
-        if isinstance(value, (int, float)):
-            return float(value)
-        
-        # 문자열인 경우
-        if isinstance(value, str):
-            # 쉼표, 공백, 원화 기호 제거
-            value = value.replace(',', '').replace(' ', '').replace('원', '').replace('₩', '')
-            
-            # 괄호로 감싸진 경우 음수로 처리
-            if value.startswith('(') and value.endswith(')'):
-                value = '-' + value[1:-1]
-            
-            return float(value)
+    # 문자열인 경우
+    if isinstance(value, str):
+        # 쉼표, 공백, 원화 기호 제거
+        value = value.replace(',', '').replace(' ', '').replace('원', '').replace('₩', '')
         
-    except:
-        pass
+        # 괄호로 감싸진 경우 음수로 처리
+        if value.startswith('(') and value.endswith(')'):
+            value = '-' + value[1:-1]
     
-    return None
+    return to_won(value)
 
 
 def _parse_is_cancel(value: Any) -> bool:
@@ -297,12 +594,31 @@ def _parse_is_cancel(value: Any) -> bool:
     return False
 
 
+def _clean_text(value: Any) -> str:
+    """
+    셀 값을 문자열로 정리
+    
+    숫자로 저장된 번호(승인번호, 사업자번호 등)가 float로 읽힌 경우 소수점 없이 변환합니다.
+    
+    Args:
+        value: 셀 값
+    
+    Returns:
+        앞뒤 공백을 제거한 문자열 (빈 셀이면 빈 문자열)
+    """
+    if value is None or pd.isna(value):
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
 def _clean_business_number(value: Any) -> Optional[str]:
     """
     사업자등록번호를 정리 (하이픈 제거)
     
     Args:
-        value: 사업자등록번호 값
+        value: 사업자등록번호 값 (숫자 셀은 float로 읽힌 경우 포함)
     
     Returns:
         정리된 사업자등록번호 (10자리 숫자) 또는 None
@@ -312,7 +628,7 @@ def _clean_business_number(value: Any) -> Optional[str]:
     
     try:
         # 문자열로 변환
-        value = str(value).strip()
+        value = _clean_text(value)
         
         # 하이픈 및 공백 제거
         value = value.replace('-', '').replace(' ', '')
@@ -320,7 +636,7 @@ def _clean_business_number(value: Any) -> Optional[str]:
         # 10자리 숫자인지 확인
         if value.isdigit() and len(value) == 10:
             return value
-        
+    
     except:
         pass
     
@@ -0,0 +1,119 @@
+"""
+부가세 공제 제외 규칙
+
+매입세액 공제를 받을 수 없는 카드사용내역(폐업/간이과세/면세 사업자와의 거래, 병원/약국/학원 등)을
+판정하는 규칙을 데이터로 선언합니다. 규칙은 CardTransactionRepository.apply_exclusion_rules()에서
+SQL CASE 식 하나로 변환되어 거래처 정보와 조인한 카드사용내역 전체에 한 번에 적용됩니다.
+
+규칙은 목록 순서대로 평가하며 처음 일치한 규칙의 코드가 제외 사유가 됩니다.
+수동 지정 사유(MANUAL_EXCLUSION_REASON)는 규칙 평가에서 변경하지 않습니다.
+과세유형/사업자 상태 코드는 공통코드(tax_type, business_status)와 같습니다.
+거래처명 규칙은 카드사용내역의 가맹점명과 거래처정보의 거래처명 중 하나만 일치해도 적용됩니다.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+# 규칙 대상 필드
+RULE_FIELD_VENDOR_TAX_TYPE = 'vendor_tax_type'
+RULE_FIELD_VENDOR_BUSINESS_STATUS = 'vendor_business_status'
+RULE_FIELD_VENDOR_NAME = 'vendor_name'
+RULE_FIELDS = (RULE_FIELD_VENDOR_TAX_TYPE, RULE_FIELD_VENDOR_BUSINESS_STATUS, RULE_FIELD_VENDOR_NAME)
+
+# 규칙 연산자 (in: 값 중 하나와 일치, contains: 값 중 하나를 포함)
+RULE_OPERATOR_IN = 'in'
+RULE_OPERATOR_CONTAINS = 'contains'
+RULE_OPERATORS = (RULE_OPERATOR_IN, RULE_OPERATOR_CONTAINS)
+
+# 제외 사유 코드 최대 길이 (card_transaction.exclusion_reason)
+REASON_CODE_MAX_LENGTH = 20
+
+# 수동 지정 제외 사유 코드 (규칙 평가에서 변경하지 않음)
+MANUAL_EXCLUSION_REASON = 'MANUAL'
+
+
+@dataclass(frozen=True)
+class ExclusionRule:
+    """부가세 공제 제외 규칙"""
+    
+    # 제외 사유 코드 (card_transaction.exclusion_reason에 저장)
+    code: str
+    # 설명
+    description: str
+    # 대상 필드 (RULE_FIELDS 중 하나)
+    field: str
+    # 연산자 (RULE_OPERATORS 중 하나)
+    operator: str
+    # 비교 값
+    values: Tuple[str, ...]
+    
+    def __post_init__(self):
+        """값 검증"""
+        if not self.code or len(self.code) > REASON_CODE_MAX_LENGTH:
+            raise ValueError(f"제외 사유 코드는 1~{REASON_CODE_MAX_LENGTH}자여야 합니다: {self.code}")
+        if self.code == MANUAL_EXCLUSION_REASON:
+            raise ValueError(f"{MANUAL_EXCLUSION_REASON}는 수동 지정용 코드이므로 규칙에 사용할 수 없습니다.")
+        if self.field not in RULE_FIELDS:
+            raise ValueError(f"지원하지 않는 규칙 필드입니다: {self.field}")
+        if self.operator not in RULE_OPERATORS:
+            raise ValueError(f"지원하지 않는 규칙 연산자입니다: {self.operator}")
+        if not self.values:
+            raise ValueError(f"규칙 값이 비어 있습니다: {self.code}")
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ExclusionRule':
+        """
+        딕셔너리(JSON)에서 규칙 생성
+        
+        Args:
+            data: code, description, field, operator, values 키를 가진 딕셔너리
+        
+        Returns:
+            ExclusionRule
+        
+        Raises:
+            ValueError: 키가 없거나 값이 올바르지 않은 경우
+        """
+        try:
+            return cls(
+                code=data['code'],
+                description=data.get('description', data['code']),
+                field=data['field'],
+                operator=data.get('operator', RULE_OPERATOR_IN),
+                values=tuple(data['values'])
+            )
+        except KeyError as e:
+            raise ValueError(f"제외 규칙에 {e} 항목이 없습니다.")
+
+
+# 기본 제외 규칙 (우선순위 순)
+DEFAULT_EXCLUSION_RULES: Tuple[ExclusionRule, ...] = (
+    ExclusionRule('CLOSED', '폐업 사업자', RULE_FIELD_VENDOR_BUSINESS_STATUS, RULE_OPERATOR_IN, ('03',)),
+    ExclusionRule('SIMPLIFIED', '간이과세자', RULE_FIELD_VENDOR_TAX_TYPE, RULE_OPERATOR_IN, ('02',)),
+    ExclusionRule('TAX_FREE', '면세사업자', RULE_FIELD_VENDOR_TAX_TYPE, RULE_OPERATOR_IN, ('04',)),
+    ExclusionRule('MEDICAL', '병원/의원', RULE_FIELD_VENDOR_NAME, RULE_OPERATOR_CONTAINS, ('병원', '의원', '치과')),
+    ExclusionRule('PHARMACY', '약국', RULE_FIELD_VENDOR_NAME, RULE_OPERATOR_CONTAINS, ('약국',)),
+    ExclusionRule('ACADEMY', '학원', RULE_FIELD_VENDOR_NAME, RULE_OPERATOR_CONTAINS, ('학원',)),
+)
+
+
+def load_rules(items: Iterable[Dict[str, Any]]) -> List[ExclusionRule]:
+    """
+    딕셔너리 목록(JSON 배열)에서 규칙 목록 생성
+    
+    Args:
+        items: 규칙 딕셔너리 목록
+    
+    Returns:
+        ExclusionRule 리스트 (입력 순서 = 우선순위)
+    
+    Raises:
+        ValueError: 규칙이 올바르지 않거나 코드가 중복된 경우
+    """
+    rules = [ExclusionRule.from_dict(item) for item in items]
+    codes = [rule.code for rule in rules]
+    duplicated = sorted({code for code in codes if codes.count(code) > 1})
+    if duplicated:
+        raise ValueError(f"제외 사유 코드가 중복되었습니다: {', '.join(duplicated)}")
+    return rules
@@ -0,0 +1,198 @@
+"""
+신용카드매출전표등 수령명세서 전산매체 파일 작성
+
+헤더(H) 1건, 데이터(D) N건, 트레일러(T) 1건의 고정길이 레코드(CP949, CRLF 구분)를 작성합니다.
+데이터 레코드는 이터레이터에서 받아 일정 건수씩 묶어 큰 단위로 기록하므로
+메모리 사용량이 레코드 수와 무관합니다.
+
+헤더의 데이터 건수는 모든 데이터 레코드를 기록한 뒤 파일 앞으로 돌아가 채웁니다.
+트레일러에는 데이터 건수, 거래 건수/공급가액/세액 합계와 데이터 레코드의 CRC-32를 기록합니다.
+"""
+
+import os
+import zlib
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Optional, Sequence, Any
+from app.utils.fixed_width import Field, RecordLayout, FIELD_NUMBER, RECORD_SEPARATOR
+from app.utils.vat_period import VatPeriod, VAT_STAGE_PRELIMINARY, VAT_STAGE_FINAL
+
+
+# 레코드 길이 (구분자 제외)
+RECORD_LENGTH = 120
+
+# 서식 코드
+FORM_CODE = 'CARDRCV'
+
+# 헤더 레코드: 제출자(사업자) 정보와 신고기간
+HEADER_LAYOUT = RecordLayout('header', [
+    Field('record_type', 1, value='H'),
+    Field('form_code', 7, value=FORM_CODE),
+    Field('business_number', 10),
+    Field('business_name', 40),
+    Field('owner_name', 30),
+    # 귀속연도(4) + 기수(1) + 신고구분(1: 예정, 2: 확정, 0: 과세기간 전체)
+    Field('vat_period', 6),
+    Field('created_date', 8, FIELD_NUMBER),
+    Field('data_count', 7, FIELD_NUMBER),
+], RECORD_LENGTH)
+
+# 데이터 레코드: 카드/가맹점별 합계
+DATA_LAYOUT = RecordLayout('data', [
+    Field('record_type', 1, value='D'),
+    Field('serial', 7, FIELD_NUMBER),
+    Field('card_number', 20),
+    Field('merchant_business_number', 10),
+    Field('transaction_count', 9, FIELD_NUMBER),
+    Field('supply_amount', 15, FIELD_NUMBER),
+    Field('vat_amount', 15, FIELD_NUMBER),
+], RECORD_LENGTH)
+
+# 트레일러 레코드: 건수/금액 합계와 데이터 레코드 CRC-32 (16진수 8자리)
+TRAILER_LAYOUT = RecordLayout('trailer', [
+    Field('record_type', 1, value='T'),
+    Field('data_count', 7, FIELD_NUMBER),
+    Field('transaction_count', 11, FIELD_NUMBER),
+    Field('supply_amount', 17, FIELD_NUMBER),
+    Field('vat_amount', 17, FIELD_NUMBER),
+    Field('checksum', 8),
+], RECORD_LENGTH)
+
+# 한 번에 기록할 데이터 레코드 수 (약 1MB)
+_CHUNK_RECORDS = 8192
+
+
+@dataclass
+class FilingResult:
+    """전산매체 파일 작성 결과"""
+    
+    output_path: str
+    # 데이터 레코드 수
+    data_count: int
+    # 거래 건수 합계
+    transaction_count: int
+    # 공급가액 합계
+    supply_amount: int
+    # 세액 합계
+    vat_amount: int
+    # 데이터 레코드 CRC-32 (트레일러에 기록한 값)
+    checksum: str
+    # 파일 크기 (바이트)
+    file_size: int
+
+
+def write_filing_file(
+    output_path: str,
+    business_number: str,
+    business_name: str,
+    owner_name: str,
+    vat_period: VatPeriod,
+    records: Iterable[Sequence[Any]],
+    created_date: Optional[date] = None
+) -> FilingResult:
+    """
+    전산매체 파일 작성
+    
+    Args:
+        output_path: 출력 파일 경로
+        business_number: 제출자 사업자등록번호 (숫자 10자리)
+        business_name: 제출자 상호
+        owner_name: 대표자명
+        vat_period: 부가세 신고기간
+        records: (카드번호, 가맹점 사업자등록번호, 거래 건수, 공급가액, 세액) 이터러블
+        created_date: 작성일자 (None인 경우 오늘)
+    
+    Returns:
+        FilingResult
+    
+    Raises:
+        ValueError: 값이 필드 길이를 넘는 경우 (작성 중이던 파일은 삭제)
+    """
+    created = created_date or date.today()
+    header_values = [
+        business_number, business_name, owner_name, _vat_period_field(vat_period),
+        created.year * 10000 + created.month * 100 + created.day
+    ]
+    encode_data = DATA_LAYOUT.encode
+    
+    data_count = 0
+    transaction_total = 0
+    supply_total = 0
+    vat_total = 0
+    checksum = 0
+    
+    try:
+        with open(output_path, 'wb', buffering=1 << 20) as output:
+            # 데이터 건수를 모르므로 0으로 기록한 뒤 마지막에 다시 기록
+            output.write(HEADER_LAYOUT.encode(header_values + [0]) + RECORD_SEPARATOR)
+            
+            chunk = []
+            for card_number, merchant_business_number, transaction_count, supply_amount, vat_amount in records:
+                data_count += 1
+                transaction_total += transaction_count
+                supply_total += supply_amount
+                vat_total += vat_amount
+                chunk.append(encode_data((
+                    data_count, card_number, merchant_business_number,
+                    transaction_count, supply_amount, vat_amount
+                )))
+                if len(chunk) >= _CHUNK_RECORDS:
+                    checksum = _write_chunk(output, chunk, checksum)
+                    chunk = []
+            if chunk:
+                checksum = _write_chunk(output, chunk, checksum)
+            
+            checksum_hex = f"{checksum:08X}"
+            output.write(TRAILER_LAYOUT.encode((
+                data_count, transaction_total, supply_total, vat_total, checksum_hex
+            )) + RECORD_SEPARATOR)
+            file_size = output.tell()
+            
+            output.seek(0)
+            output.write(HEADER_LAYOUT.encode(header_values + [data_count]))
+    except BaseException:
+        # 작성 중 실패한 파일은 남기지 않음
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        raise
+    
+    return FilingResult(
+        output_path=output_path,
+        data_count=data_count,
+        transaction_count=transaction_total,
+        supply_amount=supply_total,
+        vat_amount=vat_total,
+        checksum=checksum_hex,
+        file_size=file_size
+    )
+
+
+def _write_chunk(output, chunk: Sequence[bytes], checksum: int) -> int:
+    """
+    데이터 레코드 묶음 기록
+    
+    Args:
+        output: 출력 파일 (바이너리)
+        chunk: 인코딩된 데이터 레코드 (구분자 제외)
+        checksum: 지금까지의 CRC-32
+    
+    Returns:
+        이 묶음까지 반영한 CRC-32
+    """
+    data = RECORD_SEPARATOR.join(chunk) + RECORD_SEPARATOR
+    output.write(data)
+    return zlib.crc32(data, checksum)
+
+
+def _vat_period_field(vat_period: VatPeriod) -> str:
+    """
+    헤더의 신고기간 필드 값
+    
+    Args:
+        vat_period: 부가세 신고기간
+    
+    Returns:
+        6자리 문자열 (예: '202511': 2025년 1기 예정)
+    """
+    stage_code = {VAT_STAGE_PRELIMINARY: '1', VAT_STAGE_FINAL: '2'}.get(vat_period.stage, '0')
+    return f"{vat_period.year:04d}{vat_period.term}{stage_code}"
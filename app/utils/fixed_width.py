@@ -0,0 +1,157 @@
+"""
+고정길이 레코드 인코딩 유틸리티
+
+국세청 전산매체처럼 바이트 단위 고정길이 레코드(EUC-KR/CP949)를 만드는 레이아웃을 정의합니다.
+레이아웃은 생성 시 레코드 전체를 한 번에 만드는 형식 문자열과 필드별 인코더를 미리 준비해 두므로
+레코드마다 필드 정의를 해석하지 않고 값만 인코딩합니다.
+
+필드 형식:
+    X: 문자 (왼쪽 정렬, 나머지는 공백, 길이를 넘으면 한글이 잘리지 않게 자름)
+    9: 숫자 (오른쪽 정렬, 앞을 0으로 채움, 음수는 맨 앞에 '-')
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+
+# 전산매체 문자 인코딩 (EUC-KR 확장, 완성형 한글 전체 포함)
+ENCODING = 'cp949'
+
+# 레코드 구분자
+RECORD_SEPARATOR = b'\r\n'
+
+# 필드 형식
+FIELD_TEXT = 'X'
+FIELD_NUMBER = '9'
+
+
+@dataclass(frozen=True)
+class Field:
+    """고정길이 레코드 필드"""
+    
+    name: str
+    # 바이트 길이
+    length: int
+    # 형식 (FIELD_TEXT 또는 FIELD_NUMBER)
+    kind: str = FIELD_TEXT
+    # 상수 값 (레코드 구분, 서식 코드 등, None인 경우 레코드마다 값을 받음)
+    value: Optional[Any] = None
+
+
+def encode_text(value: Any, length: int) -> bytes:
+    """
+    문자 필드 인코딩
+    
+    Args:
+        value: 값 (None은 공백)
+        length: 바이트 길이
+    
+    Returns:
+        length 바이트 (CP949로 표현할 수 없는 문자는 '?')
+    """
+    encoded = ('' if value is None else str(value)).encode(ENCODING, errors='replace')
+    if len(encoded) > length:
+        # 2바이트 문자 중간에서 잘린 경우 그 문자를 버림
+        encoded = encoded[:length].decode(ENCODING, errors='ignore').encode(ENCODING)
+    return encoded.ljust(length, b' ')
+
+
+def encode_number(value: Any, length: int) -> bytes:
+    """
+    숫자 필드 인코딩
+    
+    Args:
+        value: 정수 값 (None은 0)
+        length: 바이트 길이
+    
+    Returns:
+        length 바이트
+    
+    Raises:
+        ValueError: 값이 길이를 넘는 경우
+    """
+    number = int(value or 0)
+    text = f"-{-number:0{length - 1}d}" if number < 0 else f"{number:0{length}d}"
+    if len(text) > length:
+        raise ValueError(f"숫자 필드 길이({length})를 넘는 값입니다: {number}")
+    return text.encode('ascii')
+
+
+class RecordLayout:
+    """
+    고정길이 레코드 레이아웃
+    
+    상수 필드는 미리 인코딩하고, 값 필드는 필드 순서대로 전달된 값을 인코딩합니다.
+    값이 모두 ASCII이고 길이 안에 들어가면(카드번호, 사업자등록번호, 금액 등 대부분의 데이터 레코드)
+    미리 만든 형식 문자열 하나로 레코드를 만들고, 그 외(한글, None, 길이 초과)는 필드별로 인코딩합니다.
+    """
+    
+    def __init__(self, name: str, fields: Sequence[Field], record_length: int):
+        """
+        레이아웃 생성 (필드 인코더 준비)
+        
+        Args:
+            name: 레이아웃 이름
+            fields: 필드 목록 (순서대로 배치)
+            record_length: 레코드 바이트 길이 (필드 길이 합이 작으면 나머지는 공란)
+        
+        Raises:
+            ValueError: 필드 길이 합이 레코드 길이를 넘는 경우
+        """
+        total_length = sum(field.length for field in fields)
+        if total_length > record_length:
+            raise ValueError(f"{name} 레이아웃의 필드 길이 합({total_length})이 레코드 길이({record_length})를 넘습니다.")
+        
+        self.name = name
+        self.record_length = record_length
+        self.field_names = [field.name for field in fields if field.value is None]
+        
+        # 연속된 상수 필드는 하나의 바이트 조각으로 합치고, 값 필드는 (인코더, 길이)로 준비
+        self._parts: List[Tuple[Optional[Callable[[Any, int], bytes]], Any]] = []
+        # ASCII 값용 형식 문자열 (숫자: 0 채움, 문자: 왼쪽 정렬 + 길이 제한)
+        template = []
+        value_index = 0
+        constant = b''
+        for field in fields:
+            encoder = encode_number if field.kind == FIELD_NUMBER else encode_text
+            if field.value is not None:
+                encoded = encoder(field.value, field.length)
+                constant += encoded
+                template.append(encoded.decode(ENCODING).replace('{', '{{').replace('}', '}}'))
+                continue
+            if constant:
+                self._parts.append((None, constant))
+                constant = b''
+            self._parts.append((encoder, field.length))
+            spec = f"0{field.length}d" if field.kind == FIELD_NUMBER else f"<{field.length}.{field.length}"
+            template.append(f"{{{value_index}:{spec}}}")
+            value_index += 1
+        filler = b' ' * (record_length - total_length)
+        constant += filler
+        template.append(filler.decode('ascii'))
+        if constant:
+            self._parts.append((None, constant))
+        self._template = ''.join(template)
+    
+    def encode(self, values: Sequence[Any]) -> bytes:
+        """
+        레코드 인코딩
+        
+        Args:
+            values: 값 필드의 값 (field_names 순서)
+        
+        Returns:
+            record_length 바이트 레코드 (구분자 제외)
+        """
+        try:
+            record = self._template.format(*values)
+            if len(record) == self.record_length and record.isascii():
+                return record.encode('ascii')
+        except (TypeError, ValueError):
+            pass
+        
+        iterator = iter(values)
+        return b''.join(
+            part if encoder is None else encoder(next(iterator), part)
+            for encoder, part in self._parts
+        )
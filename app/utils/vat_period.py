@@ -0,0 +1,129 @@
+"""
+부가세 신고기간 유틸리티
+
+거래 일자를 정수 키(yyyymmdd, 연도, 분기, 신고기간)로 바꾸고
+부가세 신고기간(1기 예정/확정, 2기 예정/확정)을 정수 범위로 변환합니다.
+card_transaction의 생성 컬럼(transaction_ymd, vat_period)과 같은 규칙이어야 합니다.
+
+신고기간 코드는 연도 * 10 + 분기입니다.
+    20251: 2025년 1기 예정 (1~3월)
+    20252: 2025년 1기 확정 (4~6월)
+    20253: 2025년 2기 예정 (7~9월)
+    20254: 2025년 2기 확정 (10~12월)
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Optional, Tuple
+
+
+# 신고 구분
+VAT_STAGE_PRELIMINARY = '예정'
+VAT_STAGE_FINAL = '확정'
+
+# 신고기간 문자열 형식 (예: '2025-1', '2025 1기 예정', '2025년 2기 확정')
+_VAT_PERIOD_PATTERN = re.compile(r'^\s*(\d{4})\s*년?\s*[-/.]?\s*([12])\s*기?\s*(예정|확정)?\s*$')
+
+
+def to_ymd(value: Any) -> Optional[int]:
+    """
+    날짜를 yyyymmdd 정수로 변환
+    
+    Args:
+        value: date, datetime 또는 ISO 형식 문자열 (YYYY-MM-DD로 시작)
+    
+    Returns:
+        yyyymmdd 정수 또는 None (변환할 수 없는 경우)
+    """
+    if isinstance(value, (date, datetime)):
+        return value.year * 10000 + value.month * 100 + value.day
+    if isinstance(value, str) and len(value) >= 10:
+        try:
+            return to_ymd(date.fromisoformat(value[:10]))
+        except ValueError:
+            return None
+    return None
+
+
+def vat_period_code(value: date) -> int:
+    """
+    날짜가 속한 신고기간 코드 (연도 * 10 + 분기)
+    
+    Args:
+        value: 거래 일자
+    
+    Returns:
+        신고기간 코드 (예: 2025년 5월 -> 20252)
+    """
+    return value.year * 10 + (value.month + 2) // 3
+
+
+@dataclass(frozen=True)
+class VatPeriod:
+    """부가세 신고기간 (연도, 기수, 예정/확정 구분)"""
+    
+    year: int
+    # 기수 (1: 1~6월, 2: 7~12월)
+    term: int
+    # 예정/확정 구분 (None인 경우 과세기간 6개월 전체, 예: 개인 일반과세자 확정신고)
+    stage: Optional[str] = None
+    
+    def __post_init__(self):
+        """값 검증"""
+        if self.term not in (1, 2):
+            raise ValueError(f"기수는 1 또는 2여야 합니다: {self.term}")
+        if self.stage not in (None, VAT_STAGE_PRELIMINARY, VAT_STAGE_FINAL):
+            raise ValueError(f"신고 구분은 '{VAT_STAGE_PRELIMINARY}' 또는 '{VAT_STAGE_FINAL}'이어야 합니다: {self.stage}")
+    
+    @classmethod
+    def parse(cls, value: str) -> 'VatPeriod':
+        """
+        문자열에서 신고기간 생성
+        
+        Args:
+            value: 신고기간 문자열 (예: '2025-1', '2025 1기 예정', '2025년 2기 확정')
+        
+        Returns:
+            VatPeriod
+        
+        Raises:
+            ValueError: 형식이 올바르지 않은 경우
+        """
+        match = _VAT_PERIOD_PATTERN.match(value or '')
+        if not match:
+            raise ValueError(f"신고기간 형식이 올바르지 않습니다: {value} (예: 2025-1, 2025 1기 예정)")
+        return cls(int(match.group(1)), int(match.group(2)), match.group(3))
+    
+    @property
+    def quarters(self) -> Tuple[int, int]:
+        """신고기간에 포함되는 (첫 분기, 마지막 분기)"""
+        first = self.term * 2 - 1
+        if self.stage == VAT_STAGE_PRELIMINARY:
+            return first, first
+        if self.stage == VAT_STAGE_FINAL:
+            return first + 1, first + 1
+        return first, first + 1
+    
+    @property
+    def code_range(self) -> Tuple[int, int]:
+        """신고기간 코드 범위 (vat_period 컬럼 조건, 양 끝 포함)"""
+        first, last = self.quarters
+        return self.year * 10 + first, self.year * 10 + last
+    
+    @property
+    def ymd_range(self) -> Tuple[int, int]:
+        """거래 일자 범위 (transaction_ymd 컬럼 조건, 양 끝 포함)"""
+        first, last = self.quarters
+        last_month = last * 3
+        last_day = 31 if last_month in (3, 12) else 30
+        return (
+            self.year * 10000 + (first * 3 - 2) * 100 + 1,
+            self.year * 10000 + last_month * 100 + last_day,
+        )
+    
+    @property
+    def label(self) -> str:
+        """표시용 이름 (예: '2025년 1기 예정')"""
+        label = f"{self.year}년 {self.term}기"
+        return f"{label} {self.stage}" if self.stage else label
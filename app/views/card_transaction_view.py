@@ -7,7 +7,7 @@
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 from datetime import datetime
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QThread
 from PySide6.QtWidgets import (
   QWidget, 
   QVBoxLayout, 
@@ -26,12 +26,66 @@ from qfluentwidgets import (
   TitleLabel,
   BodyLabel,
   ComboBox,
+  CheckBox,
   TableView,
   FluentIcon
 )
 from app.services.card_transaction_service import CardTransactionService
 from app.services.card_company_service import CardCompanyService
+from app.services.maintenance_service import MaintenanceService
+from app.services.import_service import ImportService, compute_file_hash, PREVIEW_ROWS
 from app.models.card_transaction_model import CardTransactionModel
+from app.models.import_batch_model import ImportBatchModel
+from app.utils.excel_reader import describe_column_mapping
+
+
+class FileImportWorker(QThread):
+  """
+  카드사용내역 파일 전체 가져오기 작업 스레드
+  
+  미리보기 후 등록을 확정하면 전체 파일 파싱과 일괄 등록을 화면과 다른 스레드에서 실행합니다.
+  """
+  
+  # 가져오기 완료 시그널 (가져오기 배치 딕셔너리)
+  import_finished = Signal(dict)
+  
+  # 가져오기 실패 시그널 (오류 메시지)
+  import_failed = Signal(str)
+  
+  def __init__(
+    self,
+    import_service: ImportService,
+    file_path: str,
+    card_company_id: int,
+    file_hash: Optional[str],
+    parent=None
+  ):
+    """
+    작업 스레드 초기화
+    
+    Args:
+      import_service: 가져오기 서비스
+      file_path: 엑셀 파일 경로
+      card_company_id: 카드사 ID
+      file_hash: 원본 파일 해시
+      parent: 부모 객체
+    """
+    super().__init__(parent)
+    self.import_service = import_service
+    self.file_path = file_path
+    self.card_company_id = card_company_id
+    self.file_hash = file_hash
+  
+  def run(self) -> None:
+    """전체 파일 가져오기 실행"""
+    try:
+      # 미리보기에서 확인한 뒤 등록한 것이므로 처음 보는 양식의 매핑도 저장
+      batch = self.import_service.import_file(
+        self.file_path, self.card_company_id, self.file_hash, confirm_mapping=True
+      )
+      self.import_finished.emit(batch)
+    except Exception as e:
+      self.import_failed.emit(str(e))
 
 
 class CardTransactionInterface(QWidget):
@@ -48,11 +102,20 @@ class CardTransactionInterface(QWidget):
     super().__init__()
     self.transaction_service = CardTransactionService()
     self.card_company_service = CardCompanyService()
+    self.maintenance_service = MaintenanceService()
+    self.import_service = ImportService()
     self.selected_file_path: Optional[str] = None
+    self.selected_file_hash: Optional[str] = None
     self.excel_data: List[Dict[str, Any]] = []
+    # 미리보기로 일부 행만 불러왔는지 여부 (True이면 등록 시 전체 파일을 가져옴)
+    self.is_preview: bool = False
+    # 처음 보는 양식의 추측 컬럼 매핑 (미리보기로 확인하고 등록하면 매핑 프로파일로 저장)
+    self.pending_column_mapping: Optional[Dict[str, str]] = None
+    self.import_worker: Optional[FileImportWorker] = None
     self._init_ui()
     self._connect_signals()
     self._load_card_companies()
+    self._load_import_batches()
   
   def _init_ui(self) -> None:
     """
@@ -110,6 +173,10 @@ class CardTransactionInterface(QWidget):
     self.file_load_button: PrimaryPushButton = PrimaryPushButton("불러오기", icon=FluentIcon.DOWN)
     second_row.addWidget(self.file_load_button)
     
+    # 이미 가져온 파일도 다시 파싱하여 가져오기
+    self.force_reimport_checkbox: CheckBox = CheckBox("다시 가져오기")
+    second_row.addWidget(self.force_reimport_checkbox)
+    
     file_layout.addLayout(second_row)
     layout.addWidget(file_card)
     
@@ -168,6 +235,43 @@ class CardTransactionInterface(QWidget):
     list_layout.addWidget(self.transaction_table_view)
     
     layout.addWidget(list_card)
+    
+    # 가져오기 이력 섹션
+    batch_card = CardWidget()
+    batch_card.setFixedHeight(220)
+    batch_layout = QVBoxLayout(batch_card)
+    batch_layout.setContentsMargins(20, 20, 20, 20)
+    batch_layout.setSpacing(10)
+    
+    # 이력 제목 및 버튼
+    batch_title_row = QHBoxLayout()
+    batch_title = BodyLabel("가져오기 이력")
+    batch_title.setStyleSheet("font-weight: bold; font-size: 14px;")
+    batch_title_row.addWidget(batch_title)
+    batch_title_row.addStretch()
+    
+    self.batch_refresh_button: PushButton = PushButton("새로고침", icon=FluentIcon.SYNC)
+    batch_title_row.addWidget(self.batch_refresh_button)
+    
+    self.batch_undo_button: PushButton = PushButton("되돌리기", icon=FluentIcon.DELETE)
+    batch_title_row.addWidget(self.batch_undo_button)
+    batch_layout.addLayout(batch_title_row)
+    
+    # 이력 테이블 뷰
+    self.batch_table_view: TableView = TableView()
+    self.batch_table_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+    self.batch_table_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+    self.batch_table_view.setAlternatingRowColors(True)
+    
+    self.batch_model = ImportBatchModel(self)
+    self.batch_table_view.setModel(self.batch_model)
+    
+    batch_header = self.batch_table_view.horizontalHeader()
+    batch_header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+    batch_header.setSectionResizeMode(ImportBatchModel.COL_SOURCE_FILE, QHeaderView.ResizeMode.Stretch)
+    
+    batch_layout.addWidget(self.batch_table_view)
+    layout.addWidget(batch_card)
   
   def _connect_signals(self) -> None:
     """
@@ -180,6 +284,8 @@ class CardTransactionInterface(QWidget):
     self.deselect_all_button.clicked.connect(self._on_deselect_all_button_clicked)
     self.reset_button.clicked.connect(self._on_reset_button_clicked)
     self.register_button.clicked.connect(self._on_register_button_clicked)
+    self.batch_refresh_button.clicked.connect(self._load_import_batches)
+    self.batch_undo_button.clicked.connect(self._on_batch_undo_button_clicked)
   
   def _load_card_companies(self) -> None:
     """
@@ -221,6 +327,7 @@ class CardTransactionInterface(QWidget):
     
     if file_path:
       self.selected_file_path = file_path
+      self.selected_file_hash = None
       self.file_path_input.setText(file_path)
       InfoBar.success(
         title="파일 선택",
@@ -264,13 +371,27 @@ class CardTransactionInterface(QWidget):
       return
     
     try:
-      # 엑셀 파일 읽기
-      from app.utils.excel_reader import read_card_transaction_excel
+      # 같은 파일을 이미 가져온 경우 파싱 없이 이전 결과 표시
+      self.selected_file_hash = compute_file_hash(self.selected_file_path)
+      if not self.force_reimport_checkbox.isChecked():
+        previous_batch = self.import_service.find_completed_import(self.selected_file_hash)
+        if previous_batch:
+          self._show_previous_import(previous_batch)
+          return
+      
+      # 처음 보는 양식이면 추측한 매핑을 등록 전에 확인하도록 표시 (저장은 등록할 때)
+      column_mapping, mapping_confirmed = self.import_service.find_column_mapping(
+        self.selected_file_path,
+        card_company_id
+      )
+      self.pending_column_mapping = None if mapping_confirmed else column_mapping
       
-      self.excel_data = read_card_transaction_excel(
+      # 엑셀 파일 미리보기 (카드사별 양식의 컬럼 매핑 프로파일 적용, 앞부분만 파싱)
+      self.excel_data, estimated_rows = self.import_service.preview_transactions(
         self.selected_file_path, 
         card_company_id
       )
+      self.is_preview = len(self.excel_data) >= PREVIEW_ROWS
       
       if not self.excel_data:
         InfoBar.warning(
@@ -287,19 +408,51 @@ class CardTransactionInterface(QWidget):
       # 테이블에 데이터 표시
       self.transaction_model.set_data(self.excel_data)
       
+      # 기존 내역과 비교하여 신규/기존/충돌 행 강조
+      diff = self.import_service.diff_transactions(self.excel_data, card_company_id)
+      self.transaction_model.set_diff(diff)
+      counts = diff['counts']
+      diff_text = (
+        f"신규 {counts['new']:,}건, 기존 {counts['existing']:,}건, "
+        f"금액 충돌 {counts['conflict']:,}건, 필수 항목 누락 {counts['invalid']:,}건"
+      )
+      
       # 등록 버튼 활성화
       self.register_button.setEnabled(True)
       
+      if self.is_preview:
+        estimated_text = f"전체 약 {estimated_rows:,}건" if estimated_rows else "전체 건수 미확인"
+        content = (
+          f"앞 {len(self.excel_data)}건을 미리보기로 불러왔습니다. ({estimated_text}, 미리보기 중 {diff_text}) "
+          f"등록하면 전체 파일을 가져옵니다."
+        )
+      else:
+        content = f"총 {len(self.excel_data)}건의 데이터를 불러왔습니다. ({diff_text})"
+      
       InfoBar.success(
         title="불러오기 완료",
-        content=f"총 {len(self.excel_data)}건의 데이터를 불러왔습니다.",
+        content=content,
         orient=Qt.Horizontal,
         isClosable=True,
         position=InfoBarPosition.TOP,
-        duration=1000,
+        duration=2000,
         parent=self
       )
       
+      if self.pending_column_mapping:
+        InfoBar.warning(
+          title="새 엑셀 양식",
+          content=(
+            f"처음 보는 양식이므로 미리보기에서 컬럼 매핑을 확인하세요: "
+            f"{describe_column_mapping(self.pending_column_mapping)} 등록하면 이 매핑을 저장합니다."
+          ),
+          orient=Qt.Horizontal,
+          isClosable=True,
+          position=InfoBarPosition.TOP,
+          duration=5000,
+          parent=self
+        )
+      
     except Exception as e:
       InfoBar.error(
         title="파일 읽기 오류",
@@ -311,6 +464,32 @@ class CardTransactionInterface(QWidget):
         parent=self
       )
   
+  def _show_previous_import(self, batch: Dict[str, Any]) -> None:
+    """
+    이전 가져오기 결과 표시
+    
+    Args:
+      batch: 같은 파일의 완료된 가져오기 배치
+    """
+    self.excel_data = []
+    self.is_preview = False
+    self.transaction_model.set_data(self.import_service.get_batch_transaction_rows(batch['id']))
+    self.register_button.setEnabled(False)
+    
+    started_at = (batch.get('started_at') or '')[:19].replace('T', ' ')
+    InfoBar.info(
+      title="이미 가져온 파일",
+      content=(
+        f"{started_at}에 가져온 파일입니다. (배치 {batch['id']}, {batch['inserted_rows']}건) "
+        f"다시 가져오려면 '다시 가져오기'를 선택하세요."
+      ),
+      orient=Qt.Horizontal,
+      isClosable=True,
+      position=InfoBarPosition.TOP,
+      duration=3000,
+      parent=self
+    )
+  
   def _on_select_all_button_clicked(self) -> None:
     """
     전체 선택 버튼 클릭 이벤트 처리
@@ -330,7 +509,11 @@ class CardTransactionInterface(QWidget):
     self.card_company_combo.setCurrentIndex(0)
     self.file_path_input.clear()
     self.selected_file_path = None
+    self.selected_file_hash = None
+    self.force_reimport_checkbox.setChecked(False)
     self.excel_data = []
+    self.is_preview = False
+    self.pending_column_mapping = None
     self.transaction_model.clear()
     self.register_button.setEnabled(False)
     
@@ -360,6 +543,11 @@ class CardTransactionInterface(QWidget):
       )
       return
     
+    # 미리보기 상태이면 전체 파일을 백그라운드에서 가져오기 (처음 보는 양식의 매핑은 가져오면서 저장)
+    if self.is_preview:
+      self._start_file_import()
+      return
+    
     try:
       # 선택된 행만 등록
       selected_indexes = self.transaction_table_view.selectionModel().selectedRows()
@@ -384,50 +572,210 @@ class CardTransactionInterface(QWidget):
         if row_data:
           selected_data.append(row_data)
       
-      # 데이터베이스에 등록
-      success_count = 0
-      fail_count = 0
+      # 처음 보는 양식이면 미리보기로 확인한 매핑을 프로파일로 저장
+      if self.pending_column_mapping:
+        self.import_service.resolve_column_mapping(
+          self.selected_file_path,
+          self.card_company_combo.currentData(),
+          confirm=True
+        )
+        self.pending_column_mapping = None
       
-      for data in selected_data:
-        try:
-          self.transaction_service.create_transaction(data)
-          success_count += 1
-        except Exception as e:
-          fail_count += 1
-          print(f"등록 실패: {str(e)}")
+      # 데이터베이스에 등록 (가져오기 배치 단위 일괄 등록)
+      batch = self.import_service.import_transactions(
+        selected_data,
+        self.card_company_combo.currentData(),
+        source_file=self.selected_file_path,
+        file_hash=self.selected_file_hash
+      )
+      self._on_import_finished(batch)
       
-      # 결과 메시지
-      if success_count > 0:
-        InfoBar.success(
-          title="등록 완료",
-          content=f"총 {success_count}건이 등록되었습니다. (실패: {fail_count}건)",
-          orient=Qt.Horizontal,
-          isClosable=True,
-          position=InfoBarPosition.TOP,
-          duration=2000,
-          parent=self
-        )
-        
-        # 등록 후 초기화
-        self._on_reset_button_clicked()
-        
-        # 데이터 변경 시그널 발생
-        self.data_changed.emit()
-      else:
-        InfoBar.error(
-          title="등록 실패",
-          content=f"데이터 등록에 실패했습니다. (실패: {fail_count}건)",
+    except Exception as e:
+      self._on_import_failed(str(e))
+  
+  def is_importing(self) -> bool:
+    """백그라운드 가져오기 진행 여부"""
+    return self.import_worker is not None and self.import_worker.isRunning()
+  
+  def _start_file_import(self) -> None:
+    """
+    전체 파일 가져오기 작업 시작 (백그라운드 스레드)
+    """
+    self.register_button.setEnabled(False)
+    self.file_load_button.setEnabled(False)
+    
+    self.import_worker = FileImportWorker(
+      self.import_service,
+      self.selected_file_path,
+      self.card_company_combo.currentData(),
+      self.selected_file_hash,
+      parent=self
+    )
+    self.import_worker.import_finished.connect(self._on_import_finished)
+    self.import_worker.import_failed.connect(self._on_import_failed)
+    self.import_worker.start()
+    
+    InfoBar.info(
+      title="가져오는 중",
+      content="전체 파일을 읽어 등록하고 있습니다. 완료되면 알려드립니다.",
+      orient=Qt.Horizontal,
+      isClosable=True,
+      position=InfoBarPosition.TOP,
+      duration=2000,
+      parent=self
+    )
+  
+  def _on_import_finished(self, batch: Dict[str, Any]) -> None:
+    """
+    가져오기 완료 처리
+    
+    Args:
+      batch: 가져오기 배치 딕셔너리
+    """
+    self.import_worker = None
+    self.file_load_button.setEnabled(True)
+    
+    success_count = batch['inserted_rows']
+    fail_count = batch['failed_rows']
+    self._load_import_batches()
+    
+    # 대량 등록 후 플래너 통계 갱신
+    try:
+      self.maintenance_service.analyze_if_needed(success_count)
+    except Exception as e:
+      print(f"통계 갱신 실패: {str(e)}")
+    
+    # 결과 메시지
+    if success_count > 0:
+      InfoBar.success(
+        title="등록 완료",
+        content=(
+          f"총 {success_count}건이 등록되었습니다. (실패: {fail_count}건, "
+          f"신규 거래처: {batch.get('registered_vendors', 0)}건, "
+          f"취소 거래 연결: {batch.get('paired_cancellations', 0)}건)"
+        ),
+        orient=Qt.Horizontal,
+        isClosable=True,
+        position=InfoBarPosition.TOP,
+        duration=2000,
+        parent=self
+      )
+      
+      # 여러 카드와 일치하여 카드를 매칭하지 못한 카드번호 안내
+      ambiguous_cards = batch.get('card_match', {}).get('ambiguous')
+      if ambiguous_cards:
+        InfoBar.warning(
+          title="카드 매칭 확인 필요",
+          content=f"여러 카드와 일치하는 카드번호가 있습니다: {', '.join(ambiguous_cards)}",
           orient=Qt.Horizontal,
           isClosable=True,
           position=InfoBarPosition.TOP,
-          duration=2000,
+          duration=4000,
           parent=self
         )
       
+      # 등록 후 초기화
+      self._on_reset_button_clicked()
+      
+      # 데이터 변경 시그널 발생
+      self.data_changed.emit()
+    else:
+      self.register_button.setEnabled(bool(self.excel_data))
+      InfoBar.error(
+        title="등록 실패",
+        content=f"데이터 등록에 실패했습니다. (실패: {fail_count}건)",
+        orient=Qt.Horizontal,
+        isClosable=True,
+        position=InfoBarPosition.TOP,
+        duration=2000,
+        parent=self
+      )
+  
+  def _on_import_failed(self, message: str) -> None:
+    """
+    가져오기 오류 처리
+    
+    Args:
+      message: 오류 메시지
+    """
+    self.import_worker = None
+    self.file_load_button.setEnabled(True)
+    self.register_button.setEnabled(bool(self.excel_data))
+    InfoBar.error(
+      title="등록 오류",
+      content=f"데이터 등록 중 오류가 발생했습니다: {message}",
+      orient=Qt.Horizontal,
+      isClosable=True,
+      position=InfoBarPosition.TOP,
+      duration=2000,
+      parent=self
+    )
+  
+  def _load_import_batches(self) -> None:
+    """
+    가져오기 이력 로드
+    """
+    try:
+      self.batch_model.set_data(self.import_service.get_import_batches())
+    except Exception as e:
+      InfoBar.warning(
+        title="경고",
+        content=f"가져오기 이력을 불러오는 중 오류가 발생했습니다: {str(e)}",
+        orient=Qt.Horizontal,
+        isClosable=True,
+        position=InfoBarPosition.TOP,
+        duration=2000,
+        parent=self
+      )
+  
+  def _on_batch_undo_button_clicked(self) -> None:
+    """
+    되돌리기 버튼 클릭 이벤트 처리
+    
+    선택한 가져오기 배치로 등록된 카드사용내역을 일괄 삭제합니다.
+    """
+    selected_indexes = self.batch_table_view.selectionModel().selectedRows()
+    if not selected_indexes:
+      InfoBar.warning(
+        title="되돌리기 오류",
+        content="되돌릴 가져오기 이력을 선택하세요.",
+        orient=Qt.Horizontal,
+        isClosable=True,
+        position=InfoBarPosition.TOP,
+        duration=1000,
+        parent=self
+      )
+      return
+    
+    batch = self.batch_model.get_row_data(selected_indexes[0].row())
+    if not batch:
+      return
+    
+    try:
+      deleted_count = self.import_service.undo_import(batch['id'])
+      
+      # 대량 삭제 후 플래너 통계 갱신
+      try:
+        self.maintenance_service.analyze_if_needed(deleted_count)
+      except Exception as e:
+        print(f"통계 갱신 실패: {str(e)}")
+      
+      self._load_import_batches()
+      self.data_changed.emit()
+      
+      InfoBar.success(
+        title="되돌리기 완료",
+        content=f"총 {deleted_count}건의 카드사용내역이 삭제되었습니다.",
+        orient=Qt.Horizontal,
+        isClosable=True,
+        position=InfoBarPosition.TOP,
+        duration=2000,
+        parent=self
+      )
     except Exception as e:
       InfoBar.error(
-        title="등록 오류",
-        content=f"데이터 등록 중 오류가 발생했습니다: {str(e)}",
+        title="되돌리기 오류",
+        content=f"가져오기를 되돌리는 중 오류가 발생했습니다: {str(e)}",
         orient=Qt.Horizontal,
         isClosable=True,
         position=InfoBarPosition.TOP,
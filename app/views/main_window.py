@@ -4,8 +4,8 @@
 PySide6-Fluent-Widgets를 사용하여 Fluent Design 스타일의 메인 윈도우를 구현합니다.
 """
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
+from PySide6.QtCore import Qt, QTimer, QEvent
+from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel
 from qfluentwidgets import (
     FluentWindow, 
     NavigationItemPosition,
@@ -21,6 +21,19 @@ from app.views.card_view import CardInterface
 from app.views.common_code_view import CommonCodeInterface
 from app.views.vendor_view import VendorInterface
 from app.views.card_transaction_view import CardTransactionInterface
+from app.services.maintenance_service import MaintenanceService
+
+
+# 사용자 입력/가져오기 작업이 이 시간 동안 없으면 데이터베이스 유지보수(증분 VACUUM) 실행 (밀리초)
+MAINTENANCE_IDLE_MS = 2 * 60 * 1000
+
+# 유휴 타이머를 다시 시작하는 사용자 입력 이벤트
+_USER_INPUT_EVENTS = frozenset({
+    QEvent.Type.KeyPress,
+    QEvent.Type.MouseButtonPress,
+    QEvent.Type.MouseButtonDblClick,
+    QEvent.Type.Wheel,
+})
 
 
 class MainWindow(FluentWindow):
@@ -46,6 +59,16 @@ class MainWindow(FluentWindow):
         
         # 윈도우 중앙에 배치
         self.center_window()
+        
+        # 데이터베이스 유지보수 유휴 타이머
+        # 사용자 입력이 있을 때마다 다시 시작하므로 마지막 입력 후 MAINTENANCE_IDLE_MS가 지나야 실행됨
+        self.maintenance_service = MaintenanceService()
+        self.maintenance_timer = QTimer(self)
+        self.maintenance_timer.setSingleShot(True)
+        self.maintenance_timer.setInterval(MAINTENANCE_IDLE_MS)
+        self.maintenance_timer.timeout.connect(self._on_maintenance_timer)
+        self.maintenance_timer.start()
+        QApplication.instance().installEventFilter(self)
     
     def _init_navigation(self) -> None:
         """
@@ -141,6 +164,54 @@ class MainWindow(FluentWindow):
         """
         self.stackedWidget.setCurrentWidget(self.home_interface)
     
+    def eventFilter(self, watched, event) -> bool:
+        """
+        애플리케이션 이벤트 필터
+        
+        사용자 입력이 있으면 유지보수 유휴 타이머를 다시 시작합니다. 이벤트는 가로채지 않습니다.
+        
+        Args:
+            watched: 이벤트 대상 객체
+            event: 이벤트
+        
+        Returns:
+            False (이벤트를 계속 전달)
+        """
+        if event.type() in _USER_INPUT_EVENTS:
+            self.maintenance_timer.start()
+        return super().eventFilter(watched, event)
+    
+    def _on_maintenance_timer(self) -> None:
+        """
+        유지보수 유휴 타이머 이벤트 처리
+        
+        삭제로 생긴 빈 페이지를 조금씩 파일 시스템에 반환합니다.
+        백그라운드 가져오기가 진행 중이면 실행하지 않고 다시 유휴 시간을 기다립니다.
+        실행 후에는 다음 사용자 입력이 타이머를 다시 시작할 때까지 기다립니다.
+        """
+        if self.card_transaction_interface.is_importing():
+            self.maintenance_timer.start()
+            return
+        
+        try:
+            self.maintenance_service.incremental_vacuum()
+        except Exception as e:
+            print(f"[DB 유지보수] 증분 VACUUM 실패: {e}")
+    
+    def closeEvent(self, event) -> None:
+        """
+        윈도우 종료 이벤트 처리
+        
+        종료 전에 PRAGMA optimize로 플래너 통계를 갱신합니다.
+        
+        Args:
+            event: 종료 이벤트
+        """
+        QApplication.instance().removeEventFilter(self)
+        self.maintenance_timer.stop()
+        self.maintenance_service.close()
+        super().closeEvent(event)
+    
     def center_window(self) -> None:
         """
         윈도우를 화면 중앙에 배치
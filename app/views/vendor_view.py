@@ -450,7 +450,7 @@ class VendorInterface(QWidget):
         search_params['vendor_name'] = vendor_name
       
       # 검색 실행
-      results = self.vendor_service.search_vendors(**search_params)
+      results = self.vendor_service.search_vendor_rows(**search_params)
       
       # 테이블 모델에 데이터 설정
       self.vendor_model.set_data(results)
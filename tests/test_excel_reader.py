@@ -0,0 +1,61 @@
+"""
+엑셀 파일 읽기 유틸리티 테스트
+"""
+
+from datetime import datetime
+import openpyxl
+import pytest
+from app.utils.excel_reader import (
+    read_card_transaction_excel,
+    detect_header_row,
+    _clean_business_number,
+    _clean_text
+)
+
+
+# 데이터 행 수
+DATA_ROWS = 301
+
+
+@pytest.fixture
+def statement_with_total_row(tmp_path):
+    """안내 행 + 헤더 + 데이터 행 + 합계 행(사업자번호/승인번호 빈 셀)으로 된 카드사 엑셀 파일"""
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.append(['카드 이용내역'])
+    worksheet.append(['조회기간: 2025-01-01 ~ 2025-01-31'])
+    worksheet.append(['이용일', '카드번호', '구분', '이용금액', '가맹점명', '사업자번호', '승인번호'])
+    for i in range(DATA_ROWS):
+        worksheet.append([
+            datetime(2025, 1, 1 + i % 28), '1234-****-****-0001', '정상', 1000 + i,
+            f'가맹점{i % 4}', 1234567890 + i % 4, 100000 + i
+        ])
+    worksheet.append(['합계', None, None, sum(1000 + i for i in range(DATA_ROWS)), None, None, None])
+    
+    file_path = tmp_path / 'statement.xlsx'
+    workbook.save(file_path)
+    return str(file_path)
+
+
+def test_total_row_does_not_change_identifier_columns(statement_with_total_row):
+    """합계 행의 빈 셀이 사업자번호/승인번호를 float로 바꾸지 않음"""
+    assert detect_header_row(statement_with_total_row) == 2
+    
+    transactions = read_card_transaction_excel(statement_with_total_row, card_company_id=1)
+    
+    assert len(transactions) == DATA_ROWS
+    assert transactions[0]['business_number'] == '1234567890'
+    assert transactions[0]['approval_number'] == '100000'
+    assert transactions[-1]['business_number'] == '1234567890'
+    assert transactions[-1]['approval_number'] == f'{100000 + DATA_ROWS - 1}'
+    assert transactions[-1]['amount'] == 1000 + DATA_ROWS - 1
+    assert all(transaction['vendor_name'].startswith('가맹점') for transaction in transactions)
+
+
+def test_whole_float_identifiers_are_accepted():
+    """float로 읽힌 번호도 소수점 없이 정리"""
+    assert _clean_business_number(1234567890.0) == '1234567890'
+    assert _clean_business_number('123-45-67890') == '1234567890'
+    assert _clean_business_number(float('nan')) is None
+    assert _clean_text(100000.0) == '100000'
+    assert _clean_text(None) == ''